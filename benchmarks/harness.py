@@ -0,0 +1,96 @@
+# Copyright AGNTCY Contributors (https://github.com/agntcy)
+# SPDX-License-Identifier: Apache-2.0
+
+"""Timing and memory measurement of benchmark scenarios."""
+
+import math
+import time
+import tracemalloc
+from collections.abc import Awaitable, Callable
+from dataclasses import asdict, dataclass, field
+from typing import Any
+
+
+@dataclass
+class BenchmarkResult:
+    """Measurements of one benchmark scenario."""
+
+    name: str
+    iterations: int
+    requests_per_second: float
+    p50_ms: float
+    p99_ms: float
+    peak_bytes_per_call: float
+    """Mean peak of traced memory above the baseline during one call."""
+    params: dict[str, Any] = field(default_factory=dict)
+
+    def to_dict(self) -> dict[str, Any]:
+        return asdict(self)
+
+
+def percentile(samples: list[float], q: float) -> float:
+    """Returns the ``q`` percentile (0-100) of ``samples``, nearest rank."""
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    rank = max(math.ceil(q / 100 * len(ordered)), 1)
+    return ordered[rank - 1]
+
+
+async def measure(
+    name: str,
+    call: Callable[[], Awaitable[object]],
+    iterations: int,
+    warmup: int = 10,
+    trace_iterations: int | None = None,
+    params: dict[str, Any] | None = None,
+) -> BenchmarkResult:
+    """Runs ``call`` repeatedly and records its throughput and latency.
+
+    Latencies are measured without tracing. The peak memory of a call is
+    measured in a separate pass under tracemalloc, which slows every call
+    down.
+
+    Args:
+        name: The name of the scenario.
+        call: Performs one request of the scenario.
+        iterations: The number of timed calls.
+        warmup: The number of untimed calls made first.
+        trace_iterations: The number of traced calls. Defaults to a tenth of
+                          ``iterations``.
+        params: The parameters of the scenario, reported with the result.
+    """
+    for _ in range(warmup):
+        await call()
+
+    latencies = []
+    started = time.perf_counter()
+    for _ in range(iterations):
+        call_started = time.perf_counter()
+        await call()
+        latencies.append(time.perf_counter() - call_started)
+    elapsed = time.perf_counter() - started
+
+    if trace_iterations is None:
+        trace_iterations = max(iterations // 10, 1)
+    peak_bytes = 0
+    tracemalloc.start()
+    try:
+        for _ in range(trace_iterations):
+            baseline, _ = tracemalloc.get_traced_memory()
+            tracemalloc.reset_peak()
+            await call()
+            _, peak = tracemalloc.get_traced_memory()
+            peak_bytes += peak - baseline
+    finally:
+        tracemalloc.stop()
+
+    return BenchmarkResult(
+        name=name,
+        iterations=iterations,
+        requests_per_second=iterations / elapsed if elapsed else 0.0,
+        p50_ms=percentile(latencies, 50) * 1000,
+        p99_ms=percentile(latencies, 99) * 1000,
+        peak_bytes_per_call=peak_bytes / trace_iterations,
+        params=params or {},
+    )
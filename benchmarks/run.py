@@ -0,0 +1,120 @@
+# Copyright AGNTCY Contributors (https://github.com/agntcy)
+# SPDX-License-Identifier: Apache-2.0
+
+"""Runs the benchmark scenarios and writes their results as JSON.
+
+Usage:
+    python -m benchmarks.run --iterations 1000 --output bench.json
+    python -m benchmarks.run --scenario get_task --size 1000
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import platform
+import sys
+from datetime import datetime, timezone
+from importlib.metadata import PackageNotFoundError, version
+from pathlib import Path
+from typing import Any
+
+from benchmarks.harness import BenchmarkResult
+from benchmarks.scenarios import SCENARIOS
+
+
+def _package_version(name: str) -> str | None:
+    try:
+        return version(name)
+    except PackageNotFoundError:
+        return None
+
+
+async def run(
+    scenarios: list[str],
+    iterations: int,
+    size: int | None = None,
+) -> list[BenchmarkResult]:
+    results = []
+    for name in scenarios:
+        scenario, default_size = SCENARIOS[name]
+        result = await scenario(iterations, default_size if size is None else size)
+        print(
+            f"{result.name}: {result.requests_per_second:.0f} req/s, "
+            f"p50 {result.p50_ms:.3f} ms, p99 {result.p99_ms:.3f} ms, "
+            f"{result.peak_bytes_per_call:.0f} B peak/call",
+            file=sys.stderr,
+        )
+        results.append(result)
+    return results
+
+
+def report(results: list[BenchmarkResult]) -> dict[str, Any]:
+    return {
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "versions": {
+            name: _package_version(name)
+            for name in ("slima2a", "a2a-sdk", "slim-bindings", "protobuf")
+        },
+        "results": [result.to_dict() for result in results],
+    }
+
+
+def main() -> None:
+    args = parse_arguments()
+
+    logging.basicConfig(level=args.log_level)
+
+    scenarios = args.scenario or list(SCENARIOS)
+    results = asyncio.run(run(scenarios, args.iterations, args.size))
+    output = json.dumps(report(results), indent=2)
+    if args.output:
+        Path(args.output).write_text(output + "\n")
+    else:
+        print(output)
+
+
+def parse_arguments() -> argparse.Namespace:
+    parser = argparse.ArgumentParser()
+
+    parser.add_argument(
+        "--log-level",
+        type=str,
+        required=False,
+        default="ERROR",
+    )
+    parser.add_argument(
+        "--scenario",
+        action="append",
+        choices=list(SCENARIOS),
+        required=False,
+        help="Scenario to run, may be repeated. Runs every scenario by default.",
+    )
+    parser.add_argument(
+        "--iterations",
+        type=int,
+        required=False,
+        default=500,
+    )
+    parser.add_argument(
+        "--size",
+        type=int,
+        required=False,
+        default=None,
+        help="Chunks, history length or members, depending on the scenario.",
+    )
+    parser.add_argument(
+        "--output",
+        type=str,
+        required=False,
+        default=None,
+        help="File the JSON results are written to. Defaults to stdout.",
+    )
+
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,301 @@
+# Copyright AGNTCY Contributors (https://github.com/agntcy)
+# SPDX-License-Identifier: Apache-2.0
+
+"""Benchmark scenarios running clients and handlers over the loopback."""
+
+import uuid
+from collections.abc import Callable, Coroutine
+from typing import Any
+
+from a2a.auth.user import UnauthenticatedUser
+from a2a.compat.v0_3 import conversions, proto_utils
+from a2a.server.agent_execution import AgentExecutor, RequestContext
+from a2a.server.context import ServerCallContext
+from a2a.server.events import EventQueue
+from a2a.server.request_handlers import DefaultRequestHandler
+from a2a.server.tasks import InMemoryTaskStore
+from a2a.server.tasks.task_updater import TaskUpdater
+from a2a.types import a2a_pb2
+
+from benchmarks.harness import BenchmarkResult, measure
+from slima2a.client_transport import ClientConfig, MulticastClient, SRPCTransport
+from slima2a.compat.v3_0 import proto_conversions
+from slima2a.compat.v3_0.client_transport import ClientConfig as CompatClientConfig
+from slima2a.compat.v3_0.client_transport import SRPCCompatTransport
+from slima2a.compat.v3_0.handler import (
+    SRPCCompatHandler,
+    add_SRPCCompatHandler_to_server,
+)
+from slima2a.handler import SRPCHandler, add_SRPCHandler_to_server
+from slima2a.loopback import (
+    LoopbackServer,
+    loopback_channel_factory,
+    loopback_group_channel_factory,
+)
+
+Scenario = Callable[[int, int], Coroutine[Any, Any, BenchmarkResult]]
+"""Runs a scenario for a number of iterations with a size parameter."""
+
+
+class ChunkingExecutor(AgentExecutor):
+    """Answers every message with ``chunks`` appended artifact updates."""
+
+    def __init__(self, chunks: int = 1, chunk_size: int = 64) -> None:
+        self.chunks = chunks
+        self.text = "x" * chunk_size
+
+    async def execute(self, context: RequestContext, event_queue: EventQueue) -> None:
+        assert context.task_id is not None
+        assert context.context_id is not None
+        updater = TaskUpdater(event_queue, context.task_id, context.context_id)
+        await updater.submit()
+        for i in range(self.chunks):
+            await updater.add_artifact(
+                [a2a_pb2.Part(text=self.text)],
+                artifact_id="result",
+                append=i > 0,
+                last_chunk=i == self.chunks - 1,
+            )
+        await updater.complete()
+
+    async def cancel(self, context: RequestContext, event_queue: EventQueue) -> None:
+        return None
+
+
+def agent_name(index: int = 0) -> str:
+    return f"agntcy/bench/agent{index}"
+
+
+def make_card(url: str) -> a2a_pb2.AgentCard:
+    return a2a_pb2.AgentCard(
+        name=url,
+        capabilities=a2a_pb2.AgentCapabilities(streaming=True),
+        supported_interfaces=[
+            a2a_pb2.AgentInterface(url=url, protocol_binding="slimrpc")
+        ],
+    )
+
+
+def make_request(text: str = "hello") -> a2a_pb2.SendMessageRequest:
+    return a2a_pb2.SendMessageRequest(
+        message=a2a_pb2.Message(
+            message_id=str(uuid.uuid4()),
+            role=a2a_pb2.ROLE_USER,
+            parts=[a2a_pb2.Part(text=text)],
+        )
+    )
+
+
+def make_servers(
+    count: int,
+    executor: AgentExecutor,
+    task_store: InMemoryTaskStore | None = None,
+) -> dict[str, LoopbackServer]:
+    """Creates ``count`` loopback servers hosting the v1 and v0.3 handlers."""
+    servers = {}
+    for index in range(count):
+        url = agent_name(index)
+        card = make_card(url)
+        request_handler = DefaultRequestHandler(
+            executor, task_store or InMemoryTaskStore()
+        )
+        server = LoopbackServer()
+        add_SRPCHandler_to_server(SRPCHandler(card, request_handler), server)  # type: ignore[arg-type]
+        add_SRPCCompatHandler_to_server(
+            SRPCCompatHandler(card, request_handler),
+            server,  # type: ignore[arg-type]
+        )
+        servers[url] = server
+    return servers
+
+
+def make_transport(servers: dict[str, LoopbackServer]) -> SRPCTransport:
+    config = ClientConfig(slimrpc_channel_factory=loopback_channel_factory(servers))
+    url = agent_name()
+    transport = SRPCTransport.create(make_card(url), url, config)
+    assert isinstance(transport, SRPCTransport)
+    return transport
+
+
+def make_compat_transport(
+    servers: dict[str, LoopbackServer],
+) -> SRPCCompatTransport:
+    config = CompatClientConfig(
+        slimrpc_channel_factory=loopback_channel_factory(servers)
+    )
+    url = agent_name()
+    return SRPCCompatTransport.create(make_card(url), url, config)
+
+
+async def send_message(iterations: int, size: int) -> BenchmarkResult:
+    """SendMessage with an answer of one artifact of ``size`` bytes."""
+    transport = make_transport(make_servers(1, ChunkingExecutor(1, size)))
+
+    async def call() -> None:
+        await transport.send_message(make_request())
+
+    return await measure("send_message", call, iterations, params={"chunk_size": size})
+
+
+async def send_message_streaming(iterations: int, size: int) -> BenchmarkResult:
+    """SendStreamingMessage with an answer of ``size`` artifact chunks."""
+    transport = make_transport(make_servers(1, ChunkingExecutor(size)))
+
+    async def call() -> None:
+        async for _ in transport.send_message_streaming(make_request()):
+            pass
+
+    return await measure(
+        "send_message_streaming", call, iterations, params={"chunks": size}
+    )
+
+
+def make_task(history: int) -> a2a_pb2.Task:
+    return a2a_pb2.Task(
+        id=str(uuid.uuid4()),
+        context_id=str(uuid.uuid4()),
+        status=a2a_pb2.TaskStatus(state=a2a_pb2.TASK_STATE_COMPLETED),
+        history=[
+            a2a_pb2.Message(
+                message_id=str(i),
+                role=a2a_pb2.ROLE_USER if i % 2 else a2a_pb2.ROLE_AGENT,
+                parts=[a2a_pb2.Part(text=f"message {i}")],
+            )
+            for i in range(history)
+        ],
+    )
+
+
+async def _store_task(task_store: InMemoryTaskStore, history: int) -> str:
+    task = make_task(history)
+    await task_store.save(task, ServerCallContext(user=UnauthenticatedUser()))
+    return task.id
+
+
+async def get_task(iterations: int, size: int) -> BenchmarkResult:
+    """GetTask of a task with ``size`` messages of history."""
+    task_store = InMemoryTaskStore()
+    transport = make_transport(make_servers(1, ChunkingExecutor(), task_store))
+    request = a2a_pb2.GetTaskRequest(id=await _store_task(task_store, size))
+
+    async def call() -> None:
+        await transport.get_task(request)
+
+    return await measure("get_task", call, iterations, params={"history": size})
+
+
+async def multicast_send_message(iterations: int, size: int) -> BenchmarkResult:
+    """Multicast SendMessage fanned out to ``size`` members."""
+    servers = make_servers(size, ChunkingExecutor())
+    config = ClientConfig(
+        slimrpc_group_channel_factory=loopback_group_channel_factory(servers)
+    )
+    client = MulticastClient.create(list(servers), config)
+
+    async def call() -> None:
+        async for _ in client.send_message(make_request()):
+            pass
+
+    return await measure(
+        "multicast_send_message", call, iterations, params={"members": size}
+    )
+
+
+async def compat_send_message(iterations: int, size: int) -> BenchmarkResult:
+    """v0.3 SendMessage through SRPCCompatTransport and SRPCCompatHandler."""
+    transport = make_compat_transport(make_servers(1, ChunkingExecutor(1, size)))
+
+    async def call() -> None:
+        await transport.send_message(make_request())
+
+    return await measure(
+        "compat_send_message", call, iterations, params={"chunk_size": size}
+    )
+
+
+async def compat_get_task(iterations: int, size: int) -> BenchmarkResult:
+    """v0.3 GetTask of a task with ``size`` messages of history."""
+    task_store = InMemoryTaskStore()
+    transport = make_compat_transport(make_servers(1, ChunkingExecutor(), task_store))
+    request = a2a_pb2.GetTaskRequest(id=await _store_task(task_store, size))
+
+    async def call() -> None:
+        await transport.get_task(request)
+
+    return await measure("compat_get_task", call, iterations, params={"history": size})
+
+
+async def compat_convert_sdk(iterations: int, size: int) -> BenchmarkResult:
+    """v0.3 <-> v1.0 Task round trip through the SDK's pydantic models."""
+    task = make_task(size)
+
+    async def call() -> None:
+        compat = proto_utils.ToProto.task(conversions.to_compat_task(task))
+        conversions.to_core_task(proto_utils.FromProto.task(compat))
+
+    return await measure(
+        "compat_convert_sdk", call, iterations, params={"history": size}
+    )
+
+
+async def compat_convert_direct(iterations: int, size: int) -> BenchmarkResult:
+    """v0.3 <-> v1.0 Task round trip through slima2a's proto_conversions."""
+    task = make_task(size)
+
+    async def call() -> None:
+        compat = proto_conversions.to_compat_task(task)
+        proto_conversions.to_core_task(compat)
+
+    return await measure(
+        "compat_convert_direct", call, iterations, params={"history": size}
+    )
+
+
+def _send_message_payload(history: int) -> bytes:
+    return a2a_pb2.SendMessageResponse(task=make_task(history)).SerializeToString()
+
+
+async def multicast_wrap_copy(iterations: int, size: int) -> BenchmarkResult:
+    """Multicast SendMessage answer parsed, then copied into a StreamResponse."""
+    payload = _send_message_payload(size)
+
+    async def call() -> None:
+        response = a2a_pb2.SendMessageResponse.FromString(payload)
+        a2a_pb2.StreamResponse().task.CopyFrom(response.task)
+
+    return await measure(
+        "multicast_wrap_copy",
+        call,
+        iterations,
+        params={"history": size, "payload_bytes": len(payload)},
+    )
+
+
+async def multicast_wrap_direct(iterations: int, size: int) -> BenchmarkResult:
+    """Multicast SendMessage answer parsed straight into a StreamResponse."""
+    payload = _send_message_payload(size)
+
+    async def call() -> None:
+        a2a_pb2.StreamResponse.FromString(payload)
+
+    return await measure(
+        "multicast_wrap_direct",
+        call,
+        iterations,
+        params={"history": size, "payload_bytes": len(payload)},
+    )
+
+
+SCENARIOS: dict[str, tuple[Scenario, int]] = {
+    "send_message": (send_message, 64),
+    "send_message_streaming": (send_message_streaming, 16),
+    "get_task": (get_task, 100),
+    "multicast_send_message": (multicast_send_message, 4),
+    "compat_send_message": (compat_send_message, 64),
+    "compat_get_task": (compat_get_task, 100),
+    "compat_convert_sdk": (compat_convert_sdk, 100),
+    "compat_convert_direct": (compat_convert_direct, 100),
+    "multicast_wrap_copy": (multicast_wrap_copy, 100),
+    "multicast_wrap_direct": (multicast_wrap_direct, 100),
+}
+"""Benchmark scenarios with their default size parameter."""
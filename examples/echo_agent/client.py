@@ -26,6 +26,7 @@ from slima2a.client_transport import (
     slimrpc_channel_factory,
     slimrpc_group_channel_factory,
 )
+from slima2a.fan_out import FanOutClient
 
 BASE_URL = "http://localhost:9999"
 
@@ -97,7 +98,7 @@ async def main() -> None:
 
     client = client_factory.create(card=cards)
 
-    if isinstance(client, MulticastClient):
+    if isinstance(client, MulticastClient | FanOutClient):
         print(f"> {args.text} (multicast to {agent_names})")
         await send_message_multicast(client, args.text)
     else:
@@ -195,7 +196,7 @@ async def send_message(
 
 
 async def send_message_multicast(
-    client: MulticastClient,
+    client: MulticastClient | FanOutClient,
     text: str,
 ) -> None:
     message = create_text_message_object(content=text)
@@ -70,22 +70,19 @@ async def main() -> None:
             )
 
             if args.a2a_version in ("v0", "both"):
-                from slima2a.compat.v3_0.handler import SRPCCompatHandler
-                from slima2a.types.v0.a2a_pb2_slimrpc import (
-                    add_A2AServiceServicer_to_server as add_v0,
+                from slima2a.compat.v3_0.handler import (
+                    SRPCCompatHandler,
+                    add_SRPCCompatHandler_to_server,
                 )
 
                 compat_handler = SRPCCompatHandler(agent_card, default_request_handler)
-                add_v0(compat_handler, server)
+                add_SRPCCompatHandler_to_server(compat_handler, server)
 
             if args.a2a_version in ("v1", "both"):
-                from slima2a.handler import SRPCHandler
-                from slima2a.types.v1.a2a_pb2_slimrpc import (
-                    add_A2AServiceServicer_to_server as add_v1,
-                )
+                from slima2a.handler import SRPCHandler, add_SRPCHandler_to_server
 
                 handler = SRPCHandler(agent_card, default_request_handler)
-                add_v1(handler, server)
+                add_SRPCHandler_to_server(handler, server)
 
             # Run server
             await server.serve_async()
@@ -63,13 +63,10 @@ async def main() -> None:
     server = slim_bindings.Server.new_with_connection(local_app, local_name, conn_id)
 
     # Register v1.0 handler by default; add --a2a-version support if needed
-    from slima2a.handler import SRPCHandler
-    from slima2a.types.v1.a2a_pb2_slimrpc import (
-        add_A2AServiceServicer_to_server as add_v1,
-    )
+    from slima2a.handler import SRPCHandler, add_SRPCHandler_to_server
 
     handler = SRPCHandler(agent_card, request_handler)
-    add_v1(handler, server)
+    add_SRPCHandler_to_server(handler, server)
 
     # Run server
     await server.serve_async()
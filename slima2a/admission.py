@@ -0,0 +1,167 @@
+# Copyright AGNTCY Contributors (https://github.com/agntcy)
+# SPDX-License-Identifier: Apache-2.0
+
+"""Concurrency limits and admission control for slimrpc handlers."""
+
+import asyncio
+from collections import defaultdict, deque
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+
+import slim_bindings
+from google.rpc import code_pb2
+
+SlimRPCError = slim_bindings.RpcError.Rpc  # type: ignore[attr-defined]
+
+
+@dataclass
+class AdmissionStats:
+    """Counters describing the behaviour of an AdmissionController."""
+
+    in_flight: int = 0
+    queue_depth: int = 0
+    max_queue_depth: int = 0
+    admitted: int = 0
+    queued: int = 0
+    rejected: int = 0
+    rejected_by_method: dict[str, int] = field(default_factory=dict)
+
+
+class AdmissionController:
+    """Limits the number of in-flight requests served by a handler.
+
+    A request is admitted when both the global limit and the limit for its
+    method have room. Otherwise it waits in a bounded queue; once the queue
+    is full, or the request waited longer than ``queue_timeout``, it is
+    rejected with ``RESOURCE_EXHAUSTED``. A freed slot is handed directly to
+    the oldest queued request that can use it, so a newly arriving request
+    cannot take it first. Queued requests whose method is at its limit do
+    not hold back requests of other methods, which may be admitted ahead of
+    them.
+
+    Example:
+        >>> admission = AdmissionController(
+        ...     max_in_flight=64,
+        ...     method_limits={"SendStreamingMessage": 8},
+        ...     max_queue=32,
+        ... )
+        >>> handler = SRPCHandler(agent_card, request_handler, admission_controller=admission)
+    """
+
+    def __init__(
+        self,
+        max_in_flight: int | None = None,
+        method_limits: dict[str, int] | None = None,
+        max_queue: int = 0,
+        queue_timeout: float | None = None,
+    ) -> None:
+        """Initializes the AdmissionController.
+
+        Args:
+            max_in_flight: Maximum number of requests served at once across all
+                           methods. None means unlimited.
+            method_limits: Maximum number of in-flight requests per method
+                           name (e.g. "SendStreamingMessage").
+            max_queue: Maximum number of requests waiting for a slot. Requests
+                       beyond it are rejected immediately.
+            queue_timeout: Seconds a request may wait for a slot before it is
+                           rejected. None waits until a slot frees up.
+        """
+        self.max_in_flight = max_in_flight
+        self.method_limits = dict(method_limits or {})
+        self.max_queue = max_queue
+        self.queue_timeout = queue_timeout
+        self.stats = AdmissionStats()
+        self._method_in_flight: defaultdict[str, int] = defaultdict(int)
+        self._waiters: deque[tuple[str, asyncio.Future[None]]] = deque()
+
+    @asynccontextmanager
+    async def admit(self, method: str) -> AsyncIterator[None]:
+        """Holds a slot for ``method`` for the duration of the block."""
+        await self.acquire(method)
+        try:
+            yield
+        finally:
+            self.release(method)
+
+    async def acquire(self, method: str) -> None:
+        """Waits for a slot for ``method``, or raises RESOURCE_EXHAUSTED."""
+        if self._can_run(method):
+            self._start(method)
+            return
+        if len(self._waiters) >= self.max_queue:
+            raise self._reject(method, "too many pending requests")
+
+        waiter: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        entry = (method, waiter)
+        self._waiters.append(entry)
+        self.stats.queued += 1
+        self._update_queue_depth()
+        try:
+            await asyncio.wait_for(waiter, self.queue_timeout)
+        except asyncio.TimeoutError:
+            self._abandon(entry)
+            raise self._reject(method, "timed out waiting for a slot") from None
+        except BaseException:
+            self._abandon(entry)
+            raise
+
+    def release(self, method: str) -> None:
+        """Frees the slot held for ``method`` and wakes queued requests."""
+        self.stats.in_flight -= 1
+        self._method_in_flight[method] -= 1
+        self._wake_waiters()
+
+    def _can_run(self, method: str) -> bool:
+        if (
+            self.max_in_flight is not None
+            and self.stats.in_flight >= self.max_in_flight
+        ):
+            return False
+        limit = self.method_limits.get(method)
+        return limit is None or self._method_in_flight[method] < limit
+
+    def _start(self, method: str) -> None:
+        self.stats.in_flight += 1
+        self.stats.admitted += 1
+        self._method_in_flight[method] += 1
+
+    def _wake_waiters(self) -> None:
+        for entry in list(self._waiters):
+            method, waiter = entry
+            if waiter.done():
+                self._waiters.remove(entry)
+                continue
+            if self._can_run(method):
+                self._waiters.remove(entry)
+                self._start(method)
+                waiter.set_result(None)
+        self._update_queue_depth()
+
+    def _abandon(self, entry: tuple[str, asyncio.Future[None]]) -> None:
+        method, waiter = entry
+        if waiter.done() and not waiter.cancelled():
+            # The slot was handed over just before the waiter gave up.
+            self.release(method)
+            return
+        if entry in self._waiters:
+            self._waiters.remove(entry)
+        self._update_queue_depth()
+
+    def _update_queue_depth(self) -> None:
+        self.stats.queue_depth = len(self._waiters)
+        self.stats.max_queue_depth = max(
+            self.stats.max_queue_depth, self.stats.queue_depth
+        )
+
+    def _reject(self, method: str, reason: str) -> Exception:
+        self.stats.rejected += 1
+        self.stats.rejected_by_method[method] = (
+            self.stats.rejected_by_method.get(method, 0) + 1
+        )
+        return SlimRPCError(
+            code=code_pb2.RESOURCE_EXHAUSTED,
+            message=f"ResourceExhausted: {method} rejected, {reason}",
+            details=None,
+        )
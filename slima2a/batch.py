@@ -0,0 +1,193 @@
+# Copyright AGNTCY Contributors (https://github.com/agntcy)
+# SPDX-License-Identifier: Apache-2.0
+
+"""Batching of many small SendMessage calls into one round trip."""
+
+import asyncio
+import struct
+from collections.abc import Awaitable, Callable, Hashable
+from dataclasses import dataclass
+from typing import Generic, TypeVar
+
+import slim_bindings
+from a2a.types.a2a_pb2 import SendMessageResponse
+from google.rpc import code_pb2, status_pb2
+
+SlimRPCError = slim_bindings.RpcError.Rpc  # type: ignore[attr-defined]
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+BATCH_SERVICE = "slima2a.v1.Batch"
+SEND_MESSAGES_METHOD = "SendMessages"
+
+MAX_BATCH_SIZE = 1000
+"""Maximum number of messages in one SendMessages call."""
+
+_FRAME_HEADER = struct.Struct(">I")
+
+
+def encode_frames(frames: list[bytes]) -> bytes:
+    """Joins serialized messages, each prefixed by its 4-byte big-endian length."""
+    return b"".join(_FRAME_HEADER.pack(len(frame)) + frame for frame in frames)
+
+
+def decode_frames(data: bytes) -> list[bytes]:
+    """Splits bytes joined by encode_frames.
+
+    Raises:
+        ValueError: If ``data`` is truncated.
+    """
+    frames = []
+    offset = 0
+    while offset < len(data):
+        if offset + _FRAME_HEADER.size > len(data):
+            raise ValueError("truncated frame header")
+        (size,) = _FRAME_HEADER.unpack_from(data, offset)
+        offset += _FRAME_HEADER.size
+        if offset + size > len(data):
+            raise ValueError("truncated frame")
+        frames.append(data[offset : offset + size])
+        offset += size
+    return frames
+
+
+def response_status(response: SendMessageResponse) -> status_pb2.Status:
+    """Returns the OK status carrying ``response``."""
+    status = status_pb2.Status(code=code_pb2.OK)
+    status.details.add().Pack(response)
+    return status
+
+
+def error_status(error: Exception) -> status_pb2.Status:
+    """Returns the status describing ``error``."""
+    if isinstance(error, slim_bindings.RpcError):
+        code = getattr(error, "code", code_pb2.UNKNOWN)
+        return status_pb2.Status(
+            code=getattr(code, "value", code), message=getattr(error, "message", "")
+        )
+    return status_pb2.Status(code=code_pb2.INTERNAL, message=str(error))
+
+
+def read_status(status: status_pb2.Status) -> SendMessageResponse | Exception:
+    """Returns the response carried by ``status``, or its error."""
+    if status.code != code_pb2.OK:
+        return SlimRPCError(code=status.code, message=status.message, details=None)
+    response = SendMessageResponse()
+    if not status.details or not status.details[0].Unpack(response):
+        return SlimRPCError(
+            code=code_pb2.INTERNAL, message="Malformed batch result", details=None
+        )
+    return response
+
+
+@dataclass
+class MessageBatcherStats:
+    """Counters describing the behaviour of a MessageBatcher."""
+
+    batches: int = 0
+    messages: int = 0
+    full_batches: int = 0
+    """Batches sent because they reached max_batch_size."""
+
+
+class _PendingBatch(Generic[T, R]):
+    def __init__(
+        self, send: Callable[[list[T]], Awaitable[list[R | Exception]]]
+    ) -> None:
+        self.send = send
+        self.items: list[tuple[T, asyncio.Future[R]]] = []
+        self.timer: asyncio.TimerHandle | None = None
+
+
+class MessageBatcher:
+    """Gathers calls made within a short window into batches.
+
+    The first call of a key opens a batch that is sent ``window`` seconds
+    later, or as soon as it holds ``max_batch_size`` calls. Each caller gets
+    its own result or error. Calls only share a batch when their key, e.g.
+    the transport, timeout and metadata, is the same.
+
+    Example:
+        >>> client_config = ClientConfig(
+        ...     slimrpc_channel_factory=slimrpc_channel_factory(app, conn_id),
+        ...     slimrpc_message_batcher=MessageBatcher(window=0.002),
+        ... )
+    """
+
+    def __init__(self, window: float = 0.002, max_batch_size: int = 64) -> None:
+        """Initializes the MessageBatcher.
+
+        Args:
+            window: Seconds a batch waits for more calls once opened.
+            max_batch_size: Maximum number of calls in a batch.
+        """
+        if window < 0:
+            raise ValueError("window must not be negative")
+        if not 1 <= max_batch_size <= MAX_BATCH_SIZE:
+            raise ValueError(f"max_batch_size must be between 1 and {MAX_BATCH_SIZE}")
+        self.window = window
+        self.max_batch_size = max_batch_size
+        self.stats = MessageBatcherStats()
+        self._pending: dict[Hashable, _PendingBatch] = {}
+        self._sending: set[asyncio.Task[None]] = set()
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    async def submit(
+        self,
+        key: Hashable,
+        item: T,
+        send: Callable[[list[T]], Awaitable[list[R | Exception]]],
+    ) -> R:
+        """Adds ``item`` to the open batch of ``key`` and returns its result.
+
+        Args:
+            key: Identifies the calls that may share a batch.
+            item: The request of this call.
+            send: Sends a batch, returning one result or error per item. Only
+                  the function of the call opening the batch is used.
+        """
+        loop = asyncio.get_running_loop()
+        batch = self._pending.get(key)
+        if batch is None:
+            batch = self._pending[key] = _PendingBatch(send)
+            batch.timer = loop.call_later(self.window, self._flush, key, batch)
+        future: asyncio.Future[R] = loop.create_future()
+        batch.items.append((item, future))
+        if len(batch.items) >= self.max_batch_size:
+            self.stats.full_batches += 1
+            self._flush(key, batch)
+        return await future
+
+    def _flush(self, key: Hashable, batch: _PendingBatch) -> None:
+        if self._pending.get(key) is not batch:
+            return
+        del self._pending[key]
+        if batch.timer is not None:
+            batch.timer.cancel()
+        task = asyncio.get_running_loop().create_task(self._send(batch))
+        self._sending.add(task)
+        task.add_done_callback(self._sending.discard)
+
+    async def _send(self, batch: _PendingBatch) -> None:
+        self.stats.batches += 1
+        self.stats.messages += len(batch.items)
+        try:
+            results = await batch.send([item for item, _ in batch.items])
+            if len(results) != len(batch.items):
+                raise SlimRPCError(
+                    code=code_pb2.INTERNAL,
+                    message=f"Batch of {len(batch.items)} returned {len(results)} results",
+                    details=None,
+                )
+        except Exception as e:
+            results = [e] * len(batch.items)
+        for (_, future), result in zip(batch.items, results, strict=True):
+            if future.done():
+                continue
+            if isinstance(result, Exception):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
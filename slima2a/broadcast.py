@@ -0,0 +1,182 @@
+# Copyright AGNTCY Contributors (https://github.com/agntcy)
+# SPDX-License-Identifier: Apache-2.0
+
+"""Fan-out of one serialized event stream to many subscribers."""
+
+import asyncio
+import contextlib
+from collections.abc import AsyncGenerator, Awaitable, Callable, Hashable
+from dataclasses import dataclass
+
+import slim_bindings
+from google.rpc import code_pb2
+
+SlimRPCError = slim_bindings.RpcError.Rpc  # type: ignore[attr-defined]
+
+
+@dataclass
+class SubscriptionHubStats:
+    """Counters describing the behaviour of a SubscriptionHub."""
+
+    streams: int = 0
+    """Upstream event streams opened."""
+    subscribers: int = 0
+    joined: int = 0
+    """Subscribers attached to a stream opened for another subscriber."""
+    events: int = 0
+    """Events received from upstream, each serialized once."""
+    deliveries: int = 0
+    lagged: int = 0
+    """Subscribers disconnected because their queue was full."""
+
+
+class _Subscriber:
+    def __init__(self, max_queue: int) -> None:
+        # None entries only wake the subscriber up to look at its flags.
+        self.queue: asyncio.Queue[bytes | None] = asyncio.Queue(max_queue)
+        self.lagged = False
+        self.closed = False
+        self.error: BaseException | None = None
+
+    def wake(self) -> None:
+        with contextlib.suppress(asyncio.QueueFull):
+            self.queue.put_nowait(None)
+
+
+class _Broadcast:
+    def __init__(self) -> None:
+        self.subscribers: set[_Subscriber] = set()
+        self.task: asyncio.Task[None] | None = None
+        self.started = False
+
+
+class SubscriptionHub:
+    """Shares one upstream event stream per key among its subscribers.
+
+    The first subscriber of a key opens the upstream stream, whose events
+    are serialized once and handed as the same bytes to every subscriber.
+    Subscribers joining once events have flowed first receive a snapshot,
+    then the events that follow.
+    Each subscriber has a queue of ``max_queue`` events; a subscriber
+    falling that far behind is disconnected with ``RESOURCE_EXHAUSTED`` so
+    it does not hold the others back. The upstream stream is closed once its
+    last subscriber leaves.
+
+    Example:
+        >>> handler = SRPCHandler(
+        ...     agent_card, request_handler, subscription_hub=SubscriptionHub()
+        ... )
+    """
+
+    def __init__(self, max_queue: int = 256) -> None:
+        """Initializes the SubscriptionHub.
+
+        Args:
+            max_queue: Maximum number of events buffered per subscriber.
+        """
+        if max_queue < 1:
+            raise ValueError("max_queue must be at least 1")
+        self.max_queue = max_queue
+        self.stats = SubscriptionHubStats()
+        self._broadcasts: dict[Hashable, _Broadcast] = {}
+
+    def __len__(self) -> int:
+        return len(self._broadcasts)
+
+    async def subscribe(
+        self,
+        key: Hashable,
+        open_stream: Callable[[], AsyncGenerator[bytes, None]],
+        snapshot: Callable[[], Awaitable[bytes]],
+    ) -> AsyncGenerator[bytes, None]:
+        """Yields the serialized events of the stream ``key``.
+
+        Args:
+            key: Identifies the stream, e.g. the caller, tenant and task id.
+            open_stream: Opens the upstream stream when no subscriber of
+                         ``key`` has yet.
+            snapshot: Returns the first event of a subscriber joining a
+                      stream that already sent events, e.g. the current task.
+        """
+        subscriber = _Subscriber(self.max_queue)
+        self.stats.subscribers += 1
+        broadcast = self._broadcasts.get(key)
+        if broadcast is None:
+            broadcast = _Broadcast()
+            broadcast.subscribers.add(subscriber)
+            self._broadcasts[key] = broadcast
+            self.stats.streams += 1
+            broadcast.task = asyncio.create_task(
+                self._produce(key, broadcast, open_stream())
+            )
+        else:
+            broadcast.subscribers.add(subscriber)
+            self.stats.joined += 1
+        if broadcast.started:
+            try:
+                yield await snapshot()
+            except BaseException:
+                self._leave(key, broadcast, subscriber)
+                raise
+
+        try:
+            while True:
+                if subscriber.lagged:
+                    raise SlimRPCError(
+                        code=code_pb2.RESOURCE_EXHAUSTED,
+                        message="Subscriber fell too far behind the event stream",
+                        details=None,
+                    )
+                if subscriber.closed and subscriber.queue.empty():
+                    if subscriber.error is not None:
+                        raise subscriber.error
+                    return
+                data = await subscriber.queue.get()
+                if data is not None:
+                    self.stats.deliveries += 1
+                    yield data
+        finally:
+            self._leave(key, broadcast, subscriber)
+
+    def _leave(
+        self, key: Hashable, broadcast: _Broadcast, subscriber: _Subscriber
+    ) -> None:
+        broadcast.subscribers.discard(subscriber)
+        if broadcast.subscribers:
+            return
+        if self._broadcasts.get(key) is broadcast:
+            del self._broadcasts[key]
+        if broadcast.task is not None:
+            broadcast.task.cancel()
+
+    async def _produce(
+        self,
+        key: Hashable,
+        broadcast: _Broadcast,
+        stream: AsyncGenerator[bytes, None],
+    ) -> None:
+        error: BaseException | None = None
+        try:
+            async for data in stream:
+                broadcast.started = True
+                self.stats.events += 1
+                for subscriber in list(broadcast.subscribers):
+                    try:
+                        subscriber.queue.put_nowait(data)
+                    except asyncio.QueueFull:
+                        subscriber.lagged = True
+                        broadcast.subscribers.discard(subscriber)
+                        self.stats.lagged += 1
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            error = e
+        finally:
+            if self._broadcasts.get(key) is broadcast:
+                del self._broadcasts[key]
+            with contextlib.suppress(Exception):
+                await stream.aclose()
+            for subscriber in broadcast.subscribers:
+                subscriber.closed = True
+                subscriber.error = error
+                subscriber.wake()
@@ -0,0 +1,243 @@
+# Copyright AGNTCY Contributors (https://github.com/agntcy)
+# SPDX-License-Identifier: Apache-2.0
+
+"""Server and client side caches for agent cards."""
+
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+
+from a2a.types.a2a_pb2 import AgentCard
+
+from slima2a.single_flight import SingleFlight
+
+
+@dataclass
+class CardCacheStats:
+    """Counters describing the behaviour of an agent card cache."""
+
+    hits: int = 0
+    misses: int = 0
+    invalidations: int = 0
+
+
+@dataclass
+class _SerializedCard:
+    card: AgentCard
+    card_modifier: Callable[[AgentCard], AgentCard] | None
+    data: bytes
+    expires_at: float | None
+
+
+class SerializedCardCache:
+    """Caches the serialized agent card served by a handler, per protocol version.
+
+    Handlers answer card requests with the cached bytes instead of running the
+    card modifier, converting and serializing the card on every call. An entry
+    is rebuilt when the handler's ``agent_card`` or ``card_modifier`` is
+    replaced. Cards mutated in place require an explicit ``invalidate()``.
+
+    The output of a ``card_modifier`` is cached for ``modifier_ttl`` seconds.
+    The default of 0 runs the modifier on every request, which suits modifiers
+    that depend on the time or on external state; None caches the output until
+    the cache is invalidated.
+
+    A single cache may be shared by the v1 and v0.3 handlers of one agent.
+
+    Example:
+        >>> card_cache = SerializedCardCache(modifier_ttl=30)
+        >>> handler = SRPCHandler(
+        ...     agent_card, request_handler, card_modifier=modifier, card_cache=card_cache
+        ... )
+    """
+
+    def __init__(
+        self,
+        modifier_ttl: float | None = 0.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initializes the SerializedCardCache.
+
+        Args:
+            modifier_ttl: Seconds the output of a card modifier is reused.
+                          None reuses it until the cache is invalidated.
+            clock: Monotonic clock used to expire modified cards.
+        """
+        self.modifier_ttl = modifier_ttl
+        self.stats = CardCacheStats()
+        self._clock = clock
+        self._entries: dict[str, _SerializedCard] = {}
+
+    def get(
+        self,
+        version: str,
+        card: AgentCard,
+        card_modifier: Callable[[AgentCard], AgentCard] | None,
+        serialize: Callable[[AgentCard], bytes],
+    ) -> bytes:
+        """Returns the serialized card for ``version``, building it on a miss.
+
+        Args:
+            version: The protocol version the card is serialized for.
+            card: The agent card of the handler.
+            card_modifier: The card modifier of the handler, if any.
+            serialize: Converts the (modified) card to the wire format of
+                       ``version``.
+        """
+        now = self._clock()
+        entry = self._entries.get(version)
+        if (
+            entry is not None
+            and entry.card is card
+            and entry.card_modifier is card_modifier
+            and (entry.expires_at is None or now < entry.expires_at)
+        ):
+            self.stats.hits += 1
+            return entry.data
+
+        self.stats.misses += 1
+        card_to_serve = card_modifier(card) if card_modifier else card
+        expires_at = None
+        if card_modifier is not None and self.modifier_ttl is not None:
+            expires_at = now + self.modifier_ttl
+        data = serialize(card_to_serve)
+        self._entries[version] = _SerializedCard(
+            card=card, card_modifier=card_modifier, data=data, expires_at=expires_at
+        )
+        return data
+
+    def invalidate(self) -> None:
+        """Drops every cached card, e.g. after the agent card was mutated."""
+        self.stats.invalidations += len(self._entries)
+        self._entries.clear()
+
+
+@dataclass
+class _CachedCard:
+    card: AgentCard
+    expires_at: float
+
+
+_Key = tuple[str, str, str, tuple[tuple[str, str], ...]]
+
+
+class AgentCardCache:
+    """Caches agent cards fetched by slimrpc transports, keyed by SLIM name.
+
+    Transports sharing a cache resolve each agent's card with one RPC per
+    ``ttl`` seconds: cached cards are served until they expire, and
+    concurrent fetches of the same card are de-duplicated. Cards are cached
+    separately per protocol version, tenant and request metadata, so callers
+    with different credentials never see each other's extended card. Every
+    caller receives its own copy.
+
+    Example:
+        >>> client_config = ClientConfig(
+        ...     slimrpc_channel_factory=factory,
+        ...     slimrpc_card_cache=shared_agent_card_cache(),
+        ... )
+    """
+
+    def __init__(
+        self,
+        ttl: float = 60.0,
+        max_size: int = 1024,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initializes the AgentCardCache.
+
+        Args:
+            ttl: Seconds a fetched card is served from the cache.
+            max_size: Maximum number of cards kept in the cache.
+            clock: Monotonic clock used to expire cards.
+        """
+        if max_size < 1:
+            raise ValueError("max_size must be at least 1")
+        self.ttl = ttl
+        self.max_size = max_size
+        self.stats = CardCacheStats()
+        self._clock = clock
+        self._entries: OrderedDict[_Key, _CachedCard] = OrderedDict()
+        self._flight: SingleFlight[AgentCard] = SingleFlight()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    async def get_or_fetch(
+        self,
+        name: str,
+        fetch: Callable[[], Awaitable[AgentCard]],
+        version: str = "",
+        tenant: str = "",
+        metadata: dict[str, str] | None = None,
+    ) -> AgentCard:
+        """Returns the card of agent ``name``, calling ``fetch`` on a miss.
+
+        Args:
+            name: The SLIM name of the agent (e.g. "agntcy/demo/echo_agent").
+            fetch: Retrieves the card from the agent.
+            version: The protocol version the card is fetched with.
+            tenant: The tenant the card is fetched for.
+            metadata: The slimrpc metadata the card is fetched with.
+        """
+        key: _Key = (name, version, tenant, tuple(sorted((metadata or {}).items())))
+        entry = self._entries.get(key)
+        if entry is not None:
+            if self._clock() < entry.expires_at:
+                self.stats.hits += 1
+                self._entries.move_to_end(key)
+                return _copy_card(entry.card)
+            del self._entries[key]
+
+        self.stats.misses += 1
+        card = await self._flight.do(key, lambda: self._fetch(key, fetch))
+        return _copy_card(card)
+
+    def invalidate(self, name: str) -> int:
+        """Drops every card cached for agent ``name``.
+
+        Returns:
+            The number of cards dropped.
+        """
+        keys = [key for key in self._entries if key[0] == name]
+        for key in keys:
+            del self._entries[key]
+        self.stats.invalidations += len(keys)
+        return len(keys)
+
+    def clear(self) -> None:
+        """Drops every cached card."""
+        self.stats.invalidations += len(self._entries)
+        self._entries.clear()
+
+    async def _fetch(
+        self,
+        key: _Key,
+        fetch: Callable[[], Awaitable[AgentCard]],
+    ) -> AgentCard:
+        card = await fetch()
+        self._entries[key] = _CachedCard(
+            card=_copy_card(card), expires_at=self._clock() + self.ttl
+        )
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+        return card
+
+
+def _copy_card(card: AgentCard) -> AgentCard:
+    copy = AgentCard()
+    copy.CopyFrom(card)
+    return copy
+
+
+_shared_agent_card_cache: AgentCardCache | None = None
+
+
+def shared_agent_card_cache() -> AgentCardCache:
+    """Returns the process-wide AgentCardCache."""
+    global _shared_agent_card_cache
+    if _shared_agent_card_cache is None:
+        _shared_agent_card_cache = AgentCardCache()
+    return _shared_agent_card_cache
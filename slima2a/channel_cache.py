@@ -0,0 +1,288 @@
+# Copyright AGNTCY Contributors (https://github.com/agntcy)
+# SPDX-License-Identifier: Apache-2.0
+
+"""LRU cache for slimrpc channels."""
+
+import asyncio
+import logging
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable, Iterable
+from dataclasses import dataclass
+from datetime import timedelta
+from typing import cast
+
+import slim_bindings
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ChannelCacheStats:
+    """Counters describing the behaviour of a ChannelCache."""
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expirations: int = 0
+    invalidations: int = 0
+
+
+def group_channel_key(remotes: Iterable[str]) -> frozenset[str]:
+    """Returns the cache key of a group channel: the set of its members.
+
+    Groups listing the same members in another order or with duplicates
+    share one key.
+    """
+    return frozenset(remotes)
+
+
+@dataclass
+class _CacheEntry:
+    channel: slim_bindings.Channel
+    last_used: float
+    leases: int = 0
+    dropped: bool = False
+
+
+class ChannelLease:
+    """A channel leased from a ChannelCache.
+
+    Forwards every call to the cached channel. Closing the lease returns it
+    to the cache instead of closing the shared channel.
+    """
+
+    def __init__(self, cache: "ChannelCache", entry: _CacheEntry) -> None:
+        self._cache = cache
+        self._entry: _CacheEntry | None = entry
+
+    @property
+    def channel(self) -> slim_bindings.Channel:
+        """The cached channel."""
+        if self._entry is None:
+            raise RuntimeError("channel lease was released")
+        return self._entry.channel
+
+    def __getattr__(self, name: str) -> object:
+        return getattr(self.channel, name)
+
+    def close(self, timeout: timedelta | None = None) -> None:
+        """Returns the lease to the cache."""
+        entry, self._entry = self._entry, None
+        if entry is not None:
+            self._cache._release(entry)
+
+    async def close_async(self, timeout: timedelta | None = None) -> None:
+        """Returns the lease to the cache."""
+        self.close(timeout)
+
+
+class ChannelCache:
+    """A bounded LRU cache of slimrpc channels.
+
+    Channels are keyed by the remote they target, or by group_channel_key for
+    group channels, so every transport created for the same remote or member
+    set shares one warm channel. Entries are evicted in least
+    recently used order once ``max_size`` is reached, and are dropped when they
+    have not been used for ``idle_ttl`` seconds.
+
+    Channels dropped from the cache, whether evicted, expired or
+    invalidated, are closed so their SLIM sessions are released. Transports
+    hold their channel through a lease from ``lease`` and return it when
+    they are closed. A leased channel does not expire, is evicted only once
+    no unleased channel is left to evict, and is closed only once its last
+    lease is returned.
+
+    Example:
+        >>> cache = ChannelCache(max_size=64, idle_ttl=300)
+        >>> factory = slimrpc_channel_factory(local_app, conn_id, cache=cache)
+    """
+
+    def __init__(
+        self,
+        max_size: int = 128,
+        idle_ttl: float | None = 300.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initializes the ChannelCache.
+
+        Args:
+            max_size: Maximum number of channels kept in the cache.
+            idle_ttl: Seconds a channel may stay unused before it is dropped.
+                      None disables idle expiry.
+            clock: Monotonic clock used to track idle time.
+        """
+        if max_size < 1:
+            raise ValueError("max_size must be at least 1")
+        self.max_size = max_size
+        self.idle_ttl = idle_ttl
+        self.stats = ChannelCacheStats()
+        self._clock = clock
+        self._entries: OrderedDict[Hashable, _CacheEntry] = OrderedDict()
+        self._lock = threading.Lock()
+        self._closing: set[asyncio.Task[None]] = set()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._entries
+
+    def get_or_create(
+        self,
+        key: Hashable,
+        create: Callable[[], slim_bindings.Channel],
+    ) -> slim_bindings.Channel:
+        """Returns the cached channel for ``key``, creating it on a miss.
+
+        The channel is not leased, so it is closed once dropped from the
+        cache. Use ``lease`` to hold it for longer.
+        """
+        return self._get(key, create, lease=False).channel
+
+    def lease(
+        self,
+        key: Hashable,
+        create: Callable[[], slim_bindings.Channel],
+    ) -> slim_bindings.Channel:
+        """Leases the cached channel for ``key``, creating it on a miss.
+
+        The channel is kept open until the returned ChannelLease is closed.
+        """
+        return cast(slim_bindings.Channel, ChannelLease(self, self._get(key, create)))
+
+    def _get(
+        self,
+        key: Hashable,
+        create: Callable[[], slim_bindings.Channel],
+        lease: bool = True,
+    ) -> _CacheEntry:
+        dropped: list[slim_bindings.Channel] = []
+        try:
+            with self._lock:
+                now = self._clock()
+                dropped.extend(self._expire_idle(now))
+
+                entry = self._entries.get(key)
+                if entry is not None:
+                    self.stats.hits += 1
+                    self._entries.move_to_end(key)
+                else:
+                    self.stats.misses += 1
+                    entry = self._entries[key] = _CacheEntry(
+                        channel=create(), last_used=now
+                    )
+                entry.last_used = now
+                if lease:
+                    entry.leases += 1
+                while len(self._entries) > self.max_size:
+                    dropped.extend(self._drop(self._eviction_key()))
+                    self.stats.evictions += 1
+                return entry
+        finally:
+            self._close(dropped)
+
+    def invalidate(self, key: Hashable) -> bool:
+        """Drops the channel cached for ``key``, closing it once unleased.
+
+        Returns:
+            True if a channel was cached for ``key``.
+        """
+        with self._lock:
+            if key not in self._entries:
+                return False
+            dropped = self._drop(key)
+            self.stats.invalidations += 1
+        self._close(dropped)
+        return True
+
+    def invalidate_member(self, remote: str) -> int:
+        """Drops every group channel that ``remote`` is a member of.
+
+        Call this when an agent leaves or is redeployed, so the next multicast
+        sets the group up again.
+
+        Returns:
+            The number of group channels dropped.
+        """
+        with self._lock:
+            keys = [
+                key
+                for key in self._entries
+                if isinstance(key, frozenset) and remote in key
+            ]
+            dropped = [channel for key in keys for channel in self._drop(key)]
+            self.stats.invalidations += len(keys)
+        self._close(dropped)
+        return len(keys)
+
+    def clear(self) -> None:
+        """Drops every cached channel, closing those that are not leased."""
+        with self._lock:
+            keys = list(self._entries)
+            dropped = [channel for key in keys for channel in self._drop(key)]
+            self.stats.invalidations += len(keys)
+        self._close(dropped)
+
+    async def wait_closed(self) -> None:
+        """Waits until the channels dropped so far are closed."""
+        if self._closing:
+            await asyncio.gather(*self._closing, return_exceptions=True)
+
+    def _expire_idle(self, now: float) -> list[slim_bindings.Channel]:
+        if self.idle_ttl is None:
+            return []
+        expired = []
+        for key, entry in list(self._entries.items()):
+            if entry.leases or now - entry.last_used < self.idle_ttl:
+                continue
+            expired.extend(self._drop(key))
+            self.stats.expirations += 1
+        return expired
+
+    def _eviction_key(self) -> Hashable:
+        """Returns the least recently used key, preferring unleased channels."""
+        for key, entry in self._entries.items():
+            if not entry.leases:
+                return key
+        return next(iter(self._entries))
+
+    def _drop(self, key: Hashable) -> list[slim_bindings.Channel]:
+        """Removes ``key``, returning its channel if it can be closed now."""
+        entry = self._entries.pop(key)
+        entry.dropped = True
+        return [] if entry.leases else [entry.channel]
+
+    def _release(self, entry: _CacheEntry) -> None:
+        with self._lock:
+            entry.leases -= 1
+            entry.last_used = self._clock()
+            closable = entry.dropped and not entry.leases
+        if closable:
+            self._close([entry.channel])
+
+    def _close(self, channels: list[slim_bindings.Channel]) -> None:
+        """Closes dropped channels, in the background when a loop is running."""
+        if not channels:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+        for channel in channels:
+            if loop is None:
+                try:
+                    channel.close(None)
+                except Exception as e:
+                    logger.debug("Failed to close cached channel: %s", e)
+                continue
+            task = loop.create_task(self._close_async(channel))
+            self._closing.add(task)
+            task.add_done_callback(self._closing.discard)
+
+    async def _close_async(self, channel: slim_bindings.Channel) -> None:
+        try:
+            await channel.close_async(None)
+        except Exception as e:
+            logger.debug("Failed to close cached channel: %s", e)
@@ -1,9 +1,12 @@
 # Copyright AGNTCY Contributors (https://github.com/agntcy)
 # SPDX-License-Identifier: Apache-2.0
 
+import asyncio
+import functools
 import logging
-from collections.abc import AsyncGenerator
+from collections.abc import AsyncGenerator, AsyncIterable
 from dataclasses import dataclass
+from datetime import timedelta
 from types import TracebackType
 from typing import Any, Callable
 
@@ -31,18 +34,65 @@ from a2a.types.a2a_pb2 import (
     Task,
     TaskPushNotificationConfig,
 )
+from a2a.utils.constants import PROTOCOL_VERSION_CURRENT, VERSION_HEADER
 from a2a.utils.telemetry import SpanKind, trace_class
-
+from google.protobuf.empty_pb2 import Empty
+from google.protobuf.message import Message as ProtoMessage
+from google.rpc import status_pb2
+
+from slima2a.batch import (
+    BATCH_SERVICE,
+    MAX_BATCH_SIZE,
+    SEND_MESSAGES_METHOD,
+    MessageBatcher,
+    decode_frames,
+    encode_frames,
+    read_status,
+)
+from slima2a.card_cache import AgentCardCache
+from slima2a.channel_cache import ChannelCache, group_channel_key
+from slima2a.completion import (
+    CompletionPolicy,
+    complete,
+    is_final_stream_response,
+    member_name,
+    read_group,
+)
+from slima2a.fan_out import FanOutClient
+from slima2a.flow_control import credited_stream
+from slima2a.membership import merge_streams, read_member
+from slima2a.resume import (
+    RESUME_AFTER_HEADER,
+    is_replay_gap,
+    is_transient_error,
+    pop_sequence,
+    response_task_id,
+)
+from slima2a.task_cache import AgentTaskCache
+from slima2a.task_merge import merge_list_tasks, status_timestamp_key
 from slima2a.types.v1 import a2a_pb2_slimrpc
 
 logger = logging.getLogger(__name__)
 
+_SERVICE_NAME = "lf.a2a.v1.A2AService"
+
 
 def slimrpc_channel_factory(
     local_app: slim_bindings.App,
     conn_id: int,
+    cache: ChannelCache | None = None,
 ) -> Callable[[str], slim_bindings.Channel]:
-    def factory(remote: str) -> slim_bindings.Channel:
+    """Returns a factory creating a slimrpc channel for a remote name.
+
+    Args:
+        local_app: The local SLIM app used to open channels.
+        conn_id: The SLIM connection id.
+        cache: An optional ChannelCache. When set, channels are reused across
+               calls targeting the same remote, and each channel returned is
+               a lease that closing gives back to the cache.
+    """
+
+    def new_channel(remote: str) -> slim_bindings.Channel:
         # Parse the remote name from the URL
         remote_parts = remote.split("/")
         if len(remote_parts) != 3:
@@ -58,14 +108,32 @@ def slimrpc_channel_factory(
             local_app, remote_name, conn_id
         )
 
+    if cache is None:
+        return new_channel
+
+    def factory(remote: str) -> slim_bindings.Channel:
+        return cache.lease(remote, lambda: new_channel(remote))
+
     return factory
 
 
 def slimrpc_group_channel_factory(
     local_app: slim_bindings.App,
     conn_id: int,
+    cache: ChannelCache | None = None,
 ) -> Callable[[list[str]], slim_bindings.Channel]:
-    def factory(remotes: list[str]) -> slim_bindings.Channel:
+    """Returns a factory creating a slimrpc group channel for a list of remotes.
+
+    Args:
+        local_app: The local SLIM app used to open channels.
+        conn_id: The SLIM connection id.
+        cache: An optional ChannelCache. When set, group channels are reused
+               across calls targeting the same set of remotes, and each
+               channel returned is a lease that closing gives back to the
+               cache.
+    """
+
+    def new_channel(remotes: list[str]) -> slim_bindings.Channel:
         members = []
         for remote in remotes:
             remote_parts = remote.split("/")
@@ -81,15 +149,66 @@ def slimrpc_group_channel_factory(
             local_app, members, conn_id
         )
 
+    if cache is None:
+        return new_channel
+
+    def factory(remotes: list[str]) -> slim_bindings.Channel:
+        key = group_channel_key(remotes)
+        return cache.lease(key, lambda: new_channel(sorted(key)))
+
     return factory
 
 
+async def close_channel(channel: slim_bindings.Channel) -> None:
+    """Closes ``channel``, logging failures instead of raising them."""
+    try:
+        await channel.close_async(None)
+    except Exception as e:
+        logger.debug("Failed to close channel: %s", e)
+
+
 @dataclass
 class ClientConfig(A2AClientConfig):
     slimrpc_channel_factory: Callable[[str], slim_bindings.Channel] | None = None
     slimrpc_group_channel_factory: (
         Callable[[list[str]], slim_bindings.Channel] | None
     ) = None
+    slimrpc_default_timeout: float | None = None
+    """Default deadline in seconds for slimrpc calls without a context timeout."""
+    slimrpc_card_cache: AgentCardCache | None = None
+    """Cache shared by transports fetching agent cards, e.g. shared_agent_card_cache()."""
+    slimrpc_task_cache: AgentTaskCache | None = None
+    """Coalesces the GetTask calls of transports polling the same tasks."""
+    slimrpc_stream_resume_attempts: int = 0
+    """Times a broken stream is resumed from the agent's ReplayBuffer."""
+    slimrpc_cancel_abandoned_streams: bool = False
+    """Cancels the task of a message stream closed before its final event."""
+    slimrpc_credit_window: int = 0
+    """Responses a CreditFlowController may stream ahead of the reader, 0 to disable."""
+    slimrpc_message_batcher: MessageBatcher | None = None
+    """Gathers concurrent send_message calls into SendMessages batches."""
+
+
+def _build_metadata(context: ClientCallContext | None) -> dict[str, str]:
+    """Creates SlimRPC metadata for the request."""
+    metadata: dict[str, str] = {VERSION_HEADER: PROTOCOL_VERSION_CURRENT}
+    if context and context.service_parameters:
+        for key, value in context.service_parameters.items():
+            metadata[key] = value
+    return metadata
+
+
+def _build_timeout(
+    context: ClientCallContext | None,
+    default_timeout: float | None,
+) -> timedelta | None:
+    """Returns the call deadline, preferring the context timeout."""
+    timeout = default_timeout
+    if context and context.timeout is not None:
+        timeout = context.timeout
+    if timeout is None:
+        return None
+    return timedelta(seconds=timeout)
 
 
 @trace_class(kind=SpanKind.CLIENT)
@@ -100,10 +219,56 @@ class SRPCTransport(ClientTransport):
         self,
         channel: slim_bindings.Channel,
         agent_card: AgentCard | None,
+        default_timeout: float | None = None,
+        url: str | None = None,
+        card_cache: AgentCardCache | None = None,
+        task_cache: AgentTaskCache | None = None,
+        stream_resume_attempts: int = 0,
+        cancel_abandoned_streams: bool = False,
+        credit_window: int = 0,
+        message_batcher: MessageBatcher | None = None,
+        owns_channel: bool = False,
     ) -> None:
-        """Initializes the SRPCTransport."""
+        """Initializes the SRPCTransport.
+
+        Args:
+            channel: The slimrpc channel connected to the agent.
+            agent_card: The AgentCard of the agent, if known.
+            default_timeout: Deadline in seconds applied to calls whose
+                             context does not set a timeout.
+            url: The SLIM name of the agent, used as agent card cache key.
+            card_cache: An optional AgentCardCache serving extended agent
+                        cards. Only used when url is set.
+            task_cache: An optional AgentTaskCache sharing GetTask calls.
+                        Only used when url is set.
+            stream_resume_attempts: Times a stream broken by an UNAVAILABLE
+                                    or ABORTED error is resumed by
+                                    resubscribing to its task after the
+                                    last event received.
+            cancel_abandoned_streams: Whether closing a send_message_streaming
+                                      stream before its final event cancels
+                                      the task on the agent.
+            credit_window: Number of responses the agent may stream ahead
+                           of the reader when it has a CreditFlowController.
+                           0 disables flow control.
+            message_batcher: An optional MessageBatcher sending concurrent
+                             send_message calls as SendMessages batches.
+                             The agent must set batch_concurrency.
+            owns_channel: Whether close() closes channel, e.g. to return a
+                          channel leased from a ChannelCache.
+        """
         self.agent_card = agent_card
         self.channel = channel
+        self.default_timeout = default_timeout
+        self.url = url
+        self.card_cache = card_cache
+        self.task_cache = task_cache
+        self.stream_resume_attempts = stream_resume_attempts
+        self.cancel_abandoned_streams = cancel_abandoned_streams
+        self.credit_window = credit_window
+        self.message_batcher = message_batcher
+        self.owns_channel = owns_channel
+        self._cancellations: set[asyncio.Task[None]] = set()
         self.stub = a2a_pb2_slimrpc.A2AServiceStub(channel)
 
     @classmethod
@@ -136,7 +301,29 @@ class SRPCTransport(ClientTransport):
         if url is None:
             raise ValueError("url is required for unicast sRPC")
         channel = config.slimrpc_channel_factory(url)
-        return cls(channel, card)
+        return cls(
+            channel,
+            card,
+            config.slimrpc_default_timeout,
+            url=url,
+            card_cache=config.slimrpc_card_cache,
+            task_cache=config.slimrpc_task_cache,
+            stream_resume_attempts=config.slimrpc_stream_resume_attempts,
+            cancel_abandoned_streams=config.slimrpc_cancel_abandoned_streams,
+            credit_window=config.slimrpc_credit_window,
+            message_batcher=config.slimrpc_message_batcher,
+            owns_channel=True,
+        )
+
+    def _get_metadata(self, context: ClientCallContext | None = None) -> dict[str, str]:
+        """Creates SlimRPC metadata for the request."""
+        return _build_metadata(context)
+
+    def _get_timeout(
+        self, context: ClientCallContext | None = None
+    ) -> timedelta | None:
+        """Returns the deadline for the request."""
+        return _build_timeout(context, self.default_timeout)
 
     async def send_message(
         self,
@@ -145,7 +332,57 @@ class SRPCTransport(ClientTransport):
         context: ClientCallContext | None = None,
     ) -> SendMessageResponse:
         """Sends a non-streaming message request to the agent."""
-        return await self.stub.SendMessage(request)
+        timeout = self._get_timeout(context)
+        metadata = self._get_metadata(context)
+        if self.message_batcher is not None:
+            return await self.message_batcher.submit(
+                (self, timeout, frozenset(metadata.items())),
+                request,
+                lambda requests: self._send_batch(requests, timeout, metadata),
+            )
+        return await self.stub.SendMessage(request, timeout=timeout, metadata=metadata)
+
+    async def send_messages_batch(
+        self,
+        requests: list[SendMessageRequest],
+        *,
+        context: ClientCallContext | None = None,
+    ) -> list[SendMessageResponse | Exception]:
+        """Sends many message requests in one round trip per MAX_BATCH_SIZE.
+
+        The agent's SRPCHandler must set batch_concurrency.
+
+        Returns:
+            The response, or the error, of each request in order.
+        """
+        timeout = self._get_timeout(context)
+        metadata = self._get_metadata(context)
+        chunks = await asyncio.gather(
+            *(
+                self._send_batch(requests[i : i + MAX_BATCH_SIZE], timeout, metadata)
+                for i in range(0, len(requests), MAX_BATCH_SIZE)
+            )
+        )
+        return [result for chunk in chunks for result in chunk]
+
+    async def _send_batch(
+        self,
+        requests: list[SendMessageRequest],
+        timeout: timedelta | None,
+        metadata: dict[str, str],
+    ) -> list[SendMessageResponse | Exception]:
+        """Calls the SendMessages batch method."""
+        data = await self.channel.call_unary_async(
+            BATCH_SERVICE,
+            SEND_MESSAGES_METHOD,
+            encode_frames([request.SerializeToString() for request in requests]),
+            timeout,
+            metadata,
+        )
+        return [
+            read_status(status_pb2.Status.FromString(frame))
+            for frame in decode_frames(data)
+        ]
 
     async def send_message_streaming(
         self,
@@ -154,8 +391,40 @@ class SRPCTransport(ClientTransport):
         context: ClientCallContext | None = None,
     ) -> AsyncGenerator[StreamResponse, None]:
         """Sends a streaming message request to the agent and yields responses as they arrive."""
-        async for response in self.stub.SendStreamingMessage(request):
-            yield response
+        task_id = request.message.task_id
+        finished = False
+        try:
+            async for response in self._resumable(
+                self._open_stream(self.stub.SendStreamingMessage, request, context),
+                request.tenant,
+                context,
+            ):
+                task_id = task_id or response_task_id(response)
+                finished = is_final_stream_response(response)
+                yield response
+        except (GeneratorExit, asyncio.CancelledError):
+            if self.cancel_abandoned_streams and task_id and not finished:
+                self._cancel_abandoned(
+                    CancelTaskRequest(id=task_id, tenant=request.tenant), context
+                )
+            raise
+
+    def _cancel_abandoned(
+        self,
+        request: CancelTaskRequest,
+        context: ClientCallContext | None,
+    ) -> None:
+        """Cancels the task of an abandoned stream in the background."""
+
+        async def cancel() -> None:
+            try:
+                await self.cancel_task(request, context=context)
+            except slim_bindings.RpcError as e:
+                logger.debug("Failed to cancel abandoned task %s: %s", request.id, e)
+
+        task = asyncio.get_running_loop().create_task(cancel())
+        self._cancellations.add(task)
+        task.add_done_callback(self._cancellations.discard)
 
     async def subscribe(
         self,
@@ -164,9 +433,94 @@ class SRPCTransport(ClientTransport):
         context: ClientCallContext | None = None,
     ) -> AsyncGenerator[StreamResponse, None]:
         """Reconnects to get task updates."""
-        async for response in self.stub.SubscribeToTask(request):
+        async for response in self._resumable(
+            self._open_stream(self.stub.SubscribeToTask, request, context),
+            request.tenant,
+            context,
+        ):
             yield response
 
+    def _open_stream(
+        self,
+        method: Callable[..., AsyncIterable[StreamResponse]],
+        request: ProtoMessage,
+        context: ClientCallContext | None,
+        metadata: dict[str, str] | None = None,
+    ) -> AsyncIterable[StreamResponse]:
+        """Calls a streaming stub method, under flow control if credit_window is set."""
+        timeout = self._get_timeout(context)
+        if metadata is None:
+            metadata = self._get_metadata(context)
+        if not self.credit_window:
+            return method(request, timeout=timeout, metadata=metadata)
+        call_metadata = metadata
+        return credited_stream(
+            self.channel,
+            self.credit_window,
+            lambda headers: method(
+                request, timeout=timeout, metadata={**call_metadata, **headers}
+            ),
+            timeout,
+        )
+
+    async def _resumable(
+        self,
+        stream: AsyncIterable[StreamResponse],
+        tenant: str,
+        context: ClientCallContext | None,
+    ) -> AsyncGenerator[StreamResponse, None]:
+        """Yields the responses of stream, resubscribing when it breaks.
+
+        Sequence numbers stamped by the agent's ReplayBuffer are removed from
+        the responses and used to skip events already received. When the
+        agent no longer keeps the events to replay, the task is subscribed
+        to afresh, starting over from its current state.
+        """
+        task_id = ""
+        last_seq = 0
+        attempts = 0
+        while True:
+            try:
+                async for response in stream:
+                    seq = pop_sequence(response)
+                    if seq is not None:
+                        if seq <= last_seq:
+                            continue
+                        last_seq = seq
+                    task_id = task_id or response_task_id(response)
+                    yield response
+                return
+            except slim_bindings.RpcError as e:
+                gap = attempts > 0 and is_replay_gap(e)
+                if not task_id or not (
+                    gap
+                    or (
+                        attempts < self.stream_resume_attempts and is_transient_error(e)
+                    )
+                ):
+                    raise
+                metadata = self._get_metadata(context)
+                if gap:
+                    logger.debug(
+                        "Events of task %s after %d were dropped, resubscribing",
+                        task_id,
+                        last_seq,
+                    )
+                    last_seq = 0
+                    metadata.pop(RESUME_AFTER_HEADER, None)
+                else:
+                    attempts += 1
+                    logger.debug(
+                        "Resuming stream of task %s after event %d", task_id, last_seq
+                    )
+                    metadata[RESUME_AFTER_HEADER] = str(last_seq)
+                stream = self._open_stream(
+                    self.stub.SubscribeToTask,
+                    SubscribeToTaskRequest(id=task_id, tenant=tenant),
+                    context,
+                    metadata,
+                )
+
     async def get_task(
         self,
         request: GetTaskRequest,
@@ -174,7 +528,16 @@ class SRPCTransport(ClientTransport):
         context: ClientCallContext | None = None,
     ) -> Task:
         """Retrieves the current state and history of a specific task."""
-        return await self.stub.GetTask(request)
+        metadata = self._get_metadata(context)
+
+        async def fetch() -> Task:
+            return await self.stub.GetTask(
+                request, timeout=self._get_timeout(context), metadata=metadata
+            )
+
+        if self.task_cache is None or self.url is None:
+            return await fetch()
+        return await self.task_cache.get_or_fetch(self.url, request, fetch, metadata)
 
     async def list_tasks(
         self,
@@ -183,7 +546,11 @@ class SRPCTransport(ClientTransport):
         context: ClientCallContext | None = None,
     ) -> ListTasksResponse:
         """Retrieves tasks for an agent."""
-        return await self.stub.ListTasks(request)
+        return await self.stub.ListTasks(
+            request,
+            timeout=self._get_timeout(context),
+            metadata=self._get_metadata(context),
+        )
 
     async def cancel_task(
         self,
@@ -192,7 +559,11 @@ class SRPCTransport(ClientTransport):
         context: ClientCallContext | None = None,
     ) -> Task:
         """Requests the agent to cancel a specific task."""
-        return await self.stub.CancelTask(request)
+        return await self.stub.CancelTask(
+            request,
+            timeout=self._get_timeout(context),
+            metadata=self._get_metadata(context),
+        )
 
     async def create_task_push_notification_config(
         self,
@@ -201,7 +572,11 @@ class SRPCTransport(ClientTransport):
         context: ClientCallContext | None = None,
     ) -> TaskPushNotificationConfig:
         """Sets or updates the push notification configuration for a specific task."""
-        return await self.stub.CreateTaskPushNotificationConfig(request)
+        return await self.stub.CreateTaskPushNotificationConfig(
+            request,
+            timeout=self._get_timeout(context),
+            metadata=self._get_metadata(context),
+        )
 
     async def get_task_push_notification_config(
         self,
@@ -210,7 +585,11 @@ class SRPCTransport(ClientTransport):
         context: ClientCallContext | None = None,
     ) -> TaskPushNotificationConfig:
         """Retrieves the push notification configuration for a specific task."""
-        return await self.stub.GetTaskPushNotificationConfig(request)
+        return await self.stub.GetTaskPushNotificationConfig(
+            request,
+            timeout=self._get_timeout(context),
+            metadata=self._get_metadata(context),
+        )
 
     async def list_task_push_notification_configs(
         self,
@@ -219,7 +598,11 @@ class SRPCTransport(ClientTransport):
         context: ClientCallContext | None = None,
     ) -> ListTaskPushNotificationConfigsResponse:
         """Lists push notification configurations for a specific task."""
-        return await self.stub.ListTaskPushNotificationConfigs(request)
+        return await self.stub.ListTaskPushNotificationConfigs(
+            request,
+            timeout=self._get_timeout(context),
+            metadata=self._get_metadata(context),
+        )
 
     async def delete_task_push_notification_config(
         self,
@@ -228,7 +611,11 @@ class SRPCTransport(ClientTransport):
         context: ClientCallContext | None = None,
     ) -> None:
         """Deletes the push notification configuration for a specific task."""
-        await self.stub.DeleteTaskPushNotificationConfig(request)
+        await self.stub.DeleteTaskPushNotificationConfig(
+            request,
+            timeout=self._get_timeout(context),
+            metadata=self._get_metadata(context),
+        )
 
     async def get_extended_agent_card(
         self,
@@ -240,11 +627,28 @@ class SRPCTransport(ClientTransport):
         card = self.agent_card
         if card and not card.capabilities.extended_agent_card:
             return card
-        return await self.stub.GetExtendedAgentCard(request)
+
+        metadata = self._get_metadata(context)
+
+        async def fetch() -> AgentCard:
+            return await self.stub.GetExtendedAgentCard(
+                request,
+                timeout=self._get_timeout(context),
+                metadata=metadata,
+            )
+
+        if self.card_cache is None or self.url is None:
+            return await fetch()
+        return await self.card_cache.get_or_fetch(
+            self.url, fetch, PROTOCOL_VERSION_CURRENT, request.tenant, metadata
+        )
 
     async def close(self) -> None:
         """Closes the transport and releases any resources."""
-        pass
+        if self._cancellations:
+            await asyncio.gather(*self._cancellations)
+        if self.owns_channel:
+            await close_channel(self.channel)
 
 
 class MultiAgentClientFactory(ClientFactory):
@@ -253,7 +657,7 @@ class MultiAgentClientFactory(ClientFactory):
 
     Will find a common transport in the intersection of Agent's supported interfaces
     which supports multi agent communication and use that. Otherwise falls back to
-    individual clients (TODO).
+    a FanOutClient calling individual clients concurrently.
 
     Usage:
         factory = MultiAgentClientFactory(client_config)
@@ -268,10 +672,20 @@ class MultiAgentClientFactory(ClientFactory):
         self,
         config: ClientConfig,
         consumers: list | None = None,
+        fan_out_concurrency: int = 16,
     ) -> None:
+        """Initializes the MultiAgentClientFactory.
+
+        Args:
+            config: The client configuration.
+            consumers: Consumers passed to the created clients.
+            fan_out_concurrency: Maximum number of agents a FanOutClient calls
+                                 at the same time.
+        """
         super().__init__(config, consumers)
         self._config: ClientConfig = config
         self._multiagent_labels: set[str] = set()
+        self._fan_out_concurrency = fan_out_concurrency
         self.register("slimrpc", SRPCTransport.create, multiagent=True)  # type: ignore[arg-type]
 
     def register(  # type: ignore[override]
@@ -289,7 +703,7 @@ class MultiAgentClientFactory(ClientFactory):
         card: AgentCard | list[AgentCard],
         consumers: list | None = None,
         interceptors: list | None = None,
-    ) -> "Client | MulticastClient":
+    ) -> "Client | MulticastClient | FanOutClient":
         if not isinstance(card, list):
             return super().create(card, consumers, interceptors)
 
@@ -297,10 +711,23 @@ class MultiAgentClientFactory(ClientFactory):
             return super().create(card[0], consumers, interceptors)
 
         protocol = self._find_common_multiagent_protocol(card)
+        if protocol is None:
+            logger.debug(
+                "No common multiagent protocol, fanning out to %d clients", len(card)
+            )
+            return FanOutClient(
+                {
+                    self._agent_name(c): super(MultiAgentClientFactory, self).create(
+                        c, consumers, interceptors
+                    )
+                    for c in card
+                },
+                self._fan_out_concurrency,
+            )
         producer = self._registry[protocol]
         return producer(card, None, self._config)  # type: ignore[arg-type, return-value]
 
-    def _find_common_multiagent_protocol(self, cards: list[AgentCard]) -> str:
+    def _find_common_multiagent_protocol(self, cards: list[AgentCard]) -> str | None:
         per_card = [{i.protocol_binding for i in c.supported_interfaces} for c in cards]
         common = set.intersection(*per_card)
 
@@ -310,11 +737,15 @@ class MultiAgentClientFactory(ClientFactory):
         for protocol in preferred:
             if protocol in common and protocol in self._multiagent_labels:
                 return protocol
+        return None
 
-        raise ValueError(
-            f"No common multiagent-capable protocol. Common: {common}, "
-            f"Multiagent-capable: {self._multiagent_labels}"
+    def _agent_name(self, card: AgentCard) -> str:
+        """Returns the URL a fanned-out client reaches the agent at."""
+        iface = ClientFactory._find_best_interface(
+            list(card.supported_interfaces),
+            protocol_bindings=self._config.supported_protocol_bindings or None,
         )
+        return iface.url if iface else card.name
 
 
 @trace_class(kind=SpanKind.CLIENT)
@@ -323,14 +754,51 @@ class SRPCMulticastTransport:
 
     All methods are async generators that yield (source, response) tuples,
     where source is the context identifying which agent produced the response.
+    Each method accepts a CompletionPolicy deciding when to stop waiting for
+    the remaining agents. With ``partial_results`` set, agent errors are
+    yielded as (None, error) tuples and the call ends with a
+    (None, MulticastSummary) tuple listing the agents that timed out.
     """
 
     def __init__(
         self,
         channel: slim_bindings.Channel,
+        default_timeout: float | None = None,
+        agent_names: list[str] | None = None,
+        channel_factory: Callable[[str], slim_bindings.Channel] | None = None,
+        group_channel_factory: (
+            Callable[[list[str]], slim_bindings.Channel] | None
+        ) = None,
     ) -> None:
+        """Initializes the SRPCMulticastTransport.
+
+        Args:
+            channel: The slimrpc group channel.
+            default_timeout: Deadline in seconds applied to calls whose
+                             context does not set a timeout.
+            agent_names: The SLIM names of the group members.
+            channel_factory: Creates unicast channels to single members, used
+                             to follow a member's ListTasks page tokens and
+                             to reach members added to the group.
+            group_channel_factory: Creates the group channel of the current
+                                   members in rebuild_group.
+        """
         self.channel = channel
+        self.default_timeout = default_timeout
+        self.agent_names = agent_names
+        self.channel_factory = channel_factory
+        self.group_channel_factory = group_channel_factory
         self.stub = a2a_pb2_slimrpc.A2AServiceGroupStub(channel)
+        # Members added since the group channel was created, reached over
+        # unicast channels. Removing a member of the group channel marks it
+        # stale, and it is rebuilt before the next call.
+        self._added: dict[str, slim_bindings.Channel] = {}
+        self._stale = False
+        # Calls in flight per channel, keyed by id, and dropped channels
+        # closed once their last call is done.
+        self._calls: dict[int, int] = {}
+        self._retired: dict[int, slim_bindings.Channel] = {}
+        self._closing: set[asyncio.Task[None]] = set()
 
     @classmethod
     def create(
@@ -344,15 +812,240 @@ class SRPCMulticastTransport:
                 "slimrpc_group_channel_factory is required when using sRPC multicast"
             )
         channel = config.slimrpc_group_channel_factory(agent_names)
-        return cls(channel)
+        return cls(
+            channel,
+            config.slimrpc_default_timeout,
+            list(agent_names),
+            config.slimrpc_channel_factory,
+            config.slimrpc_group_channel_factory,
+        )
+
+    def add_member(self, name: str) -> None:
+        """Adds the agent ``name`` to the group without rebuilding its channel.
+
+        Calls started from now on also reach ``name``, over a unicast channel
+        from ``channel_factory``, and merge its responses with the group's.
+        When the group is rebuilt before the next call, ``name`` joins the
+        new group channel instead. Calls in flight are not affected.
+        """
+        if name in self._added or (
+            self.agent_names is not None and name in self.agent_names
+        ):
+            return
+        if not self._stale:
+            if self.channel_factory is None:
+                raise ValueError("add_member needs a slimrpc_channel_factory")
+            self._added[name] = self.channel_factory(name)
+        if self.agent_names is not None:
+            self.agent_names.append(name)
+
+    def remove_member(self, name: str) -> None:
+        """Removes the agent ``name`` from the group.
+
+        Calls started from now on no longer reach ``name``. A member added
+        with add_member is dropped with its unicast channel. A member of the
+        group channel cannot be dropped from it, so the group is rebuilt
+        with rebuild_group before the next call; removing several members
+        in a row rebuilds it once. Calls in flight are not affected.
+        """
+        if self.agent_names is None or name not in self.agent_names:
+            return
+        if name not in self._added and self.group_channel_factory is None:
+            raise ValueError("remove_member needs a slimrpc_group_channel_factory")
+        self.agent_names.remove(name)
+        channel = self._added.pop(name, None)
+        if channel is None:
+            self._stale = True
+        else:
+            self._retire([channel])
+
+    def rebuild_group(self) -> None:
+        """Replaces the group channel with one over the current members.
+
+        Folds the changes made by add_member and remove_member into a new
+        group channel, e.g. once a burst of scaling events has settled.
+        Calls in flight keep using the previous channels, which are closed
+        once those calls are done.
+        """
+        if self.agent_names is None or self.group_channel_factory is None:
+            raise ValueError(
+                "rebuild_group needs the group members and a slimrpc_group_channel_factory"
+            )
+        dropped = [self.channel, *self._added.values()]
+        self.channel = self.group_channel_factory(list(self.agent_names))
+        self.stub = a2a_pb2_slimrpc.A2AServiceGroupStub(self.channel)
+        self._added = {}
+        self._stale = False
+        self._retire(dropped)
+
+    def _retire(self, channels: list[slim_bindings.Channel]) -> None:
+        """Closes dropped channels once the calls using them are done.
+
+        Channels are closed in the background when a loop is running, and
+        otherwise by the next call or by close().
+        """
+        for channel in channels:
+            self._retired[id(channel)] = channel
+        self._close_retired()
+
+    def _close_retired(self) -> None:
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        for key in [key for key in self._retired if key not in self._calls]:
+            task = loop.create_task(close_channel(self._retired.pop(key)))
+            self._closing.add(task)
+            task.add_done_callback(self._closing.discard)
+
+    async def _track(
+        self,
+        stream: AsyncGenerator[tuple[Any, Any], None],
+        channels: list[slim_bindings.Channel],
+    ) -> AsyncGenerator[tuple[Any, Any], None]:
+        """Counts the call on ``channels`` until ``stream`` is done."""
+        for channel in channels:
+            self._calls[id(channel)] = self._calls.get(id(channel), 0) + 1
+        try:
+            async for item in stream:
+                yield item
+        finally:
+            await stream.aclose()
+            for channel in channels:
+                self._calls[id(channel)] -= 1
+                if not self._calls[id(channel)]:
+                    del self._calls[id(channel)]
+            self._close_retired()
+
+    def _get_metadata(self, context: ClientCallContext | None = None) -> dict[str, str]:
+        """Creates SlimRPC metadata for the request."""
+        return _build_metadata(context)
+
+    def _get_timeout(
+        self, context: ClientCallContext | None = None
+    ) -> timedelta | None:
+        """Returns the deadline for the request."""
+        return _build_timeout(context, self.default_timeout)
+
+    def _call(
+        self,
+        method: str,
+        request: ProtoMessage,
+        response_type: type[ProtoMessage],
+        context: ClientCallContext | None,
+        completion: CompletionPolicy | None,
+        streaming: bool = False,
+        direct: bool = False,
+    ) -> AsyncGenerator[tuple[Any, Any], None]:
+        """Calls a group method, stopping once ``completion`` is satisfied.
+
+        Responses are parsed as ``response_type`` when ``direct`` is set or
+        partial results are requested, reading the multicast stream without
+        the group stub. The group stub raises on the first member error and
+        always parses the method's own response type. Members added since
+        the group channel was created are merged in from
+        unicast calls, and a group left stale by remove_member is rebuilt
+        first.
+        """
+        if self._stale:
+            self.rebuild_group()
+        timeout = self._get_timeout(context)
+        metadata = self._get_metadata(context)
+        partial_results = completion is not None and completion.partial_results
+        added = dict(self._added)
+        if direct or partial_results:
+            call = (
+                self.channel.call_multicast_unary_stream_async
+                if streaming
+                else self.channel.call_multicast_unary_async
+            )
+            stream = read_group(
+                functools.partial(
+                    call,
+                    _SERVICE_NAME,
+                    method,
+                    request.SerializeToString(),
+                    timeout,
+                    metadata,
+                ),
+                response_type.FromString,
+                raise_errors=not partial_results,
+            )
+        else:
+            stream = getattr(self.stub, method)(
+                request, timeout=timeout, metadata=metadata
+            )
+        if added:
+            stream = merge_streams(
+                [
+                    stream,
+                    *(
+                        read_member(
+                            name,
+                            functools.partial(
+                                member_channel.call_unary_stream_async
+                                if streaming
+                                else member_channel.call_unary_async,
+                                _SERVICE_NAME,
+                                method,
+                                request.SerializeToString(),
+                                timeout,
+                                metadata,
+                            ),
+                            response_type.FromString,
+                            streaming,
+                            raise_errors=not partial_results,
+                        )
+                        for name, member_channel in added.items()
+                    ),
+                ]
+            )
+        channels = [self.channel, *added.values()]
+        if completion is None:
+            return self._track(stream, channels)
+        return self._track(
+            complete(
+                stream,
+                completion,
+                self.agent_names,
+                is_final_stream_response if streaming else None,
+            ),
+            channels,
+        )
 
     async def send_message(
         self,
         request: SendMessageRequest,
         *,
         context: ClientCallContext | None = None,
+        completion: CompletionPolicy | None = None,
     ) -> AsyncGenerator[tuple[Any, SendMessageResponse], None]:
-        async for source, response in self.stub.SendMessage(request):
+        async for source, response in self._call(
+            "SendMessage", request, SendMessageResponse, context, completion
+        ):
+            yield source, response
+
+    async def send_message_as_stream_responses(
+        self,
+        request: SendMessageRequest,
+        *,
+        context: ClientCallContext | None = None,
+        completion: CompletionPolicy | None = None,
+    ) -> AsyncGenerator[tuple[Any, StreamResponse], None]:
+        """Like send_message, parsing each answer into a StreamResponse.
+
+        SendMessageResponse and StreamResponse number their task and message
+        fields alike, so an answer parses as a StreamResponse without copying
+        it out of a SendMessageResponse.
+        """
+        async for source, response in self._call(
+            "SendMessage",
+            request,
+            StreamResponse,
+            context,
+            completion,
+            direct=True,
+        ):
             yield source, response
 
     async def send_message_streaming(
@@ -360,8 +1053,16 @@ class SRPCMulticastTransport:
         request: SendMessageRequest,
         *,
         context: ClientCallContext | None = None,
+        completion: CompletionPolicy | None = None,
     ) -> AsyncGenerator[tuple[Any, StreamResponse], None]:
-        async for source, response in self.stub.SendStreamingMessage(request):
+        async for source, response in self._call(
+            "SendStreamingMessage",
+            request,
+            StreamResponse,
+            context,
+            completion,
+            streaming=True,
+        ):
             yield source, response
 
     async def get_task(
@@ -369,8 +1070,11 @@ class SRPCMulticastTransport:
         request: GetTaskRequest,
         *,
         context: ClientCallContext | None = None,
+        completion: CompletionPolicy | None = None,
     ) -> AsyncGenerator[tuple[Any, Task], None]:
-        async for source, response in self.stub.GetTask(request):
+        async for source, response in self._call(
+            "GetTask", request, Task, context, completion
+        ):
             yield source, response
 
     async def list_tasks(
@@ -378,17 +1082,45 @@ class SRPCMulticastTransport:
         request: ListTasksRequest,
         *,
         context: ClientCallContext | None = None,
+        completion: CompletionPolicy | None = None,
     ) -> AsyncGenerator[tuple[Any, ListTasksResponse], None]:
-        async for source, response in self.stub.ListTasks(request):
+        async for source, response in self._call(
+            "ListTasks", request, ListTasksResponse, context, completion
+        ):
             yield source, response
 
+    async def list_member_tasks(
+        self,
+        agent_name: str,
+        request: ListTasksRequest,
+        *,
+        context: ClientCallContext | None = None,
+    ) -> ListTasksResponse:
+        """Lists the tasks of a single member over a unicast channel."""
+        if self.channel_factory is None:
+            raise ValueError(
+                "slimrpc_channel_factory is required to page through member tasks"
+            )
+        channel = self.channel_factory(agent_name)
+        try:
+            return await a2a_pb2_slimrpc.A2AServiceStub(channel).ListTasks(
+                request,
+                timeout=self._get_timeout(context),
+                metadata=self._get_metadata(context),
+            )
+        finally:
+            await close_channel(channel)
+
     async def cancel_task(
         self,
         request: CancelTaskRequest,
         *,
         context: ClientCallContext | None = None,
+        completion: CompletionPolicy | None = None,
     ) -> AsyncGenerator[tuple[Any, Task], None]:
-        async for source, response in self.stub.CancelTask(request):
+        async for source, response in self._call(
+            "CancelTask", request, Task, context, completion
+        ):
             yield source, response
 
     async def subscribe(
@@ -396,8 +1128,16 @@ class SRPCMulticastTransport:
         request: SubscribeToTaskRequest,
         *,
         context: ClientCallContext | None = None,
+        completion: CompletionPolicy | None = None,
     ) -> AsyncGenerator[tuple[Any, StreamResponse], None]:
-        async for source, response in self.stub.SubscribeToTask(request):
+        async for source, response in self._call(
+            "SubscribeToTask",
+            request,
+            StreamResponse,
+            context,
+            completion,
+            streaming=True,
+        ):
             yield source, response
 
     async def create_task_push_notification_config(
@@ -405,9 +1145,14 @@ class SRPCMulticastTransport:
         request: TaskPushNotificationConfig,
         *,
         context: ClientCallContext | None = None,
+        completion: CompletionPolicy | None = None,
     ) -> AsyncGenerator[tuple[Any, TaskPushNotificationConfig], None]:
-        async for source, response in self.stub.CreateTaskPushNotificationConfig(
-            request
+        async for source, response in self._call(
+            "CreateTaskPushNotificationConfig",
+            request,
+            TaskPushNotificationConfig,
+            context,
+            completion,
         ):
             yield source, response
 
@@ -416,8 +1161,15 @@ class SRPCMulticastTransport:
         request: GetTaskPushNotificationConfigRequest,
         *,
         context: ClientCallContext | None = None,
+        completion: CompletionPolicy | None = None,
     ) -> AsyncGenerator[tuple[Any, TaskPushNotificationConfig], None]:
-        async for source, response in self.stub.GetTaskPushNotificationConfig(request):
+        async for source, response in self._call(
+            "GetTaskPushNotificationConfig",
+            request,
+            TaskPushNotificationConfig,
+            context,
+            completion,
+        ):
             yield source, response
 
     async def list_task_push_notification_configs(
@@ -425,9 +1177,14 @@ class SRPCMulticastTransport:
         request: ListTaskPushNotificationConfigsRequest,
         *,
         context: ClientCallContext | None = None,
+        completion: CompletionPolicy | None = None,
     ) -> AsyncGenerator[tuple[Any, ListTaskPushNotificationConfigsResponse], None]:
-        async for source, response in self.stub.ListTaskPushNotificationConfigs(
-            request
+        async for source, response in self._call(
+            "ListTaskPushNotificationConfigs",
+            request,
+            ListTaskPushNotificationConfigsResponse,
+            context,
+            completion,
         ):
             yield source, response
 
@@ -436,22 +1193,33 @@ class SRPCMulticastTransport:
         request: DeleteTaskPushNotificationConfigRequest,
         *,
         context: ClientCallContext | None = None,
+        completion: CompletionPolicy | None = None,
     ) -> AsyncGenerator[tuple[Any, None], None]:
-        async for source, _ in self.stub.DeleteTaskPushNotificationConfig(request):
-            yield source, None
+        async for source, response in self._call(
+            "DeleteTaskPushNotificationConfig", request, Empty, context, completion
+        ):
+            yield source, None if isinstance(response, Empty) else response
 
     async def get_extended_agent_card(
         self,
         request: GetExtendedAgentCardRequest,
         *,
         context: ClientCallContext | None = None,
+        completion: CompletionPolicy | None = None,
     ) -> AsyncGenerator[tuple[Any, AgentCard], None]:
-        async for source, response in self.stub.GetExtendedAgentCard(request):
+        async for source, response in self._call(
+            "GetExtendedAgentCard", request, AgentCard, context, completion
+        ):
             yield source, response
 
     async def close(self) -> None:
-        """Closes the transport and releases any resources."""
-        pass
+        """Closes the group channel and the unicast channels of added members."""
+        channels = [self.channel, *self._added.values(), *self._retired.values()]
+        self._added = {}
+        self._retired = {}
+        await asyncio.gather(*(close_channel(channel) for channel in channels))
+        if self._closing:
+            await asyncio.gather(*self._closing)
 
 
 class MulticastClient:
@@ -479,32 +1247,59 @@ class MulticastClient:
         transport = SRPCMulticastTransport.create(agent_names, config)
         return cls(transport)
 
+    @property
+    def agent_names(self) -> list[str] | None:
+        """The SLIM names of the current group members."""
+        return self._transport.agent_names
+
+    def add_member(self, name: str) -> None:
+        """Adds an agent to the group, e.g. a replica started by an autoscaler.
+
+        The group channel is kept: the new member is reached over a unicast
+        channel and its responses are merged with the group's, so calls to
+        the other members are not interrupted.
+        """
+        self._transport.add_member(name)
+
+    def remove_member(self, name: str) -> None:
+        """Removes an agent from the group.
+
+        Calls started from now on no longer reach it. When it was a member of
+        the group channel, the group is rebuilt before the next call.
+        """
+        self._transport.remove_member(name)
+
+    def rebuild_group(self) -> None:
+        """Folds the member changes into a new group channel.
+
+        Added members are then reached through the group instead of unicast
+        channels.
+        """
+        self._transport.rebuild_group()
+
     async def send_message(
         self,
         request: SendMessageRequest,
         *,
         context: ClientCallContext | None = None,
+        completion: CompletionPolicy | None = None,
     ) -> AsyncGenerator[tuple[Any, StreamResponse], None]:
         """Sends a message to all agents in the group.
 
         Yields (source, response) tuples — one complete response per agent,
         wrapped as StreamResponse.
         """
-        async for source, response in self._transport.send_message(
-            request, context=context
+        async for source, response in self._transport.send_message_as_stream_responses(
+            request, context=context, completion=completion
         ):
-            stream_response = StreamResponse()
-            if response.HasField("task"):
-                stream_response.task.CopyFrom(response.task)
-            elif response.HasField("message"):
-                stream_response.message.CopyFrom(response.message)
-            yield source, stream_response
+            yield source, response
 
     async def send_message_streaming(
         self,
         request: SendMessageRequest,
         *,
         context: ClientCallContext | None = None,
+        completion: CompletionPolicy | None = None,
     ) -> AsyncGenerator[tuple[Any, StreamResponse], None]:
         """Sends a streaming message to all agents in the group.
 
@@ -512,7 +1307,7 @@ class MulticastClient:
         arrive from any agent. Use ``source`` to demultiplex per-agent.
         """
         async for source, response in self._transport.send_message_streaming(
-            request, context=context
+            request, context=context, completion=completion
         ):
             yield source, response
 
@@ -521,9 +1316,10 @@ class MulticastClient:
         request: GetTaskRequest,
         *,
         context: ClientCallContext | None = None,
+        completion: CompletionPolicy | None = None,
     ) -> AsyncGenerator[tuple[Any, Task], None]:
         async for source, response in self._transport.get_task(
-            request, context=context
+            request, context=context, completion=completion
         ):
             yield source, response
 
@@ -532,20 +1328,62 @@ class MulticastClient:
         request: ListTasksRequest,
         *,
         context: ClientCallContext | None = None,
+        completion: CompletionPolicy | None = None,
     ) -> AsyncGenerator[tuple[Any, ListTasksResponse], None]:
         async for source, response in self._transport.list_tasks(
-            request, context=context
+            request, context=context, completion=completion
         ):
             yield source, response
 
+    async def merged_list_tasks(
+        self,
+        request: ListTasksRequest,
+        *,
+        context: ClientCallContext | None = None,
+        key: Callable[[Task], Any] = status_timestamp_key,
+        descending: bool = True,
+    ) -> ListTasksResponse:
+        """Lists the tasks of all agents as one list sorted by ``key``.
+
+        Returns a page of ``request.page_size`` tasks merged from the agents'
+        pages, whose next_page_token continues the merged list. The first
+        pages are fetched with one multicast call and the following pages of
+        each agent over unicast channels, as the merge consumes them.
+        """
+        transport = self._transport
+        if transport.agent_names is None:
+            raise ValueError("merged_list_tasks needs the names of the group members")
+
+        async def fetch_first_pages(
+            first_request: ListTasksRequest,
+        ) -> dict[str, ListTasksResponse]:
+            return {
+                member_name(source): response
+                async for source, response in transport.list_tasks(
+                    first_request, context=context
+                )
+            }
+
+        return await merge_list_tasks(
+            transport.agent_names,
+            request,
+            lambda name, page_request: transport.list_member_tasks(
+                name, page_request, context=context
+            ),
+            fetch_first_pages,
+            key,
+            descending,
+        )
+
     async def cancel_task(
         self,
         request: CancelTaskRequest,
         *,
         context: ClientCallContext | None = None,
+        completion: CompletionPolicy | None = None,
     ) -> AsyncGenerator[tuple[Any, Task], None]:
         async for source, response in self._transport.cancel_task(
-            request, context=context
+            request, context=context, completion=completion
         ):
             yield source, response
 
@@ -554,9 +1392,10 @@ class MulticastClient:
         request: SubscribeToTaskRequest,
         *,
         context: ClientCallContext | None = None,
+        completion: CompletionPolicy | None = None,
     ) -> AsyncGenerator[tuple[Any, StreamResponse], None]:
         async for source, response in self._transport.subscribe(
-            request, context=context
+            request, context=context, completion=completion
         ):
             yield source, response
 
@@ -565,12 +1404,13 @@ class MulticastClient:
         request: TaskPushNotificationConfig,
         *,
         context: ClientCallContext | None = None,
+        completion: CompletionPolicy | None = None,
     ) -> AsyncGenerator[tuple[Any, TaskPushNotificationConfig], None]:
         async for (
             source,
             response,
         ) in self._transport.create_task_push_notification_config(
-            request, context=context
+            request, context=context, completion=completion
         ):
             yield source, response
 
@@ -579,9 +1419,10 @@ class MulticastClient:
         request: GetTaskPushNotificationConfigRequest,
         *,
         context: ClientCallContext | None = None,
+        completion: CompletionPolicy | None = None,
     ) -> AsyncGenerator[tuple[Any, TaskPushNotificationConfig], None]:
         async for source, response in self._transport.get_task_push_notification_config(
-            request, context=context
+            request, context=context, completion=completion
         ):
             yield source, response
 
@@ -590,12 +1431,13 @@ class MulticastClient:
         request: ListTaskPushNotificationConfigsRequest,
         *,
         context: ClientCallContext | None = None,
+        completion: CompletionPolicy | None = None,
     ) -> AsyncGenerator[tuple[Any, ListTaskPushNotificationConfigsResponse], None]:
         async for (
             source,
             response,
         ) in self._transport.list_task_push_notification_configs(
-            request, context=context
+            request, context=context, completion=completion
         ):
             yield source, response
 
@@ -604,12 +1446,13 @@ class MulticastClient:
         request: DeleteTaskPushNotificationConfigRequest,
         *,
         context: ClientCallContext | None = None,
+        completion: CompletionPolicy | None = None,
     ) -> AsyncGenerator[tuple[Any, None], None]:
         async for (
             source,
             response,
         ) in self._transport.delete_task_push_notification_config(
-            request, context=context
+            request, context=context, completion=completion
         ):
             yield source, response
 
@@ -618,9 +1461,10 @@ class MulticastClient:
         request: GetExtendedAgentCardRequest,
         *,
         context: ClientCallContext | None = None,
+        completion: CompletionPolicy | None = None,
     ) -> AsyncGenerator[tuple[Any, AgentCard], None]:
         async for source, response in self._transport.get_extended_agent_card(
-            request, context=context
+            request, context=context, completion=completion
         ):
             yield source, response
 
@@ -0,0 +1,174 @@
+# Copyright AGNTCY Contributors (https://github.com/agntcy)
+# SPDX-License-Identifier: Apache-2.0
+
+"""Coalescing of artifact update events on streaming responses."""
+
+import asyncio
+import contextlib
+from collections.abc import AsyncGenerator
+from dataclasses import dataclass
+
+from a2a.server.events import Event
+from a2a.types.a2a_pb2 import TaskArtifactUpdateEvent
+
+
+@dataclass
+class CoalescingStats:
+    """Counters describing the behaviour of an ArtifactUpdateCoalescer."""
+
+    events_in: int = 0
+    events_out: int = 0
+    merged: int = 0
+
+
+async def _next_event(stream: AsyncGenerator[Event]) -> Event:
+    return await stream.__anext__()
+
+
+def _can_merge(
+    pending: TaskArtifactUpdateEvent,
+    event: Event,
+) -> bool:
+    return (
+        isinstance(event, TaskArtifactUpdateEvent)
+        and event.append
+        and not event.HasField("metadata")
+        and event.task_id == pending.task_id
+        and event.context_id == pending.context_id
+        and event.artifact.artifact_id == pending.artifact.artifact_id
+    )
+
+
+def _parts_size(event: TaskArtifactUpdateEvent) -> int:
+    return sum(part.ByteSize() for part in event.artifact.parts)
+
+
+class ArtifactUpdateCoalescer:
+    """Merges consecutive append-style artifact updates of a stream.
+
+    Token-streaming agents emit many small ``TaskArtifactUpdateEvent``s with
+    ``append`` set, each sent as its own frame. The coalescer holds an artifact
+    update for up to ``max_delay`` seconds and folds the parts of following
+    appends to the same artifact into it, trading a little latency for fewer
+    frames. A merged update is flushed early when it reaches ``max_bytes`` of
+    parts or ``max_events`` merged events, when its last chunk arrives, or
+    when any other event is produced.
+
+    Example:
+        >>> coalescer = ArtifactUpdateCoalescer(max_delay=0.02)
+        >>> handler = SRPCHandler(agent_card, request_handler, stream_coalescer=coalescer)
+    """
+
+    def __init__(
+        self,
+        max_delay: float = 0.01,
+        max_bytes: int = 16 * 1024,
+        max_events: int = 64,
+    ) -> None:
+        """Initializes the ArtifactUpdateCoalescer.
+
+        Args:
+            max_delay: Seconds an artifact update may be held back.
+            max_bytes: Part bytes after which a merged update is flushed.
+            max_events: Number of events after which a merged update is flushed.
+        """
+        self.max_delay = max_delay
+        self.max_bytes = max_bytes
+        self.max_events = max_events
+        self.stats = CoalescingStats()
+
+    async def coalesce(self, stream: AsyncGenerator[Event]) -> AsyncGenerator[Event]:
+        """Yields the events of ``stream`` with artifact appends merged."""
+        events = self.coalesce_sources(stream)
+        try:
+            async for event, _ in events:
+                yield event
+        finally:
+            await events.aclose()
+
+    async def coalesce_sources(
+        self, stream: AsyncGenerator[Event]
+    ) -> AsyncGenerator[tuple[Event, Event]]:
+        """Like coalesce, also yielding the last event of ``stream`` in each event.
+
+        An event passed through unchanged is its own source. A merged update
+        is new and its source is the last append folded into it, e.g. to
+        give it the sequence number of that append.
+        """
+        loop = asyncio.get_running_loop()
+        pending: TaskArtifactUpdateEvent | None = None
+        # The last event of ``stream`` folded into ``pending``.
+        source = TaskArtifactUpdateEvent()
+        pending_events = 0
+        pending_bytes = 0
+        flush_at = 0.0
+        next_event: asyncio.Task[Event] | None = None
+        try:
+            while True:
+                if next_event is None:
+                    next_event = asyncio.create_task(_next_event(stream))
+                if pending is not None:
+                    done, _ = await asyncio.wait(
+                        {next_event}, timeout=max(flush_at - loop.time(), 0)
+                    )
+                    if not done:
+                        self.stats.events_out += 1
+                        yield pending, source
+                        pending = None
+                        continue
+
+                try:
+                    event = await next_event
+                except StopAsyncIteration:
+                    break
+                finally:
+                    next_event = None
+                self.stats.events_in += 1
+
+                if pending is not None and _can_merge(pending, event):
+                    assert isinstance(event, TaskArtifactUpdateEvent)
+                    if pending_events == 1:
+                        # Never mutate events that the request handler owns.
+                        merged = TaskArtifactUpdateEvent()
+                        merged.CopyFrom(pending)
+                        pending = merged
+                    pending.artifact.parts.extend(event.artifact.parts)
+                    pending.last_chunk = event.last_chunk
+                    source = event
+                    pending_events += 1
+                    pending_bytes += _parts_size(event)
+                    self.stats.merged += 1
+                    if (
+                        event.last_chunk
+                        or pending_bytes >= self.max_bytes
+                        or pending_events >= self.max_events
+                    ):
+                        self.stats.events_out += 1
+                        yield pending, source
+                        pending = None
+                    continue
+
+                if pending is not None:
+                    self.stats.events_out += 1
+                    yield pending, source
+                    pending = None
+
+                if isinstance(event, TaskArtifactUpdateEvent) and not event.last_chunk:
+                    pending = source = event
+                    pending_events = 1
+                    pending_bytes = _parts_size(event)
+                    flush_at = loop.time() + self.max_delay
+                    continue
+
+                self.stats.events_out += 1
+                yield event, event
+
+            if pending is not None:
+                self.stats.events_out += 1
+                yield pending, source
+        finally:
+            if next_event is not None:
+                next_event.cancel()
+                with contextlib.suppress(asyncio.CancelledError, StopAsyncIteration):
+                    await next_event
+            await stream.aclose()
@@ -4,6 +4,7 @@
 import logging
 from collections.abc import AsyncGenerator
 from dataclasses import dataclass
+from datetime import timedelta
 from typing import Callable
 
 import slim_bindings
@@ -15,11 +16,13 @@ from a2a.compat.v0_3 import (
     conversions,
     proto_utils,
 )
-from a2a.compat.v0_3 import types as types_v03
 from a2a.types import a2a_pb2
 from a2a.utils.constants import PROTOCOL_VERSION_0_3, VERSION_HEADER
 from a2a.utils.telemetry import SpanKind, trace_class
 
+from slima2a.card_cache import AgentCardCache
+from slima2a.client_transport import close_channel
+from slima2a.compat.v3_0 import proto_conversions
 from slima2a.types.v0 import a2a_pb2_slimrpc
 
 logger = logging.getLogger(__name__)
@@ -28,6 +31,10 @@ logger = logging.getLogger(__name__)
 @dataclass
 class ClientConfig(A2AClientConfig):
     slimrpc_channel_factory: Callable[[str], slim_bindings.Channel] | None = None
+    slimrpc_default_timeout: float | None = None
+    """Default deadline in seconds for slimrpc calls without a context timeout."""
+    slimrpc_card_cache: AgentCardCache | None = None
+    """Cache shared by transports fetching agent cards, e.g. shared_agent_card_cache()."""
 
 
 @trace_class(kind=SpanKind.CLIENT)
@@ -38,10 +45,18 @@ class SRPCCompatTransport(ClientTransport):
         self,
         channel: slim_bindings.Channel,
         agent_card: a2a_pb2.AgentCard | None,
+        default_timeout: float | None = None,
+        url: str | None = None,
+        card_cache: AgentCardCache | None = None,
+        owns_channel: bool = False,
     ) -> None:
         """Initializes the SRPCCompatTransport."""
         self.agent_card = agent_card
+        self.owns_channel = owns_channel
         self.channel = channel
+        self.default_timeout = default_timeout
+        self.url = url
+        self.card_cache = card_cache
         self.stub = a2a_pb2_slimrpc.A2AServiceStub(channel)
 
     @classmethod
@@ -55,7 +70,14 @@ class SRPCCompatTransport(ClientTransport):
         if config.slimrpc_channel_factory is None:
             raise ValueError("slimrpc_channel_factory is required when using sRPC")
         channel = config.slimrpc_channel_factory(url)
-        return cls(channel, card)
+        return cls(
+            channel,
+            card,
+            config.slimrpc_default_timeout,
+            url=url,
+            card_cache=config.slimrpc_card_cache,
+            owns_channel=True,
+        )
 
     def _get_metadata(self, context: ClientCallContext | None = None) -> dict[str, str]:
         """Creates SlimRPC metadata for the request."""
@@ -65,6 +87,17 @@ class SRPCCompatTransport(ClientTransport):
                 metadata[key] = value
         return metadata
 
+    def _get_timeout(
+        self, context: ClientCallContext | None = None
+    ) -> timedelta | None:
+        """Returns the deadline for the request, preferring the context timeout."""
+        timeout = self.default_timeout
+        if context and context.timeout is not None:
+            timeout = context.timeout
+        if timeout is None:
+            return None
+        return timedelta(seconds=timeout)
+
     async def send_message(
         self,
         request: a2a_pb2.SendMessageRequest,
@@ -72,32 +105,13 @@ class SRPCCompatTransport(ClientTransport):
         context: ClientCallContext | None = None,
     ) -> a2a_pb2.SendMessageResponse:
         """Sends a non-streaming message request to the agent (v0.3)."""
-        req_v03 = conversions.to_compat_send_message_request(request, request_id=0)
-        req_proto = a2a_v0_3_pb2.SendMessageRequest(
-            request=proto_utils.ToProto.message(req_v03.params.message),
-            configuration=proto_utils.ToProto.message_send_configuration(
-                req_v03.params.configuration
-            ),
-            metadata=proto_utils.ToProto.metadata(req_v03.params.metadata),
-        )
+        req_proto = proto_conversions.to_compat_send_message_request(request)
         resp_proto = await self.stub.SendMessage(
             req_proto,
+            timeout=self._get_timeout(context),
             metadata=self._get_metadata(context),
         )
-        which = resp_proto.WhichOneof("payload")
-        if which == "task":
-            return a2a_pb2.SendMessageResponse(
-                task=conversions.to_core_task(
-                    proto_utils.FromProto.task(resp_proto.task)
-                )
-            )
-        if which == "msg":
-            return a2a_pb2.SendMessageResponse(
-                message=conversions.to_core_message(
-                    proto_utils.FromProto.message(resp_proto.msg)
-                )
-            )
-        return a2a_pb2.SendMessageResponse()
+        return proto_conversions.to_core_send_message_response(resp_proto)
 
     async def send_message_streaming(
         self,
@@ -106,23 +120,13 @@ class SRPCCompatTransport(ClientTransport):
         context: ClientCallContext | None = None,
     ) -> AsyncGenerator[a2a_pb2.StreamResponse, None]:
         """Sends a streaming message request to the agent (v0.3)."""
-        req_v03 = conversions.to_compat_send_message_request(request, request_id=0)
-        req_proto = a2a_v0_3_pb2.SendMessageRequest(
-            request=proto_utils.ToProto.message(req_v03.params.message),
-            configuration=proto_utils.ToProto.message_send_configuration(
-                req_v03.params.configuration
-            ),
-            metadata=proto_utils.ToProto.metadata(req_v03.params.metadata),
-        )
+        req_proto = proto_conversions.to_compat_send_message_request(request)
         async for response in self.stub.SendStreamingMessage(
             req_proto,
+            timeout=self._get_timeout(context),
             metadata=self._get_metadata(context),
         ):
-            yield conversions.to_core_stream_response(
-                types_v03.SendStreamingMessageSuccessResponse(
-                    result=proto_utils.FromProto.stream_response(response)
-                )
-            )
+            yield proto_conversions.to_core_stream_response(response)
 
     async def subscribe(
         self,
@@ -134,13 +138,10 @@ class SRPCCompatTransport(ClientTransport):
         req_proto = a2a_v0_3_pb2.TaskSubscriptionRequest(name=f"tasks/{request.id}")
         async for response in self.stub.TaskSubscription(
             req_proto,
+            timeout=self._get_timeout(context),
             metadata=self._get_metadata(context),
         ):
-            yield conversions.to_core_stream_response(
-                types_v03.SendStreamingMessageSuccessResponse(
-                    result=proto_utils.FromProto.stream_response(response)
-                )
-            )
+            yield proto_conversions.to_core_stream_response(response)
 
     async def get_task(
         self,
@@ -155,9 +156,10 @@ class SRPCCompatTransport(ClientTransport):
         )
         resp_proto = await self.stub.GetTask(
             req_proto,
+            timeout=self._get_timeout(context),
             metadata=self._get_metadata(context),
         )
-        return conversions.to_core_task(proto_utils.FromProto.task(resp_proto))
+        return proto_conversions.to_core_task(resp_proto)
 
     async def list_tasks(
         self,
@@ -178,9 +180,10 @@ class SRPCCompatTransport(ClientTransport):
         req_proto = a2a_v0_3_pb2.CancelTaskRequest(name=f"tasks/{request.id}")
         resp_proto = await self.stub.CancelTask(
             req_proto,
+            timeout=self._get_timeout(context),
             metadata=self._get_metadata(context),
         )
-        return conversions.to_core_task(proto_utils.FromProto.task(resp_proto))
+        return proto_conversions.to_core_task(resp_proto)
 
     async def create_task_push_notification_config(
         self,
@@ -199,6 +202,7 @@ class SRPCCompatTransport(ClientTransport):
         )
         resp_proto = await self.stub.CreateTaskPushNotificationConfig(
             req_proto,
+            timeout=self._get_timeout(context),
             metadata=self._get_metadata(context),
         )
         return conversions.to_core_task_push_notification_config(
@@ -217,6 +221,7 @@ class SRPCCompatTransport(ClientTransport):
         )
         resp_proto = await self.stub.GetTaskPushNotificationConfig(
             req_proto,
+            timeout=self._get_timeout(context),
             metadata=self._get_metadata(context),
         )
         return conversions.to_core_task_push_notification_config(
@@ -235,6 +240,7 @@ class SRPCCompatTransport(ClientTransport):
         )
         resp_proto = await self.stub.ListTaskPushNotificationConfig(
             req_proto,
+            timeout=self._get_timeout(context),
             metadata=self._get_metadata(context),
         )
         return conversions.to_core_list_task_push_notification_config_response(
@@ -255,6 +261,7 @@ class SRPCCompatTransport(ClientTransport):
         )
         await self.stub.DeleteTaskPushNotificationConfig(
             req_proto,
+            timeout=self._get_timeout(context),
             metadata=self._get_metadata(context),
         )
 
@@ -265,17 +272,29 @@ class SRPCCompatTransport(ClientTransport):
         context: ClientCallContext | None = None,
     ) -> a2a_pb2.AgentCard:
         """Retrieves the agent's card (v0.3)."""
-        req_proto = a2a_v0_3_pb2.GetAgentCardRequest()
-        resp_proto = await self.stub.GetAgentCard(
-            req_proto,
-            metadata=self._get_metadata(context),
-        )
-        card = conversions.to_core_agent_card(
-            proto_utils.FromProto.agent_card(resp_proto)
-        )
+        metadata = self._get_metadata(context)
+
+        async def fetch() -> a2a_pb2.AgentCard:
+            req_proto = a2a_v0_3_pb2.GetAgentCardRequest()
+            resp_proto = await self.stub.GetAgentCard(
+                req_proto,
+                timeout=self._get_timeout(context),
+                metadata=metadata,
+            )
+            return conversions.to_core_agent_card(
+                proto_utils.FromProto.agent_card(resp_proto)
+            )
+
+        if self.card_cache is None or self.url is None:
+            card = await fetch()
+        else:
+            card = await self.card_cache.get_or_fetch(
+                self.url, fetch, PROTOCOL_VERSION_0_3, metadata=metadata
+            )
         self.agent_card = card
         return card
 
     async def close(self) -> None:
         """Closes the transport and releases any resources."""
-        pass
+        if self.owns_channel:
+            await close_channel(self.channel)
@@ -19,6 +19,7 @@ from a2a.extensions.common import HTTP_EXTENSION_HEADER, get_requested_extension
 from a2a.server.context import ServerCallContext
 from a2a.server.request_handlers.request_handler import RequestHandler
 from a2a.types.a2a_pb2 import AgentCard
+from a2a.utils.constants import PROTOCOL_VERSION_0_3
 from a2a.utils.errors import (
     A2AError,
     ContentTypeNotSupportedError,
@@ -35,6 +36,9 @@ from a2a.utils.errors import (
 from google.protobuf import empty_pb2
 from google.rpc import code_pb2
 
+from slima2a.card_cache import SerializedCardCache
+from slima2a.compat.v3_0 import proto_conversions
+from slima2a.registration import register_servicer
 from slima2a.types.v0 import a2a_pb2_slimrpc
 
 logger = logging.getLogger(__name__)
@@ -55,6 +59,12 @@ _SLIM_ERROR_CODE_MAP: dict[type[A2AError], int] = {
 }
 
 
+def _serialize_compat_agent_card(card: AgentCard) -> bytes:
+    return proto_utils.ToProto.agent_card(
+        conversions.to_compat_agent_card(card)
+    ).SerializeToString()
+
+
 def get_metadata_value(context: slim_bindings.Context, key: str) -> str:
     """Extract metadata value from slim_bindings context."""
     return context.metadata().get(key, "")
@@ -93,6 +103,7 @@ class SRPCCompatHandler(a2a_pb2_slimrpc.A2AServiceServicer):
         request_handler: RequestHandler,
         context_builder: CallContextBuilder | None = None,
         card_modifier: Callable[[AgentCard], AgentCard] | None = None,
+        card_cache: SerializedCardCache | None = None,
     ) -> None:
         """Initializes the SRPCCompatHandler.
 
@@ -101,11 +112,15 @@ class SRPCCompatHandler(a2a_pb2_slimrpc.A2AServiceServicer):
             request_handler: The underlying v1.0 RequestHandler instance.
             context_builder: The CallContextBuilder object.
             card_modifier: An optional callback to modify the agent card.
+            card_cache: The SerializedCardCache holding the served card. May be
+                        shared with the v1 SRPCHandler of the same agent.
         """
         self.agent_card = agent_card
+        self.request_handler = request_handler
         self.handler03 = RequestHandler03(request_handler=request_handler)
         self.context_builder = context_builder or DefaultCallContextBuilder()
         self.card_modifier = card_modifier
+        self.card_cache = card_cache or SerializedCardCache()
 
     async def raise_error_response(self, error: A2AError) -> None:
         """Raises SlimRPC errors appropriately."""
@@ -124,17 +139,11 @@ class SRPCCompatHandler(a2a_pb2_slimrpc.A2AServiceServicer):
         """Handles the 'SendMessage' SlimRPC method (v0.3)."""
         try:
             server_context = self.context_builder.build(context)
-            req_v03 = types_v03.SendMessageRequest(
-                id=0, params=proto_utils.FromProto.message_send_params(request)
-            )
-            result = await self.handler03.on_message_send(req_v03, server_context)
-            if isinstance(result, types_v03.Task):
-                return a2a_v0_3_pb2.SendMessageResponse(
-                    task=proto_utils.ToProto.task(result)
-                )
-            return a2a_v0_3_pb2.SendMessageResponse(
-                msg=proto_utils.ToProto.message(result)
+            result = await self.request_handler.on_message_send(
+                proto_conversions.to_core_send_message_request(request),
+                server_context,
             )
+            return proto_conversions.to_compat_send_message_response(result)
         except A2AError as e:
             await self.raise_error_response(e)
         return a2a_v0_3_pb2.SendMessageResponse()
@@ -147,13 +156,11 @@ class SRPCCompatHandler(a2a_pb2_slimrpc.A2AServiceServicer):
         """Handles the 'SendStreamingMessage' SlimRPC method (v0.3)."""
         try:
             server_context = self.context_builder.build(context)
-            req_v03 = types_v03.SendMessageRequest(
-                id=0, params=proto_utils.FromProto.message_send_params(request)
-            )
-            async for v03_stream_resp in self.handler03.on_message_send_stream(
-                req_v03, server_context
+            async for event in self.request_handler.on_message_send_stream(
+                proto_conversions.to_core_send_message_request(request),
+                server_context,
             ):
-                yield proto_utils.ToProto.stream_response(v03_stream_resp.result)
+                yield proto_conversions.to_compat_stream_response(event)
         except A2AError as e:
             await self.raise_error_response(e)
 
@@ -165,11 +172,12 @@ class SRPCCompatHandler(a2a_pb2_slimrpc.A2AServiceServicer):
         """Handles the 'GetTask' SlimRPC method (v0.3)."""
         try:
             server_context = self.context_builder.build(context)
-            req_v03 = types_v03.GetTaskRequest(
-                id=0, params=proto_utils.FromProto.task_query_params(request)
+            task = await self.request_handler.on_get_task(
+                proto_conversions.to_core_get_task_request(request), server_context
             )
-            task = await self.handler03.on_get_task(req_v03, server_context)
-            return proto_utils.ToProto.task(task)
+            if task is None:
+                raise TaskNotFoundError
+            return proto_conversions.to_compat_task(task)
         except A2AError as e:
             await self.raise_error_response(e)
         return a2a_v0_3_pb2.Task()
@@ -182,11 +190,13 @@ class SRPCCompatHandler(a2a_pb2_slimrpc.A2AServiceServicer):
         """Handles the 'CancelTask' SlimRPC method (v0.3)."""
         try:
             server_context = self.context_builder.build(context)
-            req_v03 = types_v03.CancelTaskRequest(
-                id=0, params=proto_utils.FromProto.task_id_params(request)
+            task = await self.request_handler.on_cancel_task(
+                proto_conversions.to_core_cancel_task_request(request),
+                server_context,
             )
-            task = await self.handler03.on_cancel_task(req_v03, server_context)
-            return proto_utils.ToProto.task(task)
+            if task is None:
+                raise TaskNotFoundError
+            return proto_conversions.to_compat_task(task)
         except A2AError as e:
             await self.raise_error_response(e)
         return a2a_v0_3_pb2.Task()
@@ -199,13 +209,11 @@ class SRPCCompatHandler(a2a_pb2_slimrpc.A2AServiceServicer):
         """Handles the 'TaskSubscription' SlimRPC method (v0.3)."""
         try:
             server_context = self.context_builder.build(context)
-            req_v03 = types_v03.TaskResubscriptionRequest(
-                id=0, params=proto_utils.FromProto.task_id_params(request)
-            )
-            async for v03_stream_resp in self.handler03.on_subscribe_to_task(
-                req_v03, server_context
+            async for event in self.request_handler.on_subscribe_to_task(
+                proto_conversions.to_core_subscribe_to_task_request(request),
+                server_context,
             ):
-                yield proto_utils.ToProto.stream_response(v03_stream_resp.result)
+                yield proto_conversions.to_compat_stream_response(event)
         except A2AError as e:
             await self.raise_error_response(e)
 
@@ -293,6 +301,15 @@ class SRPCCompatHandler(a2a_pb2_slimrpc.A2AServiceServicer):
             conversions.to_compat_agent_card(card_to_serve)
         )
 
+    def serialized_agent_card(self) -> bytes:
+        """Returns the serialized v0.3 agent card, served from card_cache."""
+        return self.card_cache.get(
+            PROTOCOL_VERSION_0_3,
+            self.agent_card,
+            self.card_modifier,
+            _serialize_compat_agent_card,
+        )
+
     async def DeleteTaskPushNotificationConfig(
         self,
         request: a2a_v0_3_pb2.DeleteTaskPushNotificationConfigRequest,
@@ -331,3 +348,38 @@ def _extract_task_and_config_id(resource_name: str) -> tuple[str, str]:
     if not m:
         raise InvalidParamsError(message=f"Bad resource name {resource_name}")
     return m.group(1), m.group(2)
+
+
+class _GetAgentCardHandler(slim_bindings.UnaryUnaryHandler):
+    """Answers 'GetAgentCard' with the cached serialized v0.3 card."""
+
+    def __init__(self, servicer: SRPCCompatHandler) -> None:
+        self.servicer = servicer
+
+    async def handle(self, request: bytes, context: slim_bindings.Context) -> bytes:
+        try:
+            return self.servicer.serialized_agent_card()
+        except slim_bindings.RpcError:
+            raise
+        except Exception as e:
+            raise SlimRPCError(
+                code=code_pb2.INTERNAL, message=str(e), details=None
+            ) from e
+
+
+def add_SRPCCompatHandler_to_server(
+    handler: SRPCCompatHandler,
+    server: slim_bindings.Server,
+) -> None:
+    """Registers an SRPCCompatHandler with a slimrpc server.
+
+    Unlike the generated ``add_A2AServiceServicer_to_server``, the agent card is
+    answered from the handler's SerializedCardCache without converting and
+    re-serializing it on every call.
+    """
+    register_servicer(
+        a2a_pb2_slimrpc.add_A2AServiceServicer_to_server,
+        handler,
+        server,
+        unary_unary={"GetAgentCard": _GetAgentCardHandler(handler)},
+    )
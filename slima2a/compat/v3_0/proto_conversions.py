@@ -0,0 +1,407 @@
+# Copyright AGNTCY Contributors (https://github.com/agntcy)
+# SPDX-License-Identifier: Apache-2.0
+
+"""Direct conversions between A2A v0.3 and v1.0 protobuf messages.
+
+The SDK converts v0.3 protobuf messages to pydantic models and then to v1.0
+protobuf messages (and back). The functions below map the fields of both
+protobuf schemas onto each other instead, which avoids building an
+intermediate object graph for every message.
+
+The mapping follows ``a2a.compat.v0_3.conversions`` and
+``a2a.compat.v0_3.proto_utils``, with two exceptions: status timestamps are
+kept, and a missing status message stays missing instead of becoming an empty
+message.
+"""
+
+import base64
+
+from a2a.compat.v0_3 import a2a_v0_3_pb2, proto_utils
+from a2a.server.events import Event
+from a2a.types import a2a_pb2
+from a2a.utils.errors import InvalidParamsError
+from google.protobuf import struct_pb2
+
+_DATA_PART_COMPAT = "data_part_compat"
+"""Metadata key marking a v0.3 DataPart that wraps a non-object v1.0 value."""
+
+_FINAL_STATES = frozenset(
+    {
+        a2a_pb2.TASK_STATE_COMPLETED,
+        a2a_pb2.TASK_STATE_CANCELED,
+        a2a_pb2.TASK_STATE_FAILED,
+        a2a_pb2.TASK_STATE_REJECTED,
+    }
+)
+
+# Both TaskState enums use the same numbers, only some names differ.
+_TASK_STATES = frozenset(a2a_pb2.TaskState.values())
+
+
+def _task_state(state: int) -> int:
+    return state if state in _TASK_STATES else a2a_pb2.TASK_STATE_UNSPECIFIED
+
+
+def _role(role: int) -> int:
+    # v0.3 has no unspecified role, the SDK reads it as the agent.
+    return a2a_pb2.ROLE_USER if role == a2a_pb2.ROLE_USER else a2a_pb2.ROLE_AGENT
+
+
+def _copy_metadata(src: struct_pb2.Struct, dst: struct_pb2.Struct) -> None:
+    if src.fields:
+        dst.CopyFrom(src)
+
+
+def _task_id(name: str) -> str:
+    m = proto_utils.TASK_NAME_MATCH.match(name)
+    if not m:
+        raise InvalidParamsError(message=f"No task for {name}")
+    return m.group(1)
+
+
+# v0.3 -> v1.0
+
+
+def _fill_core_part(src: a2a_v0_3_pb2.Part, dst: a2a_pb2.Part) -> None:
+    which = src.WhichOneof("part")
+    if which == "text":
+        dst.text = src.text
+        _copy_metadata(src.metadata, dst.metadata)
+    elif which == "file":
+        file = src.file
+        if file.HasField("file_with_uri"):
+            dst.url = file.file_with_uri
+        else:
+            dst.raw = base64.b64decode(file.file_with_bytes)
+        if file.mime_type:
+            dst.media_type = file.mime_type
+        if file.name:
+            dst.filename = file.name
+        _copy_metadata(src.metadata, dst.metadata)
+    elif which == "data":
+        compat = src.metadata.fields.get(_DATA_PART_COMPAT)
+        if compat is None:
+            _copy_metadata(src.metadata, dst.metadata)
+        else:
+            dst.metadata.CopyFrom(src.metadata)
+            del dst.metadata.fields[_DATA_PART_COMPAT]
+            if not dst.metadata.fields:
+                dst.ClearField("metadata")
+        if compat is not None and compat.bool_value:
+            dst.data.CopyFrom(src.data.data.fields["value"])
+        else:
+            dst.data.struct_value.CopyFrom(src.data.data)
+    else:
+        raise ValueError(f"Unsupported part type: {src}")
+
+
+def _fill_core_message(src: a2a_v0_3_pb2.Message, dst: a2a_pb2.Message) -> None:
+    dst.message_id = src.message_id
+    dst.context_id = src.context_id
+    dst.task_id = src.task_id
+    dst.role = _role(src.role)  # type: ignore[assignment]
+    _copy_metadata(src.metadata, dst.metadata)
+    dst.extensions.extend(src.extensions)
+    for part in src.content:
+        _fill_core_part(part, dst.parts.add())
+
+
+def _fill_core_task_status(
+    src: a2a_v0_3_pb2.TaskStatus, dst: a2a_pb2.TaskStatus
+) -> None:
+    dst.state = _task_state(src.state)  # type: ignore[assignment]
+    if src.HasField("update"):
+        _fill_core_message(src.update, dst.message)
+    if src.HasField("timestamp"):
+        dst.timestamp.CopyFrom(src.timestamp)
+
+
+def _fill_core_artifact(src: a2a_v0_3_pb2.Artifact, dst: a2a_pb2.Artifact) -> None:
+    dst.artifact_id = src.artifact_id
+    dst.name = src.name
+    dst.description = src.description
+    for part in src.parts:
+        _fill_core_part(part, dst.parts.add())
+    _copy_metadata(src.metadata, dst.metadata)
+    dst.extensions.extend(src.extensions)
+
+
+def _fill_core_task(src: a2a_v0_3_pb2.Task, dst: a2a_pb2.Task) -> None:
+    dst.id = src.id
+    dst.context_id = src.context_id
+    _fill_core_task_status(src.status, dst.status)
+    for message in src.history:
+        _fill_core_message(message, dst.history.add())
+    for artifact in src.artifacts:
+        _fill_core_artifact(artifact, dst.artifacts.add())
+    _copy_metadata(src.metadata, dst.metadata)
+
+
+def to_core_message(message: a2a_v0_3_pb2.Message) -> a2a_pb2.Message:
+    """Converts a v0.3 Message to a v1.0 Message."""
+    core = a2a_pb2.Message()
+    _fill_core_message(message, core)
+    return core
+
+
+def to_core_task(task: a2a_v0_3_pb2.Task) -> a2a_pb2.Task:
+    """Converts a v0.3 Task to a v1.0 Task."""
+    core = a2a_pb2.Task()
+    _fill_core_task(task, core)
+    return core
+
+
+def to_core_send_message_request(
+    request: a2a_v0_3_pb2.SendMessageRequest,
+) -> a2a_pb2.SendMessageRequest:
+    """Converts a v0.3 SendMessageRequest to a v1.0 SendMessageRequest."""
+    core = a2a_pb2.SendMessageRequest()
+    _fill_core_message(request.request, core.message)
+
+    config = request.configuration
+    core_config = core.configuration
+    core_config.accepted_output_modes.extend(config.accepted_output_modes)
+    if config.HasField("push_notification"):
+        push = config.push_notification
+        core_push = core_config.task_push_notification_config
+        core_push.url = push.url
+        core_push.id = push.id
+        core_push.token = push.token
+        if push.HasField("authentication"):
+            if push.authentication.schemes:
+                core_push.authentication.scheme = push.authentication.schemes[0]
+            core_push.authentication.credentials = push.authentication.credentials
+    # v0.3 cannot tell an unset history_length or blocking from 0 and False,
+    # the SDK forwards both as given.
+    core_config.history_length = config.history_length
+    core_config.return_immediately = not config.blocking
+
+    _copy_metadata(request.metadata, core.metadata)
+    return core
+
+
+def to_core_send_message_response(
+    response: a2a_v0_3_pb2.SendMessageResponse,
+) -> a2a_pb2.SendMessageResponse:
+    """Converts a v0.3 SendMessageResponse to a v1.0 SendMessageResponse."""
+    core = a2a_pb2.SendMessageResponse()
+    which = response.WhichOneof("payload")
+    if which == "task":
+        _fill_core_task(response.task, core.task)
+    elif which == "msg":
+        _fill_core_message(response.msg, core.message)
+    return core
+
+
+def to_core_stream_response(
+    response: a2a_v0_3_pb2.StreamResponse,
+) -> a2a_pb2.StreamResponse:
+    """Converts a v0.3 StreamResponse to a v1.0 StreamResponse."""
+    core = a2a_pb2.StreamResponse()
+    which = response.WhichOneof("payload")
+    if which == "msg":
+        _fill_core_message(response.msg, core.message)
+    elif which == "task":
+        _fill_core_task(response.task, core.task)
+    elif which == "status_update":
+        src_status = response.status_update
+        dst_status = core.status_update
+        dst_status.task_id = src_status.task_id
+        dst_status.context_id = src_status.context_id
+        _fill_core_task_status(src_status.status, dst_status.status)
+        _copy_metadata(src_status.metadata, dst_status.metadata)
+    elif which == "artifact_update":
+        src_artifact = response.artifact_update
+        dst_artifact = core.artifact_update
+        dst_artifact.task_id = src_artifact.task_id
+        dst_artifact.context_id = src_artifact.context_id
+        _fill_core_artifact(src_artifact.artifact, dst_artifact.artifact)
+        dst_artifact.append = src_artifact.append
+        dst_artifact.last_chunk = src_artifact.last_chunk
+        _copy_metadata(src_artifact.metadata, dst_artifact.metadata)
+    else:
+        raise ValueError("Unsupported StreamResponse type")
+    return core
+
+
+def to_core_get_task_request(
+    request: a2a_v0_3_pb2.GetTaskRequest,
+) -> a2a_pb2.GetTaskRequest:
+    """Converts a v0.3 GetTaskRequest to a v1.0 GetTaskRequest."""
+    core = a2a_pb2.GetTaskRequest(id=_task_id(request.name))
+    if request.history_length:
+        core.history_length = request.history_length
+    return core
+
+
+def to_core_cancel_task_request(
+    request: a2a_v0_3_pb2.CancelTaskRequest,
+) -> a2a_pb2.CancelTaskRequest:
+    """Converts a v0.3 CancelTaskRequest to a v1.0 CancelTaskRequest."""
+    return a2a_pb2.CancelTaskRequest(id=_task_id(request.name))
+
+
+def to_core_subscribe_to_task_request(
+    request: a2a_v0_3_pb2.TaskSubscriptionRequest,
+) -> a2a_pb2.SubscribeToTaskRequest:
+    """Converts a v0.3 TaskSubscriptionRequest to a v1.0 SubscribeToTaskRequest."""
+    return a2a_pb2.SubscribeToTaskRequest(id=_task_id(request.name))
+
+
+# v1.0 -> v0.3
+
+
+def _fill_compat_part(src: a2a_pb2.Part, dst: a2a_v0_3_pb2.Part) -> None:
+    which = src.WhichOneof("content")
+    if which == "text":
+        dst.text = src.text
+    elif which == "data":
+        if src.data.WhichOneof("kind") == "struct_value":
+            dst.data.data.CopyFrom(src.data.struct_value)
+        else:
+            dst.data.data.fields["value"].CopyFrom(src.data)
+            dst.metadata.fields[_DATA_PART_COMPAT].bool_value = True
+    elif which == "raw":
+        dst.file.file_with_bytes = base64.b64encode(src.raw)
+        dst.file.mime_type = src.media_type
+        dst.file.name = src.filename
+    elif which == "url":
+        dst.file.file_with_uri = src.url
+        dst.file.mime_type = src.media_type
+        dst.file.name = src.filename
+    else:
+        raise ValueError(f"Unknown part content type: {which}")
+    if src.HasField("metadata"):
+        dst.metadata.MergeFrom(src.metadata)
+
+
+def _fill_compat_message(src: a2a_pb2.Message, dst: a2a_v0_3_pb2.Message) -> None:
+    dst.message_id = src.message_id
+    dst.context_id = src.context_id
+    dst.task_id = src.task_id
+    dst.role = _role(src.role)  # type: ignore[assignment]
+    _copy_metadata(src.metadata, dst.metadata)
+    dst.extensions.extend(src.extensions)
+    for part in src.parts:
+        _fill_compat_part(part, dst.content.add())
+
+
+def _fill_compat_task_status(
+    src: a2a_pb2.TaskStatus, dst: a2a_v0_3_pb2.TaskStatus
+) -> None:
+    dst.state = _task_state(src.state)  # type: ignore[assignment]
+    if src.HasField("message"):
+        _fill_compat_message(src.message, dst.update)
+    if src.HasField("timestamp"):
+        dst.timestamp.CopyFrom(src.timestamp)
+
+
+def _fill_compat_artifact(src: a2a_pb2.Artifact, dst: a2a_v0_3_pb2.Artifact) -> None:
+    dst.artifact_id = src.artifact_id
+    dst.name = src.name
+    dst.description = src.description
+    for part in src.parts:
+        _fill_compat_part(part, dst.parts.add())
+    if src.HasField("metadata"):
+        dst.metadata.CopyFrom(src.metadata)
+    dst.extensions.extend(src.extensions)
+
+
+def _fill_compat_task(src: a2a_pb2.Task, dst: a2a_v0_3_pb2.Task) -> None:
+    dst.id = src.id
+    dst.context_id = src.context_id
+    _fill_compat_task_status(src.status, dst.status)
+    for artifact in src.artifacts:
+        _fill_compat_artifact(artifact, dst.artifacts.add())
+    for message in src.history:
+        _fill_compat_message(message, dst.history.add())
+    if src.HasField("metadata"):
+        dst.metadata.CopyFrom(src.metadata)
+
+
+def to_compat_message(message: a2a_pb2.Message) -> a2a_v0_3_pb2.Message:
+    """Converts a v1.0 Message to a v0.3 Message."""
+    compat = a2a_v0_3_pb2.Message()
+    _fill_compat_message(message, compat)
+    return compat
+
+
+def to_compat_task(task: a2a_pb2.Task) -> a2a_v0_3_pb2.Task:
+    """Converts a v1.0 Task to a v0.3 Task."""
+    compat = a2a_v0_3_pb2.Task()
+    _fill_compat_task(task, compat)
+    return compat
+
+
+def to_compat_send_message_request(
+    request: a2a_pb2.SendMessageRequest,
+) -> a2a_v0_3_pb2.SendMessageRequest:
+    """Converts a v1.0 SendMessageRequest to a v0.3 SendMessageRequest."""
+    compat = a2a_v0_3_pb2.SendMessageRequest()
+    _fill_compat_message(request.message, compat.request)
+
+    compat_config = compat.configuration
+    compat_config.SetInParent()
+    if request.HasField("configuration"):
+        config = request.configuration
+        compat_config.accepted_output_modes.extend(config.accepted_output_modes)
+        if config.HasField("task_push_notification_config"):
+            push = config.task_push_notification_config
+            compat_push = compat_config.push_notification
+            compat_push.id = push.id
+            compat_push.url = push.url
+            compat_push.token = push.token
+            if push.HasField("authentication"):
+                if push.authentication.scheme:
+                    compat_push.authentication.schemes.append(
+                        push.authentication.scheme
+                    )
+                compat_push.authentication.credentials = push.authentication.credentials
+        if config.HasField("history_length"):
+            compat_config.history_length = config.history_length
+        compat_config.blocking = not config.return_immediately
+
+    if request.HasField("metadata"):
+        compat.metadata.CopyFrom(request.metadata)
+    return compat
+
+
+def to_compat_send_message_response(
+    response: a2a_pb2.Task | a2a_pb2.Message,
+) -> a2a_v0_3_pb2.SendMessageResponse:
+    """Converts the result of a v1.0 SendMessage to a v0.3 SendMessageResponse."""
+    compat = a2a_v0_3_pb2.SendMessageResponse()
+    if isinstance(response, a2a_pb2.Task):
+        _fill_compat_task(response, compat.task)
+    else:
+        _fill_compat_message(response, compat.msg)
+    return compat
+
+
+def to_compat_stream_response(event: Event) -> a2a_v0_3_pb2.StreamResponse:
+    """Converts an event of a v1.0 stream to a v0.3 StreamResponse."""
+    compat = a2a_v0_3_pb2.StreamResponse()
+    if isinstance(event, a2a_pb2.Message):
+        _fill_compat_message(event, compat.msg)
+    elif isinstance(event, a2a_pb2.Task):
+        _fill_compat_task(event, compat.task)
+    elif isinstance(event, a2a_pb2.TaskStatusUpdateEvent):
+        status = compat.status_update
+        status.task_id = event.task_id
+        status.context_id = event.context_id
+        _fill_compat_task_status(event.status, status.status)
+        status.final = event.status.state in _FINAL_STATES
+        if event.HasField("metadata"):
+            status.metadata.CopyFrom(event.metadata)
+    elif isinstance(event, a2a_pb2.TaskArtifactUpdateEvent):
+        artifact = compat.artifact_update
+        artifact.task_id = event.task_id
+        artifact.context_id = event.context_id
+        _fill_compat_artifact(event.artifact, artifact.artifact)
+        artifact.append = event.append
+        artifact.last_chunk = event.last_chunk
+        if event.HasField("metadata"):
+            artifact.metadata.CopyFrom(event.metadata)
+    else:
+        raise TypeError(f"Unknown stream response event type: {type(event)}")
+    return compat
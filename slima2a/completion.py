@@ -0,0 +1,231 @@
+# Copyright AGNTCY Contributors (https://github.com/agntcy)
+# SPDX-License-Identifier: Apache-2.0
+
+"""Completion policies deciding when a multicast call stops waiting."""
+
+import asyncio
+import contextlib
+from collections.abc import AsyncGenerator, Awaitable, Callable
+from dataclasses import dataclass, field
+from typing import Any, TypeVar
+
+import slim_bindings
+from a2a.types.a2a_pb2 import StreamResponse, TaskState
+
+T = TypeVar("T")
+
+_FINAL_STATES = frozenset(
+    {
+        TaskState.TASK_STATE_COMPLETED,
+        TaskState.TASK_STATE_FAILED,
+        TaskState.TASK_STATE_CANCELED,
+        TaskState.TASK_STATE_REJECTED,
+        TaskState.TASK_STATE_INPUT_REQUIRED,
+        TaskState.TASK_STATE_AUTH_REQUIRED,
+    }
+)
+
+
+@dataclass(frozen=True)
+class CompletionPolicy:
+    """Decides when a multicast call has received enough responses.
+
+    Once the policy is satisfied the group reader is dropped, which cancels
+    the calls of the members that have not answered yet.
+
+    Example:
+        >>> async for source, response in client.send_message(
+        ...     request, completion=CompletionPolicy.majority(deadline=2.0)
+        ... ):
+        ...     ...
+    """
+
+    responses: int | None = None
+    """Members that must answer before the call completes. None waits for all."""
+    quorum: bool = False
+    """Require answers from a majority of the members instead of ``responses``."""
+    deadline: float | None = None
+    """Seconds after which the call completes with the answers received so far."""
+    member_timeout: float | None = None
+    """Seconds a member may stay silent before it is given up as a straggler."""
+    partial_results: bool = False
+    """Yield member errors as (None, error) items instead of raising, and end
+    with a (None, MulticastSummary) item."""
+
+    def __post_init__(self) -> None:
+        if self.responses is not None and self.responses < 1:
+            raise ValueError("responses must be at least 1")
+        if self.deadline is not None and self.deadline <= 0:
+            raise ValueError("deadline must be positive")
+        if self.member_timeout is not None and self.member_timeout <= 0:
+            raise ValueError("member_timeout must be positive")
+
+    @classmethod
+    def first(cls, deadline: float | None = None) -> "CompletionPolicy":
+        """Completes on the first member's answer."""
+        return cls(responses=1, deadline=deadline)
+
+    @classmethod
+    def first_n(cls, n: int, deadline: float | None = None) -> "CompletionPolicy":
+        """Completes once ``n`` members have answered."""
+        return cls(responses=n, deadline=deadline)
+
+    @classmethod
+    def majority(cls, deadline: float | None = None) -> "CompletionPolicy":
+        """Completes once a majority of the members have answered."""
+        return cls(quorum=True, deadline=deadline)
+
+    @classmethod
+    def all(cls, deadline: float | None = None) -> "CompletionPolicy":
+        """Waits for every member, or until ``deadline`` seconds have passed."""
+        return cls(deadline=deadline)
+
+    def required_responses(self, members: int | None) -> int | None:
+        """Returns the number of answers completing a call to ``members``."""
+        if not self.quorum:
+            return self.responses
+        if members is None:
+            raise ValueError("a quorum needs the number of group members")
+        return members // 2 + 1
+
+
+@dataclass
+class MulticastSummary:
+    """Outcome of a multicast call, per member SLIM name."""
+
+    answered: list[str] = field(default_factory=list)
+    """Members that sent their final response."""
+    timed_out: list[str] = field(default_factory=list)
+    """Members given up after the member timeout or the deadline."""
+    failed: list[str] = field(default_factory=list)
+    """Members whose call ended without a final response, usually on error."""
+
+
+def is_final_stream_response(response: StreamResponse) -> bool:
+    """Returns whether ``response`` is the last one of a member's stream."""
+    which = response.WhichOneof("payload")
+    if which == "message":
+        return True
+    if which == "task":
+        return response.task.status.state in _FINAL_STATES
+    if which == "status_update":
+        return response.status_update.status.state in _FINAL_STATES
+    return False
+
+
+def member_name(source: slim_bindings.RpcMessageContext) -> str:
+    """Returns the SLIM name of the member behind a multicast ``source``."""
+    return "/".join(source.source.components()[:3])
+
+
+async def read_group(
+    open_reader: Callable[[], Awaitable[Any]],
+    deserialize: Callable[[bytes], T],
+    raise_errors: bool = False,
+) -> AsyncGenerator[tuple[Any, T | Exception], None]:
+    """Reads a multicast call like a group stub.
+
+    Member errors are yielded as ``(None, error)`` items unless
+    ``raise_errors`` is set: slimrpc does not report which member failed.
+
+    Args:
+        open_reader: Starts the call and returns its multicast reader.
+        deserialize: Parses a member response.
+        raise_errors: Raise the first member error, as the group stub does.
+    """
+    reader = await open_reader()
+    while True:
+        msg = await reader.next_async()
+        if msg.is_end():
+            return
+        if msg.is_error():
+            if raise_errors:
+                raise msg.error
+            yield None, msg.error
+        elif msg.is_data():
+            yield msg.item.context, deserialize(msg.item.message)
+
+
+async def complete(
+    stream: AsyncGenerator[tuple[Any, T], None],
+    policy: CompletionPolicy,
+    members: list[str] | None = None,
+    is_final: Callable[[T], bool] | None = None,
+    name_of: Callable[[Any], str] = member_name,
+) -> AsyncGenerator[tuple[Any, T | MulticastSummary], None]:
+    """Yields the items of a multicast ``stream`` until ``policy`` is satisfied.
+
+    Args:
+        stream: The (source, response) items of a group call.
+        policy: The completion policy.
+        members: The SLIM names of the group members, needed by quorum
+                 policies and to report stragglers.
+        is_final: Tells whether a response is a member's last one. Every
+                  response is final when not given, as for unary calls.
+        name_of: Returns the member name of a source.
+    """
+    required = policy.required_responses(None if members is None else len(members))
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    expires = None if policy.deadline is None else started + policy.deadline
+    # Time of the last response of each member still to answer.
+    waiting = dict.fromkeys(members or (), started)
+    summary = MulticastSummary()
+    next_item: asyncio.Future[tuple[Any, T]] | None = None
+    try:
+        while required is None or len(summary.answered) < required:
+            timeouts = []
+            if expires is not None:
+                timeouts.append(expires)
+            if policy.member_timeout is not None and waiting:
+                timeouts.append(min(waiting.values()) + policy.member_timeout)
+            if next_item is None:
+                next_item = asyncio.ensure_future(anext(stream))
+            done, _ = await asyncio.wait(
+                {next_item},
+                timeout=max(min(timeouts) - loop.time(), 0) if timeouts else None,
+            )
+            now = loop.time()
+            if not done:
+                if expires is not None and now >= expires:
+                    summary.timed_out.extend(waiting)
+                    break
+                assert policy.member_timeout is not None
+                for name, seen in list(waiting.items()):
+                    if now - seen >= policy.member_timeout:
+                        del waiting[name]
+                        summary.timed_out.append(name)
+                if not waiting:
+                    break
+                continue
+            item_future, next_item = next_item, None
+            try:
+                source, response = item_future.result()
+            except StopAsyncIteration:
+                summary.failed.extend(waiting)
+                break
+            if source is None:
+                yield source, response
+                continue
+            name = name_of(source)
+            if name in summary.timed_out:
+                continue
+            if isinstance(response, Exception):
+                waiting.pop(name, None)
+                summary.failed.append(name)
+                yield source, response
+                continue
+            if name in waiting:
+                waiting[name] = now
+            if is_final is None or is_final(response):
+                waiting.pop(name, None)
+                summary.answered.append(name)
+            yield source, response
+        if policy.partial_results:
+            yield None, summary
+    finally:
+        if next_item is not None:
+            next_item.cancel()
+            with contextlib.suppress(asyncio.CancelledError, StopAsyncIteration):
+                await next_item
+        await stream.aclose()
@@ -0,0 +1,152 @@
+# Copyright AGNTCY Contributors (https://github.com/agntcy)
+# SPDX-License-Identifier: Apache-2.0
+
+"""De-duplication of retried SendMessage requests."""
+
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+
+from a2a.types.a2a_pb2 import SendMessageResponse
+
+from slima2a.single_flight import SingleFlight
+
+MessageKey = tuple[str, str, str]
+"""User name, tenant and message id of a SendMessage request."""
+
+
+@dataclass
+class DeduplicationStats:
+    """Counters describing the behaviour of a MessageDeduplicator."""
+
+    executed: int = 0
+    """Messages handed to the request handler."""
+    joined: int = 0
+    """Duplicates answered with the result of an execution in flight."""
+    replayed: int = 0
+    """Duplicates answered with a recent result."""
+    evictions: int = 0
+
+    @property
+    def suppressed(self) -> int:
+        """Duplicates that did not run the agent again."""
+        return self.joined + self.replayed
+
+
+@dataclass
+class _Result:
+    response: SendMessageResponse
+    size: int
+    expires_at: float
+
+
+def _copy_response(response: SendMessageResponse) -> SendMessageResponse:
+    copy = SendMessageResponse()
+    copy.CopyFrom(response)
+    return copy
+
+
+class MessageDeduplicator:
+    """Answers retried SendMessage requests without running the agent again.
+
+    Requests are identified by caller, tenant and ``message_id``. A request
+    whose message is still being handled waits for that execution's result,
+    and one whose message was answered less than ``window`` seconds ago gets
+    the same response back. An execution keeps running when its caller gives
+    up, e.g. after a client timeout, so the retry can pick up its result.
+    Failed executions are not remembered and may be retried.
+
+    Results are remembered in completion order, within ``max_entries`` and
+    ``max_bytes`` of serialized responses.
+
+    Example:
+        >>> handler = SRPCHandler(
+        ...     agent_card,
+        ...     request_handler,
+        ...     message_deduplicator=MessageDeduplicator(window=300),
+        ... )
+    """
+
+    def __init__(
+        self,
+        window: float = 60.0,
+        max_entries: int = 10_000,
+        max_bytes: int = 16 * 1024 * 1024,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initializes the MessageDeduplicator.
+
+        Args:
+            window: Seconds a result is returned to retries of its message.
+            max_entries: Maximum number of results remembered.
+            max_bytes: Maximum total size of the remembered responses.
+            clock: Monotonic clock used to expire results.
+        """
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        if max_bytes < 1:
+            raise ValueError("max_bytes must be at least 1")
+        self.window = window
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.size = 0
+        self.stats = DeduplicationStats()
+        self._clock = clock
+        self._results: OrderedDict[MessageKey, _Result] = OrderedDict()
+        self._flight: SingleFlight[SendMessageResponse] = SingleFlight()
+
+    def __len__(self) -> int:
+        return len(self._results)
+
+    async def run(
+        self,
+        key: MessageKey,
+        execute: Callable[[], Awaitable[SendMessageResponse]],
+    ) -> SendMessageResponse:
+        """Returns the response to the message ``key``, executing it only once.
+
+        Args:
+            key: The caller, tenant and message id of the request.
+            execute: Handles the message.
+        """
+        self._expire()
+        result = self._results.get(key)
+        if result is not None:
+            self.stats.replayed += 1
+            return _copy_response(result.response)
+        if key in self._flight:
+            self.stats.joined += 1
+        response = await self._flight.do(key, lambda: self._execute(key, execute))
+        return _copy_response(response)
+
+    async def _execute(
+        self,
+        key: MessageKey,
+        execute: Callable[[], Awaitable[SendMessageResponse]],
+    ) -> SendMessageResponse:
+        self.stats.executed += 1
+        response = await execute()
+        size = response.ByteSize()
+        if self.window > 0 and size <= self.max_bytes:
+            self._results[key] = _Result(
+                response=_copy_response(response),
+                size=size,
+                expires_at=self._clock() + self.window,
+            )
+            self.size += size
+            while len(self._results) > self.max_entries or self.size > self.max_bytes:
+                _, evicted = self._results.popitem(last=False)
+                self.size -= evicted.size
+                self.stats.evictions += 1
+        return response
+
+    def _expire(self) -> None:
+        # Results are stored in completion order, so the oldest expire first.
+        now = self._clock()
+        while self._results:
+            key, result = next(iter(self._results.items()))
+            if now < result.expires_at:
+                return
+            del self._results[key]
+            self.size -= result.size
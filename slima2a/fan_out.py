@@ -0,0 +1,323 @@
+# Copyright AGNTCY Contributors (https://github.com/agntcy)
+# SPDX-License-Identifier: Apache-2.0
+
+"""Scatter-gather over individual clients for agents without a common multicast protocol."""
+
+import asyncio
+from collections.abc import AsyncGenerator, AsyncIterator, Awaitable, Callable
+from types import TracebackType
+from typing import Any, TypeVar
+
+from a2a.client import Client
+from a2a.client.client import ClientCallContext, ClientEvent
+from a2a.types.a2a_pb2 import (
+    AgentCard,
+    CancelTaskRequest,
+    DeleteTaskPushNotificationConfigRequest,
+    GetExtendedAgentCardRequest,
+    GetTaskPushNotificationConfigRequest,
+    GetTaskRequest,
+    ListTaskPushNotificationConfigsRequest,
+    ListTaskPushNotificationConfigsResponse,
+    ListTasksRequest,
+    ListTasksResponse,
+    SendMessageRequest,
+    StreamResponse,
+    SubscribeToTaskRequest,
+    Task,
+    TaskPushNotificationConfig,
+)
+
+from slima2a.completion import CompletionPolicy, complete, is_final_stream_response
+from slima2a.task_merge import merge_list_tasks, status_timestamp_key
+
+T = TypeVar("T")
+
+_DONE = object()
+
+
+async def _once(call: Awaitable[T]) -> AsyncGenerator[T, None]:
+    yield await call
+
+
+async def _events(
+    events: AsyncIterator[ClientEvent],
+) -> AsyncGenerator[StreamResponse, None]:
+    async for response, _ in events:
+        yield response
+
+
+class FanOutClient:
+    """Queries several agents concurrently through one client per agent.
+
+    Offers the interface of MulticastClient for agents that share no
+    multicast-capable protocol, e.g. a mix of JSONRPC and slimrpc agents.
+    All methods are async generators that yield (source, response) tuples,
+    where source is the name the agent's client is registered under.
+    """
+
+    def __init__(self, clients: dict[str, Client], max_concurrency: int = 16) -> None:
+        """Initializes the FanOutClient.
+
+        Args:
+            clients: The client of each agent, keyed by the agent's name.
+            max_concurrency: Maximum number of agents called at the same time.
+        """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        self.clients = clients
+        self.max_concurrency = max_concurrency
+
+    async def _fan_out(
+        self,
+        call: Callable[[Client], AsyncIterator[Any]],
+        completion: CompletionPolicy | None,
+        streaming: bool = False,
+    ) -> AsyncGenerator[tuple[str, Any], None]:
+        """Runs ``call`` on every client, yielding responses as they arrive."""
+        stream = self._merge(
+            call, completion is not None and completion.partial_results
+        )
+        if completion is not None:
+            stream = complete(
+                stream,
+                completion,
+                list(self.clients),
+                is_final_stream_response if streaming else None,
+                name_of=str,
+            )
+        try:
+            async for item in stream:
+                yield item
+        finally:
+            await stream.aclose()
+
+    async def _merge(
+        self,
+        call: Callable[[Client], AsyncIterator[Any]],
+        partial_results: bool,
+    ) -> AsyncGenerator[tuple[str, Any], None]:
+        queue: asyncio.Queue[Any] = asyncio.Queue()
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def run(source: str, client: Client) -> None:
+            try:
+                async with semaphore:
+                    async for response in call(client):
+                        queue.put_nowait((source, response))
+            except Exception as e:
+                queue.put_nowait((source, e))
+            finally:
+                queue.put_nowait(_DONE)
+
+        tasks = [
+            asyncio.create_task(run(source, client))
+            for source, client in self.clients.items()
+        ]
+        remaining = len(tasks)
+        try:
+            while remaining:
+                item = await queue.get()
+                if item is _DONE:
+                    remaining -= 1
+                    continue
+                if isinstance(item[1], Exception) and not partial_results:
+                    raise item[1]
+                yield item
+        finally:
+            # Stops the agents still running, e.g. once a completion policy
+            # is satisfied or the consumer stopped iterating.
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def send_message(
+        self,
+        request: SendMessageRequest,
+        *,
+        context: ClientCallContext | None = None,
+        completion: CompletionPolicy | None = None,
+    ) -> AsyncGenerator[tuple[str, StreamResponse], None]:
+        """Sends a message to all agents.
+
+        Each client streams or not according to its own configuration, so
+        this yields every response of each agent.
+        """
+        async for item in self._fan_out(
+            lambda c: _events(c.send_message(request, context=context)),
+            completion,
+            streaming=True,
+        ):
+            yield item
+
+    async def send_message_streaming(
+        self,
+        request: SendMessageRequest,
+        *,
+        context: ClientCallContext | None = None,
+        completion: CompletionPolicy | None = None,
+    ) -> AsyncGenerator[tuple[str, StreamResponse], None]:
+        """Sends a streaming message to all agents, same as send_message."""
+        async for item in self.send_message(
+            request, context=context, completion=completion
+        ):
+            yield item
+
+    async def get_task(
+        self,
+        request: GetTaskRequest,
+        *,
+        context: ClientCallContext | None = None,
+        completion: CompletionPolicy | None = None,
+    ) -> AsyncGenerator[tuple[str, Task], None]:
+        async for item in self._fan_out(
+            lambda c: _once(c.get_task(request, context=context)), completion
+        ):
+            yield item
+
+    async def list_tasks(
+        self,
+        request: ListTasksRequest,
+        *,
+        context: ClientCallContext | None = None,
+        completion: CompletionPolicy | None = None,
+    ) -> AsyncGenerator[tuple[str, ListTasksResponse], None]:
+        async for item in self._fan_out(
+            lambda c: _once(c.list_tasks(request, context=context)), completion
+        ):
+            yield item
+
+    async def merged_list_tasks(
+        self,
+        request: ListTasksRequest,
+        *,
+        context: ClientCallContext | None = None,
+        key: Callable[[Task], Any] = status_timestamp_key,
+        descending: bool = True,
+    ) -> ListTasksResponse:
+        """Lists the tasks of all agents as one list sorted by ``key``.
+
+        See MulticastClient.merged_list_tasks.
+        """
+        return await merge_list_tasks(
+            list(self.clients),
+            request,
+            lambda name, page_request: self.clients[name].list_tasks(
+                page_request, context=context
+            ),
+            key=key,
+            descending=descending,
+        )
+
+    async def cancel_task(
+        self,
+        request: CancelTaskRequest,
+        *,
+        context: ClientCallContext | None = None,
+        completion: CompletionPolicy | None = None,
+    ) -> AsyncGenerator[tuple[str, Task], None]:
+        async for item in self._fan_out(
+            lambda c: _once(c.cancel_task(request, context=context)), completion
+        ):
+            yield item
+
+    async def subscribe(
+        self,
+        request: SubscribeToTaskRequest,
+        *,
+        context: ClientCallContext | None = None,
+        completion: CompletionPolicy | None = None,
+    ) -> AsyncGenerator[tuple[str, StreamResponse], None]:
+        async for item in self._fan_out(
+            lambda c: _events(c.subscribe(request, context=context)),
+            completion,
+            streaming=True,
+        ):
+            yield item
+
+    async def create_task_push_notification_config(
+        self,
+        request: TaskPushNotificationConfig,
+        *,
+        context: ClientCallContext | None = None,
+        completion: CompletionPolicy | None = None,
+    ) -> AsyncGenerator[tuple[str, TaskPushNotificationConfig], None]:
+        async for item in self._fan_out(
+            lambda c: _once(
+                c.create_task_push_notification_config(request, context=context)
+            ),
+            completion,
+        ):
+            yield item
+
+    async def get_task_push_notification_config(
+        self,
+        request: GetTaskPushNotificationConfigRequest,
+        *,
+        context: ClientCallContext | None = None,
+        completion: CompletionPolicy | None = None,
+    ) -> AsyncGenerator[tuple[str, TaskPushNotificationConfig], None]:
+        async for item in self._fan_out(
+            lambda c: _once(
+                c.get_task_push_notification_config(request, context=context)
+            ),
+            completion,
+        ):
+            yield item
+
+    async def list_task_push_notification_configs(
+        self,
+        request: ListTaskPushNotificationConfigsRequest,
+        *,
+        context: ClientCallContext | None = None,
+        completion: CompletionPolicy | None = None,
+    ) -> AsyncGenerator[tuple[str, ListTaskPushNotificationConfigsResponse], None]:
+        async for item in self._fan_out(
+            lambda c: _once(
+                c.list_task_push_notification_configs(request, context=context)
+            ),
+            completion,
+        ):
+            yield item
+
+    async def delete_task_push_notification_config(
+        self,
+        request: DeleteTaskPushNotificationConfigRequest,
+        *,
+        context: ClientCallContext | None = None,
+        completion: CompletionPolicy | None = None,
+    ) -> AsyncGenerator[tuple[str, None], None]:
+        async for item in self._fan_out(
+            lambda c: _once(
+                c.delete_task_push_notification_config(request, context=context)
+            ),
+            completion,
+        ):
+            yield item
+
+    async def get_extended_agent_card(
+        self,
+        request: GetExtendedAgentCardRequest,
+        *,
+        context: ClientCallContext | None = None,
+        completion: CompletionPolicy | None = None,
+    ) -> AsyncGenerator[tuple[str, AgentCard], None]:
+        async for item in self._fan_out(
+            lambda c: _once(c.get_extended_agent_card(request, context=context)),
+            completion,
+        ):
+            yield item
+
+    async def close(self) -> None:
+        await asyncio.gather(*(client.close() for client in self.clients.values()))
+
+    async def __aenter__(self) -> "FanOutClient":
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        await self.close()
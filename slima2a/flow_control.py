@@ -0,0 +1,257 @@
+# Copyright AGNTCY Contributors (https://github.com/agntcy)
+# SPDX-License-Identifier: Apache-2.0
+
+"""Credit-based flow control of server-streaming calls."""
+
+import asyncio
+import contextlib
+import logging
+import time
+import uuid
+from collections.abc import AsyncGenerator, AsyncIterable, Callable
+from dataclasses import dataclass
+from datetime import timedelta
+from typing import TypeVar
+
+import slim_bindings
+from google.protobuf.wrappers_pb2 import UInt32Value
+from google.rpc import code_pb2
+
+logger = logging.getLogger(__name__)
+
+SlimRPCError = slim_bindings.RpcError.Rpc  # type: ignore[attr-defined]
+
+T = TypeVar("T")
+
+FLOW_CONTROL_SERVICE = "slima2a.v1.FlowControl"
+GRANT_CREDITS_METHOD = "GrantCredits"
+
+STREAM_ID_HEADER = "x-slima2a-stream-id"
+"""Request metadata identifying a flow-controlled stream."""
+
+CREDIT_WINDOW_HEADER = "x-slima2a-credit-window"
+"""Request metadata holding the credits a stream starts with."""
+
+
+@dataclass
+class FlowControlStats:
+    """Counters describing the behaviour of a CreditFlowController."""
+
+    streams: int = 0
+    """Streams sent under flow control."""
+    grants: int = 0
+    granted: int = 0
+    """Credits received from consumers."""
+    stalls: int = 0
+    """Responses that waited for a credit."""
+    stalled_seconds: float = 0.0
+    """Total time producers spent waiting for credits."""
+    timeouts: int = 0
+    """Streams ended because no credit came within the stall timeout."""
+
+
+class _Credits:
+    def __init__(self, window: int) -> None:
+        self.window = window
+        self.available = window
+        self.granted = asyncio.Event()
+
+
+class _CreditedSink:
+    """Response sink sending one response per credit granted by the consumer."""
+
+    def __init__(
+        self,
+        sink: slim_bindings.ResponseSink,
+        controller: "CreditFlowController",
+        credits: _Credits,
+    ) -> None:
+        self._sink = sink
+        self._controller = controller
+        self._credits = credits
+
+    async def send_async(self, data: bytes) -> None:
+        try:
+            await self._controller._acquire(self._credits)
+        except slim_bindings.RpcError as e:
+            with contextlib.suppress(slim_bindings.RpcError):
+                await self._sink.send_error_async(e)
+            raise
+        await self._sink.send_async(data)
+
+    async def send_error_async(self, error: slim_bindings.RpcError) -> None:
+        await self._sink.send_error_async(error)
+
+    async def close_async(self) -> None:
+        await self._sink.close_async()
+
+    async def is_closed_async(self) -> bool:
+        return await self._sink.is_closed_async()
+
+
+class CreditFlowController:
+    """Bounds the responses a streaming call sends ahead of its consumer.
+
+    A client opting in names its stream and sets an initial window of
+    credits in the request metadata. Every response sent consumes a credit
+    and the producer waits once none are left. The client grants credits
+    back through the ``GrantCredits`` method as it reads responses, so the
+    responses in flight never exceed the window, whatever the client speed.
+    Each grant is answered with the window the stream holds, which is
+    smaller than the requested one when ``max_window`` caps it. Streams of
+    clients that do not opt in are not affected.
+
+    Example:
+        >>> handler = SRPCHandler(
+        ...     agent_card, request_handler, flow_controller=CreditFlowController()
+        ... )
+    """
+
+    def __init__(
+        self,
+        max_window: int = 64,
+        stall_timeout: float | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initializes the CreditFlowController.
+
+        Args:
+            max_window: Maximum credits a stream holds, capping the window
+                        requested by clients.
+            stall_timeout: Seconds a producer waits for a credit before the
+                           stream ends with RESOURCE_EXHAUSTED. If none it
+                           waits until the call ends.
+            clock: Returns the current time in seconds.
+        """
+        if max_window < 1:
+            raise ValueError("max_window must be at least 1")
+        self.max_window = max_window
+        self.stall_timeout = stall_timeout
+        self.stats = FlowControlStats()
+        self._clock = clock
+        self._streams: dict[str, _Credits] = {}
+
+    def __len__(self) -> int:
+        return len(self._streams)
+
+    @contextlib.asynccontextmanager
+    async def stream(
+        self,
+        sink: slim_bindings.ResponseSink,
+        context: slim_bindings.Context,
+    ) -> AsyncGenerator[slim_bindings.ResponseSink, None]:
+        """Yields ``sink`` gated by the credits of the stream of ``context``.
+
+        The sink is returned unchanged when the caller did not opt in.
+        """
+        metadata = context.metadata()
+        stream_id = metadata.get(STREAM_ID_HEADER, "")
+        try:
+            window = int(metadata.get(CREDIT_WINDOW_HEADER, ""))
+        except ValueError:
+            window = 0
+        if not stream_id or window < 1 or stream_id in self._streams:
+            yield sink
+            return
+        credits = self._streams[stream_id] = _Credits(min(window, self.max_window))
+        self.stats.streams += 1
+        try:
+            yield _CreditedSink(sink, self, credits)  # type: ignore[misc]
+        finally:
+            del self._streams[stream_id]
+
+    def grant(self, stream_id: str, credits: int) -> int:
+        """Adds ``credits`` to the stream ``stream_id``, if it is still open.
+
+        Returns:
+            The window of the stream, or 0 if it is not open.
+        """
+        stream = self._streams.get(stream_id)
+        if stream is None:
+            return 0
+        if credits > 0:
+            self.stats.grants += 1
+            self.stats.granted += credits
+            stream.available = min(stream.available + credits, stream.window)
+            stream.granted.set()
+        return stream.window
+
+    async def _acquire(self, credits: _Credits) -> None:
+        if credits.available < 1:
+            self.stats.stalls += 1
+            start = self._clock()
+            try:
+                while credits.available < 1:
+                    credits.granted.clear()
+                    await asyncio.wait_for(credits.granted.wait(), self.stall_timeout)
+            except asyncio.TimeoutError:
+                self.stats.timeouts += 1
+                raise SlimRPCError(
+                    code=code_pb2.RESOURCE_EXHAUSTED,
+                    message="Stream consumer granted no credit in time",
+                    details=None,
+                ) from None
+            finally:
+                self.stats.stalled_seconds += self._clock() - start
+        credits.available -= 1
+
+
+async def grant_credits(
+    channel: slim_bindings.Channel,
+    stream_id: str,
+    credits: int,
+    timeout: timedelta | None = None,
+) -> int:
+    """Grants ``credits`` to the flow-controlled stream ``stream_id``.
+
+    Returns:
+        The window the server holds for the stream, or 0 if it is not open.
+    """
+    response = await channel.call_unary_async(
+        FLOW_CONTROL_SERVICE,
+        GRANT_CREDITS_METHOD,
+        UInt32Value(value=credits).SerializeToString(),
+        timeout,
+        {STREAM_ID_HEADER: stream_id},
+    )
+    return UInt32Value.FromString(response).value
+
+
+async def credited_stream(
+    channel: slim_bindings.Channel,
+    window: int,
+    open_stream: Callable[[dict[str, str]], AsyncIterable[T]],
+    timeout: timedelta | None = None,
+) -> AsyncGenerator[T, None]:
+    """Reads a stream under flow control, granting credits as items are read.
+
+    The server may hold a smaller window than requested, so the first item
+    is credited at once and later grants are sent whenever half of the
+    window the server answers with has been read.
+
+    Args:
+        channel: The channel the stream is read from.
+        window: The number of items the server may send ahead.
+        open_stream: Opens the stream with the given extra request metadata.
+        timeout: Deadline of each credit grant.
+    """
+    stream_id = uuid.uuid4().hex
+    headers = {STREAM_ID_HEADER: stream_id, CREDIT_WINDOW_HEADER: str(window)}
+    threshold = 1
+    granting = True
+    consumed = 0
+    async for item in open_stream(headers):
+        yield item
+        consumed += 1
+        if not granting or consumed < threshold:
+            continue
+        try:
+            effective = await grant_credits(channel, stream_id, consumed, timeout)
+        except slim_bindings.RpcError as e:
+            # The server does not support flow control, or the stream ended.
+            logger.debug("Failed to grant credits to stream %s: %s", stream_id, e)
+            granting = False
+            effective = 0
+        if effective > 0:
+            threshold = max(1, effective // 2)
+        consumed = 0
@@ -2,8 +2,13 @@
 # SPDX-License-Identifier: Apache-2.0
 
 # ruff: noqa: N802
+import asyncio
+import logging
 from abc import ABC, abstractmethod
-from collections.abc import AsyncIterable, Callable
+from collections.abc import AsyncGenerator, AsyncIterable, Awaitable, Callable
+from contextlib import AbstractAsyncContextManager, nullcontext
+from dataclasses import dataclass
+from typing import TypeVar
 
 import slim_bindings
 from a2a import types
@@ -13,19 +18,58 @@ from a2a.extensions.common import (
     get_requested_extensions,
 )
 from a2a.server.context import ServerCallContext
+from a2a.server.events import Event
 from a2a.server.request_handlers.request_handler import RequestHandler
 from a2a.types import a2a_pb2
 from a2a.types.a2a_pb2 import AgentCard
 from a2a.utils import proto_utils
-from a2a.utils.errors import A2AError, TaskNotFoundError
+from a2a.utils.constants import PROTOCOL_VERSION_CURRENT
+from a2a.utils.errors import A2AError, InvalidParamsError, TaskNotFoundError
 from a2a.utils.helpers import validate, validate_async_generator
-from google.protobuf import empty_pb2
+from google.protobuf import empty_pb2, wrappers_pb2
+from google.protobuf.message import DecodeError
 from google.rpc import code_pb2
 
+from slima2a.admission import AdmissionController
+from slima2a.batch import (
+    BATCH_SERVICE,
+    MAX_BATCH_SIZE,
+    SEND_MESSAGES_METHOD,
+    decode_frames,
+    encode_frames,
+    error_status,
+    response_status,
+)
+from slima2a.broadcast import SubscriptionHub
+from slima2a.card_cache import SerializedCardCache
+from slima2a.coalescing import ArtifactUpdateCoalescer
+from slima2a.completion import is_final_stream_response
+from slima2a.dedup import MessageDeduplicator
+from slima2a.flow_control import (
+    FLOW_CONTROL_SERVICE,
+    GRANT_CREDITS_METHOD,
+    STREAM_ID_HEADER,
+    CreditFlowController,
+)
+from slima2a.registration import register_servicer
+from slima2a.resume import (
+    RESUME_AFTER_HEADER,
+    ReplayBuffer,
+    response_task_id,
+    stamp_sequence,
+)
+from slima2a.task_cache import SerializedTaskCache
 from slima2a.types.v1 import a2a_pb2_slimrpc
 
+logger = logging.getLogger(__name__)
+
 SlimRPCError = slim_bindings.RpcError.Rpc  # type: ignore[attr-defined]
 
+DEADLINE_STATE_KEY = "deadline"
+"""ServerCallContext state key holding the caller's deadline (a datetime)."""
+
+T = TypeVar("T")
+
 _SLIM_ERROR_CODE_MAP = {
     types.InvalidRequestError: code_pb2.INVALID_ARGUMENT,
     types.MethodNotFoundError: code_pb2.NOT_FOUND,
@@ -56,6 +100,48 @@ def get_metadata_value(context: slim_bindings.Context, key: str) -> str:
     return context.metadata().get(key, "")
 
 
+def get_remaining_time(context: slim_bindings.Context) -> float:
+    """Returns the seconds left before the caller's deadline expires."""
+    if context.is_deadline_exceeded():
+        return 0.0
+    return context.remaining_time().total_seconds()
+
+
+def _event_task_id(event: Event) -> str:
+    if isinstance(event, a2a_pb2.Task):
+        return event.id
+    return event.task_id
+
+
+def _replay_key(
+    server_context: ServerCallContext, event: Event
+) -> tuple[str, str, str]:
+    return (
+        server_context.user.user_name,
+        server_context.tenant,
+        _event_task_id(event),
+    )
+
+
+def _deadline_exceeded_error() -> Exception:
+    return SlimRPCError(
+        code=code_pb2.DEADLINE_EXCEEDED,
+        message="DeadlineExceeded: the caller's deadline expired",
+        details=None,
+    )
+
+
+@dataclass
+class SRPCHandlerStats:
+    """Counters describing the behaviour of an SRPCHandler."""
+
+    deadline_cancelled_calls: int = 0
+    abandoned_streams: int = 0
+    """SendStreamingMessage calls whose caller left before the final event."""
+    batches: int = 0
+    batched_messages: int = 0
+
+
 class DefaultCallContextBuilder(CallContextBuilder):
     """A default implementation of CallContextBuilder."""
 
@@ -81,6 +167,17 @@ class SRPCHandler(a2a_pb2_slimrpc.A2AServiceServicer):
         request_handler: RequestHandler,
         context_builder: CallContextBuilder | None = None,
         card_modifier: Callable[[AgentCard], AgentCard] | None = None,
+        enforce_deadlines: bool = False,
+        admission_controller: AdmissionController | None = None,
+        stream_coalescer: ArtifactUpdateCoalescer | None = None,
+        card_cache: SerializedCardCache | None = None,
+        task_cache: SerializedTaskCache | None = None,
+        message_deduplicator: MessageDeduplicator | None = None,
+        subscription_hub: SubscriptionHub | None = None,
+        replay_buffer: ReplayBuffer | None = None,
+        cancel_abandoned_streams: bool = False,
+        flow_controller: CreditFlowController | None = None,
+        batch_concurrency: int = 0,
     ) -> None:
         """Initializes the SRPCHandler.
 
@@ -90,11 +187,143 @@ class SRPCHandler(a2a_pb2_slimrpc.A2AServiceServicer):
             context_builder: The CallContextBuilder object. If none the
                              DefaultCallContextBuilder is used.
             card_modifier: An optional callback to dynamically modify the agent card.
+            enforce_deadlines: Whether message handling is cancelled once the
+                               caller's deadline expires, cancelling its
+                               task through the request handler.
+            admission_controller: An optional AdmissionController limiting the
+                                  number of requests served concurrently.
+            stream_coalescer: An optional ArtifactUpdateCoalescer merging
+                              appended artifact updates on streaming responses.
+            card_cache: The SerializedCardCache holding the served card. If
+                        none a cache that re-runs card_modifier on every call
+                        is used.
+            task_cache: An optional SerializedTaskCache answering GetTask
+                        for terminal tasks with cached bytes.
+            message_deduplicator: An optional MessageDeduplicator answering
+                                  retried SendMessage requests without
+                                  running the agent again.
+            subscription_hub: An optional SubscriptionHub sharing one
+                              serialized event stream among the
+                              subscribers of a task.
+            replay_buffer: An optional ReplayBuffer numbering streamed events
+                           so that clients can resume broken streams.
+            cancel_abandoned_streams: Whether the task of a SendStreamingMessage
+                                      call is cancelled when its caller stops
+                                      reading the stream before the final
+                                      event.
+            flow_controller: An optional CreditFlowController pacing
+                             streamed responses to the credits granted by
+                             their consumer.
+            batch_concurrency: Maximum number of messages of a SendMessages
+                               batch handled concurrently. If 0 the batch
+                               method is not registered.
         """
         self.agent_card = agent_card
         self.request_handler = request_handler
         self.context_builder = context_builder or DefaultCallContextBuilder()
         self.card_modifier = card_modifier
+        self.enforce_deadlines = enforce_deadlines
+        self.admission_controller = admission_controller
+        self.stream_coalescer = stream_coalescer
+        self.card_cache = card_cache or SerializedCardCache()
+        self.task_cache = task_cache
+        self.message_deduplicator = message_deduplicator
+        self.subscription_hub = subscription_hub
+        self.replay_buffer = replay_buffer
+        self.cancel_abandoned_streams = cancel_abandoned_streams
+        self.flow_controller = flow_controller
+        self.batch_concurrency = batch_concurrency
+        self.stats = SRPCHandlerStats()
+
+    def _admit(self, method: str) -> AbstractAsyncContextManager[None]:
+        if self.admission_controller is None:
+            return nullcontext()
+        return self.admission_controller.admit(method)
+
+    async def _responses(
+        self,
+        server_context: ServerCallContext,
+        stream: AsyncGenerator[Event],
+    ) -> AsyncGenerator[a2a_pb2.StreamResponse]:
+        """Converts the events of ``stream`` to responses, coalesced and numbered.
+
+        Events are numbered by the replay buffer before they are coalesced,
+        so every stream observing an event gives it the same number, and a
+        merged update carries the number of the last append folded into it.
+        """
+        if self.replay_buffer is None:
+            if self.stream_coalescer is not None:
+                stream = self.stream_coalescer.coalesce(stream)
+            async for event in stream:
+                yield proto_utils.to_stream_response(event)
+            return
+        if self.stream_coalescer is None:
+            async for event in stream:
+                response = proto_utils.to_stream_response(event)
+                self._record(server_context, event, response)
+                yield response
+            return
+        async for event, source in self.stream_coalescer.coalesce_sources(
+            self._recorded(server_context, stream)
+        ):
+            kept = (
+                None
+                if isinstance(event, a2a_pb2.Message)
+                else self.replay_buffer.find(_replay_key(server_context, event), source)
+            )
+            if kept is not None and event is source:
+                yield kept[1]
+                continue
+            response = proto_utils.to_stream_response(event)
+            if kept is not None:
+                stamp_sequence(response, kept[0])
+            yield response
+
+    async def _recorded(
+        self,
+        server_context: ServerCallContext,
+        stream: AsyncGenerator[Event],
+    ) -> AsyncGenerator[Event]:
+        try:
+            async for event in stream:
+                self._record(
+                    server_context, event, proto_utils.to_stream_response(event)
+                )
+                yield event
+        finally:
+            await stream.aclose()
+
+    def _record(
+        self,
+        server_context: ServerCallContext,
+        event: Event,
+        response: a2a_pb2.StreamResponse,
+    ) -> None:
+        if self.replay_buffer is None or isinstance(event, a2a_pb2.Message):
+            return
+        self.replay_buffer.record(_replay_key(server_context, event), response, event)
+
+    def _resume_after(self, context: slim_bindings.Context) -> int | None:
+        if self.replay_buffer is None:
+            return None
+        value = get_metadata_value(context, RESUME_AFTER_HEADER)
+        if not value:
+            return None
+        try:
+            return int(value)
+        except ValueError:
+            raise InvalidParamsError(
+                f"Invalid {RESUME_AFTER_HEADER} metadata: {value!r}"
+            ) from None
+
+    def _flow(
+        self,
+        sink: slim_bindings.ResponseSink,
+        context: slim_bindings.Context,
+    ) -> AbstractAsyncContextManager[slim_bindings.ResponseSink]:
+        if self.flow_controller is None:
+            return nullcontext(sink)
+        return self.flow_controller.stream(sink, context)
 
     def _build_call_context(
         self,
@@ -103,8 +332,110 @@ class SRPCHandler(a2a_pb2_slimrpc.A2AServiceServicer):
     ) -> ServerCallContext:
         server_context = self.context_builder.build(context)
         server_context.tenant = getattr(request, "tenant", "")
+        server_context.state.setdefault(DEADLINE_STATE_KEY, context.deadline())
         return server_context
 
+    async def _run_until_deadline(
+        self,
+        call: Awaitable[T],
+        context: slim_bindings.Context,
+        server_context: ServerCallContext,
+        message: a2a_pb2.Message | None,
+    ) -> T:
+        """Awaits ``call``, cancelling it once the caller's deadline expires.
+
+        The task cancelled is read from ``message`` once the deadline expires,
+        as the request handler sets the id it assigns to a new task there. No
+        task is cancelled when ``message`` is None, e.g. for an execution that
+        retries of the call may still pick up.
+        """
+        if not self.enforce_deadlines:
+            return await call
+
+        future = asyncio.ensure_future(call)
+        try:
+            done, _ = await asyncio.wait({future}, timeout=get_remaining_time(context))
+        except BaseException:
+            future.cancel()
+            raise
+        if done:
+            return future.result()
+
+        future.cancel()
+        await self._on_deadline_exceeded(
+            message.task_id if message is not None else "", server_context
+        )
+        raise _deadline_exceeded_error()
+
+    async def _stream_until_deadline(
+        self,
+        stream: AsyncGenerator[Event],
+        context: slim_bindings.Context,
+        server_context: ServerCallContext,
+        task_id: str,
+    ) -> AsyncGenerator[Event]:
+        """Yields from ``stream``, closing it once the caller's deadline expires."""
+        if not self.enforce_deadlines:
+            async for event in stream:
+                yield event
+            return
+
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + get_remaining_time(context)
+        try:
+            while True:
+                try:
+                    event = await asyncio.wait_for(
+                        stream.__anext__(), deadline - loop.time()
+                    )
+                except StopAsyncIteration:
+                    return
+                except asyncio.TimeoutError:
+                    if loop.time() < deadline:
+                        raise
+                    break
+                task_id = task_id or _event_task_id(event)
+                yield event
+        finally:
+            await stream.aclose()
+
+        await self._on_deadline_exceeded(task_id, server_context)
+        raise _deadline_exceeded_error()
+
+    async def _on_deadline_exceeded(
+        self,
+        task_id: str,
+        server_context: ServerCallContext,
+    ) -> None:
+        """Records an expired call and cancels its task, if one is known."""
+        self.stats.deadline_cancelled_calls += 1
+        await self._cancel_task(task_id, server_context)
+
+    async def on_stream_abandoned(
+        self,
+        request: a2a_pb2.SendMessageRequest,
+        context: slim_bindings.Context,
+        task_id: str,
+    ) -> None:
+        """Records a stream left by its caller and cancels its task, if one is known."""
+        self.stats.abandoned_streams += 1
+        await self._cancel_task(task_id, self._build_call_context(context, request))
+
+    async def _cancel_task(
+        self,
+        task_id: str,
+        server_context: ServerCallContext,
+    ) -> None:
+        if not task_id:
+            return
+        try:
+            await self.request_handler.on_cancel_task(
+                a2a_pb2.CancelTaskRequest(id=task_id, tenant=server_context.tenant),
+                server_context,
+            )
+        except A2AError as e:
+            logger.debug("Failed to cancel task %s: %s", task_id, e)
+
     async def raise_error_response(self, error: A2AError) -> None:
         """Raises SlimRPC errors appropriately."""
         code = _SLIM_ERROR_CODE_MAP.get(type(error), code_pb2.UNKNOWN)
@@ -120,17 +451,39 @@ class SRPCHandler(a2a_pb2_slimrpc.A2AServiceServicer):
         context: slim_bindings.Context,
     ) -> a2a_pb2.SendMessageResponse:
         """Handles the 'SendMessage' SlimRPC method."""
-        try:
-            server_context = self._build_call_context(context, request)
-            task_or_message = await self.request_handler.on_message_send(
-                request, server_context
-            )
-            if isinstance(task_or_message, a2a_pb2.Task):
-                return a2a_pb2.SendMessageResponse(task=task_or_message)
-            return a2a_pb2.SendMessageResponse(message=task_or_message)
-        except A2AError as e:
-            await self.raise_error_response(e)
-        return a2a_pb2.SendMessageResponse()
+        async with self._admit("SendMessage"):
+            try:
+                server_context = self._build_call_context(context, request)
+
+                async def execute() -> a2a_pb2.SendMessageResponse:
+                    task_or_message = await self.request_handler.on_message_send(
+                        request, server_context
+                    )
+                    if isinstance(task_or_message, a2a_pb2.Task):
+                        return a2a_pb2.SendMessageResponse(task=task_or_message)
+                    return a2a_pb2.SendMessageResponse(message=task_or_message)
+
+                # An execution shared through the deduplicator outlives the
+                # deadline of its caller, so that a retry can pick it up.
+                message: a2a_pb2.Message | None = request.message
+                if self.message_deduplicator is not None and request.message.message_id:
+                    message = None
+                    call = self.message_deduplicator.run(
+                        (
+                            server_context.user.user_name,
+                            request.tenant,
+                            request.message.message_id,
+                        ),
+                        execute,
+                    )
+                else:
+                    call = execute()
+                return await self._run_until_deadline(
+                    call, context, server_context, message
+                )
+            except A2AError as e:
+                await self.raise_error_response(e)
+            return a2a_pb2.SendMessageResponse()
 
     @validate_async_generator(
         lambda self: self.agent_card.capabilities.streaming,
@@ -142,15 +495,24 @@ class SRPCHandler(a2a_pb2_slimrpc.A2AServiceServicer):
         context: slim_bindings.Context,
     ) -> AsyncIterable[a2a_pb2.StreamResponse]:
         """Handles the 'SendStreamingMessage' SlimRPC method."""
-        server_context = self._build_call_context(context, request)
-        try:
-            async for event in self.request_handler.on_message_send_stream(
-                request, server_context
-            ):
-                yield proto_utils.to_stream_response(event)
-        except A2AError as e:
-            await self.raise_error_response(e)
-        return
+        async with self._admit("SendStreamingMessage"):
+            server_context = self._build_call_context(context, request)
+            try:
+                async for response in self._responses(
+                    server_context,
+                    self._stream_until_deadline(
+                        self.request_handler.on_message_send_stream(
+                            request, server_context
+                        ),
+                        context,
+                        server_context,
+                        request.message.task_id,
+                    ),
+                ):
+                    yield response
+            except A2AError as e:
+                await self.raise_error_response(e)
+            return
 
     async def CancelTask(
         self,
@@ -158,15 +520,18 @@ class SRPCHandler(a2a_pb2_slimrpc.A2AServiceServicer):
         context: slim_bindings.Context,
     ) -> a2a_pb2.Task:
         """Handles the 'CancelTask' SlimRPC method."""
-        try:
-            server_context = self._build_call_context(context, request)
-            task = await self.request_handler.on_cancel_task(request, server_context)
-            if task:
-                return task
-            await self.raise_error_response(TaskNotFoundError())
-        except A2AError as e:
-            await self.raise_error_response(e)
-        return a2a_pb2.Task()
+        async with self._admit("CancelTask"):
+            try:
+                server_context = self._build_call_context(context, request)
+                task = await self.request_handler.on_cancel_task(
+                    request, server_context
+                )
+                if task:
+                    return task
+                await self.raise_error_response(TaskNotFoundError())
+            except A2AError as e:
+                await self.raise_error_response(e)
+            return a2a_pb2.Task()
 
     @validate_async_generator(
         lambda self: self.agent_card.capabilities.streaming,
@@ -178,14 +543,75 @@ class SRPCHandler(a2a_pb2_slimrpc.A2AServiceServicer):
         context: slim_bindings.Context,
     ) -> AsyncIterable[a2a_pb2.StreamResponse]:
         """Handles the 'SubscribeToTask' SlimRPC method."""
-        try:
-            server_context = self._build_call_context(context, request)
-            async for event in self.request_handler.on_subscribe_to_task(
-                request, server_context
-            ):
-                yield proto_utils.to_stream_response(event)
-        except A2AError as e:
-            await self.raise_error_response(e)
+        async with self._admit("SubscribeToTask"):
+            try:
+                server_context = self._build_call_context(context, request)
+                after = self._resume_after(context)
+                if self.replay_buffer is not None and after is not None:
+                    finished = False
+                    for response in self.replay_buffer.replay(
+                        (server_context.user.user_name, request.tenant, request.id),
+                        after,
+                    ):
+                        finished = finished or is_final_stream_response(response)
+                        yield response
+                    if finished:
+                        return
+                async for response in self._responses(
+                    server_context,
+                    self.request_handler.on_subscribe_to_task(request, server_context),
+                ):
+                    yield response
+            except A2AError as e:
+                await self.raise_error_response(e)
+
+    @validate_async_generator(
+        lambda self: self.agent_card.capabilities.streaming,
+        "Streaming is not supported by the agent",
+    )
+    async def serialized_subscription(
+        self,
+        request: a2a_pb2.SubscribeToTaskRequest,
+        context: slim_bindings.Context,
+    ) -> AsyncGenerator[bytes]:
+        """Yields the serialized events of a task, shared through subscription_hub."""
+        if self.subscription_hub is None or (
+            self.replay_buffer is not None
+            and get_metadata_value(context, RESUME_AFTER_HEADER)
+        ):
+            async for response in self.SubscribeToTask(request, context):
+                yield response.SerializeToString()
+            return
+        async with self._admit("SubscribeToTask"):
+            try:
+                server_context = self._build_call_context(context, request)
+
+                async def events() -> AsyncGenerator[bytes]:
+                    async for response in self._responses(
+                        server_context,
+                        self.request_handler.on_subscribe_to_task(
+                            request, server_context
+                        ),
+                    ):
+                        yield response.SerializeToString()
+
+                async def snapshot() -> bytes:
+                    task = await self.request_handler.on_get_task(
+                        a2a_pb2.GetTaskRequest(id=request.id, tenant=request.tenant),
+                        server_context,
+                    )
+                    if task is None:
+                        raise TaskNotFoundError()
+                    return a2a_pb2.StreamResponse(task=task).SerializeToString()
+
+                async for data in self.subscription_hub.subscribe(
+                    (server_context.user.user_name, request.tenant, request.id),
+                    events,
+                    snapshot,
+                ):
+                    yield data
+            except A2AError as e:
+                await self.raise_error_response(e)
 
     async def GetTask(
         self,
@@ -193,15 +619,40 @@ class SRPCHandler(a2a_pb2_slimrpc.A2AServiceServicer):
         context: slim_bindings.Context,
     ) -> a2a_pb2.Task:
         """Handles the 'GetTask' SlimRPC method."""
+        async with self._admit("GetTask"):
+            try:
+                server_context = self._build_call_context(context, request)
+                task = await self.request_handler.on_get_task(request, server_context)
+                if task:
+                    return task
+                await self.raise_error_response(TaskNotFoundError())
+            except A2AError as e:
+                await self.raise_error_response(e)
+            return a2a_pb2.Task()
+
+    async def serialized_task(
+        self,
+        request: a2a_pb2.GetTaskRequest,
+        context: slim_bindings.Context,
+    ) -> bytes:
+        """Returns the serialized GetTask response, served from task_cache."""
+        if self.task_cache is None:
+            return (await self.GetTask(request, context)).SerializeToString()
         try:
-            server_context = self._build_call_context(context, request)
-            task = await self.request_handler.on_get_task(request, server_context)
-            if task:
-                return task
-            await self.raise_error_response(TaskNotFoundError())
+            user = self.context_builder.build(context).user.user_name
         except A2AError as e:
             await self.raise_error_response(e)
-        return a2a_pb2.Task()
+            raise
+        key = (
+            user,
+            request.tenant,
+            request.id,
+            request.history_length if request.HasField("history_length") else None,
+        )
+        data = self.task_cache.get(key)
+        if data is None:
+            data = self.task_cache.put(key, await self.GetTask(request, context))
+        return data
 
     async def ListTasks(
         self,
@@ -209,12 +660,13 @@ class SRPCHandler(a2a_pb2_slimrpc.A2AServiceServicer):
         context: slim_bindings.Context,
     ) -> a2a_pb2.ListTasksResponse:
         """Handles the 'ListTasks' SlimRPC method."""
-        try:
-            server_context = self._build_call_context(context, request)
-            return await self.request_handler.on_list_tasks(request, server_context)
-        except A2AError as e:
-            await self.raise_error_response(e)
-        return a2a_pb2.ListTasksResponse()
+        async with self._admit("ListTasks"):
+            try:
+                server_context = self._build_call_context(context, request)
+                return await self.request_handler.on_list_tasks(request, server_context)
+            except A2AError as e:
+                await self.raise_error_response(e)
+            return a2a_pb2.ListTasksResponse()
 
     async def GetTaskPushNotificationConfig(
         self,
@@ -222,14 +674,15 @@ class SRPCHandler(a2a_pb2_slimrpc.A2AServiceServicer):
         context: slim_bindings.Context,
     ) -> a2a_pb2.TaskPushNotificationConfig:
         """Handles the 'GetTaskPushNotificationConfig' SlimRPC method."""
-        try:
-            server_context = self._build_call_context(context, request)
-            return await self.request_handler.on_get_task_push_notification_config(
-                request, server_context
-            )
-        except A2AError as e:
-            await self.raise_error_response(e)
-        return a2a_pb2.TaskPushNotificationConfig()
+        async with self._admit("GetTaskPushNotificationConfig"):
+            try:
+                server_context = self._build_call_context(context, request)
+                return await self.request_handler.on_get_task_push_notification_config(
+                    request, server_context
+                )
+            except A2AError as e:
+                await self.raise_error_response(e)
+            return a2a_pb2.TaskPushNotificationConfig()
 
     @validate(
         lambda self: self.agent_card.capabilities.push_notifications,
@@ -241,14 +694,17 @@ class SRPCHandler(a2a_pb2_slimrpc.A2AServiceServicer):
         context: slim_bindings.Context,
     ) -> a2a_pb2.TaskPushNotificationConfig:
         """Handles the 'CreateTaskPushNotificationConfig' SlimRPC method."""
-        try:
-            server_context = self._build_call_context(context, request)
-            return await self.request_handler.on_create_task_push_notification_config(
-                request, server_context
-            )
-        except A2AError as e:
-            await self.raise_error_response(e)
-        return a2a_pb2.TaskPushNotificationConfig()
+        async with self._admit("CreateTaskPushNotificationConfig"):
+            try:
+                server_context = self._build_call_context(context, request)
+                return (
+                    await self.request_handler.on_create_task_push_notification_config(
+                        request, server_context
+                    )
+                )
+            except A2AError as e:
+                await self.raise_error_response(e)
+            return a2a_pb2.TaskPushNotificationConfig()
 
     async def ListTaskPushNotificationConfigs(
         self,
@@ -256,14 +712,17 @@ class SRPCHandler(a2a_pb2_slimrpc.A2AServiceServicer):
         context: slim_bindings.Context,
     ) -> a2a_pb2.ListTaskPushNotificationConfigsResponse:
         """Handles the 'ListTaskPushNotificationConfigs' SlimRPC method."""
-        try:
-            server_context = self._build_call_context(context, request)
-            return await self.request_handler.on_list_task_push_notification_configs(
-                request, server_context
-            )
-        except A2AError as e:
-            await self.raise_error_response(e)
-        return a2a_pb2.ListTaskPushNotificationConfigsResponse()
+        async with self._admit("ListTaskPushNotificationConfigs"):
+            try:
+                server_context = self._build_call_context(context, request)
+                return (
+                    await self.request_handler.on_list_task_push_notification_configs(
+                        request, server_context
+                    )
+                )
+            except A2AError as e:
+                await self.raise_error_response(e)
+            return a2a_pb2.ListTaskPushNotificationConfigsResponse()
 
     async def DeleteTaskPushNotificationConfig(
         self,
@@ -271,15 +730,16 @@ class SRPCHandler(a2a_pb2_slimrpc.A2AServiceServicer):
         context: slim_bindings.Context,
     ) -> empty_pb2.Empty:
         """Handles the 'DeleteTaskPushNotificationConfig' SlimRPC method."""
-        try:
-            server_context = self._build_call_context(context, request)
-            await self.request_handler.on_delete_task_push_notification_config(
-                request, server_context
-            )
+        async with self._admit("DeleteTaskPushNotificationConfig"):
+            try:
+                server_context = self._build_call_context(context, request)
+                await self.request_handler.on_delete_task_push_notification_config(
+                    request, server_context
+                )
+                return empty_pb2.Empty()
+            except A2AError as e:
+                await self.raise_error_response(e)
             return empty_pb2.Empty()
-        except A2AError as e:
-            await self.raise_error_response(e)
-        return empty_pb2.Empty()
 
     async def GetExtendedAgentCard(
         self,
@@ -291,3 +751,233 @@ class SRPCHandler(a2a_pb2_slimrpc.A2AServiceServicer):
         if self.card_modifier:
             card_to_serve = self.card_modifier(card_to_serve)
         return card_to_serve
+
+    def serialized_extended_agent_card(self) -> bytes:
+        """Returns the serialized extended agent card, served from card_cache."""
+        return self.card_cache.get(
+            PROTOCOL_VERSION_CURRENT,
+            self.agent_card,
+            self.card_modifier,
+            AgentCard.SerializeToString,
+        )
+
+
+class _GetExtendedAgentCardHandler(slim_bindings.UnaryUnaryHandler):
+    """Answers 'GetExtendedAgentCard' with the cached serialized card."""
+
+    def __init__(self, servicer: SRPCHandler) -> None:
+        self.servicer = servicer
+
+    async def handle(self, request: bytes, context: slim_bindings.Context) -> bytes:
+        try:
+            return self.servicer.serialized_extended_agent_card()
+        except slim_bindings.RpcError:
+            raise
+        except Exception as e:
+            raise SlimRPCError(
+                code=code_pb2.INTERNAL, message=str(e), details=None
+            ) from e
+
+
+class _GetTaskHandler(slim_bindings.UnaryUnaryHandler):
+    """Answers 'GetTask' with cached serialized terminal tasks."""
+
+    def __init__(self, servicer: SRPCHandler) -> None:
+        self.servicer = servicer
+
+    async def handle(self, request: bytes, context: slim_bindings.Context) -> bytes:
+        try:
+            return await self.servicer.serialized_task(
+                a2a_pb2.GetTaskRequest.FromString(request), context
+            )
+        except slim_bindings.RpcError:
+            raise
+        except Exception as e:
+            raise SlimRPCError(
+                code=code_pb2.INTERNAL, message=str(e), details=None
+            ) from e
+
+
+class _SendStreamingMessageHandler(slim_bindings.UnaryStreamHandler):
+    """Streams 'SendStreamingMessage' events under flow control.
+
+    The task of a caller that leaves is cancelled when the servicer has
+    cancel_abandoned_streams set.
+    """
+
+    def __init__(self, servicer: SRPCHandler) -> None:
+        self.servicer = servicer
+
+    async def handle(
+        self,
+        request: bytes,
+        context: slim_bindings.Context,
+        sink: slim_bindings.ResponseSink,
+    ) -> None:
+        async with self.servicer._flow(sink, context) as flow_sink:
+            await self._send(request, context, flow_sink)
+
+    async def _send(
+        self,
+        request: bytes,
+        context: slim_bindings.Context,
+        sink: slim_bindings.ResponseSink,
+    ) -> None:
+        message_request = a2a_pb2.SendMessageRequest.FromString(request)
+        stream = self.servicer.SendStreamingMessage(message_request, context)
+        task_id = message_request.message.task_id
+        finished = False
+        abandoned = False
+        try:
+            async for response in stream:
+                task_id = task_id or response_task_id(response)
+                finished = is_final_stream_response(response)
+                try:
+                    await sink.send_async(response.SerializeToString())
+                except slim_bindings.RpcError:
+                    abandoned = True
+                    break
+            if not abandoned:
+                await sink.close_async()
+        except asyncio.CancelledError:
+            abandoned = True
+            raise
+        except slim_bindings.RpcError as e:
+            await sink.send_error_async(e)
+        except Exception as e:
+            await sink.send_error_async(
+                SlimRPCError(code=code_pb2.INTERNAL, message=str(e), details=None)
+            )
+        finally:
+            await stream.aclose()  # type: ignore[attr-defined]
+            if abandoned and not finished and self.servicer.cancel_abandoned_streams:
+                await self.servicer.on_stream_abandoned(
+                    message_request, context, task_id
+                )
+
+
+class _SubscribeToTaskHandler(slim_bindings.UnaryStreamHandler):
+    """Streams 'SubscribeToTask' events serialized once for all subscribers."""
+
+    def __init__(self, servicer: SRPCHandler) -> None:
+        self.servicer = servicer
+
+    async def handle(
+        self,
+        request: bytes,
+        context: slim_bindings.Context,
+        sink: slim_bindings.ResponseSink,
+    ) -> None:
+        async with self.servicer._flow(sink, context) as flow_sink:
+            try:
+                async for data in self.servicer.serialized_subscription(
+                    a2a_pb2.SubscribeToTaskRequest.FromString(request), context
+                ):
+                    await flow_sink.send_async(data)
+                await flow_sink.close_async()
+            except slim_bindings.RpcError as e:
+                await flow_sink.send_error_async(e)
+            except Exception as e:
+                await flow_sink.send_error_async(
+                    SlimRPCError(code=code_pb2.INTERNAL, message=str(e), details=None)
+                )
+
+
+class _SendMessagesHandler(slim_bindings.UnaryUnaryHandler):
+    """Runs a batch of 'SendMessage' requests with bounded concurrency."""
+
+    def __init__(self, servicer: SRPCHandler) -> None:
+        self.servicer = servicer
+
+    async def handle(self, request: bytes, context: slim_bindings.Context) -> bytes:
+        try:
+            requests = [
+                a2a_pb2.SendMessageRequest.FromString(frame)
+                for frame in decode_frames(request)
+            ]
+        except (ValueError, DecodeError) as e:
+            raise SlimRPCError(
+                code=code_pb2.INVALID_ARGUMENT,
+                message=f"Malformed SendMessages batch: {e}",
+                details=None,
+            ) from e
+        if len(requests) > MAX_BATCH_SIZE:
+            raise SlimRPCError(
+                code=code_pb2.INVALID_ARGUMENT,
+                message=f"SendMessages batches hold at most {MAX_BATCH_SIZE} messages",
+                details=None,
+            )
+        semaphore = asyncio.Semaphore(self.servicer.batch_concurrency)
+
+        async def send(message: a2a_pb2.SendMessageRequest) -> bytes:
+            async with semaphore:
+                try:
+                    response = await self.servicer.SendMessage(message, context)
+                except Exception as e:
+                    return error_status(e).SerializeToString()
+            return response_status(response).SerializeToString()
+
+        self.servicer.stats.batches += 1
+        self.servicer.stats.batched_messages += len(requests)
+        return encode_frames(list(await asyncio.gather(*map(send, requests))))
+
+
+class _GrantCreditsHandler(slim_bindings.UnaryUnaryHandler):
+    """Adds the credits granted by a consumer to its flow-controlled stream."""
+
+    def __init__(self, flow_controller: CreditFlowController) -> None:
+        self.flow_controller = flow_controller
+
+    async def handle(self, request: bytes, context: slim_bindings.Context) -> bytes:
+        window = self.flow_controller.grant(
+            get_metadata_value(context, STREAM_ID_HEADER),
+            wrappers_pb2.UInt32Value.FromString(request).value,
+        )
+        return wrappers_pb2.UInt32Value(value=window).SerializeToString()
+
+
+def add_SRPCHandler_to_server(
+    handler: SRPCHandler,
+    server: slim_bindings.Server,
+) -> None:
+    """Registers an SRPCHandler with a slimrpc server.
+
+    Unlike the generated ``add_A2AServiceServicer_to_server``, the agent card is
+    answered from the handler's SerializedCardCache without re-serializing it,
+    and so are terminal tasks when the handler has a SerializedTaskCache.
+    Task subscriptions share serialized events when it has a SubscriptionHub,
+    and streams left by their caller cancel their task when it has
+    cancel_abandoned_streams set. With a CreditFlowController, streams are
+    paced by their consumer and the ``GrantCredits`` method is registered.
+    The ``SendMessages`` batch method is registered when batch_concurrency
+    is set.
+    """
+    unary_unary: dict[str, slim_bindings.UnaryUnaryHandler] = {
+        "GetExtendedAgentCard": _GetExtendedAgentCardHandler(handler)
+    }
+    if handler.task_cache is not None:
+        unary_unary["GetTask"] = _GetTaskHandler(handler)
+    unary_stream: dict[str, slim_bindings.UnaryStreamHandler] = {}
+    if handler.cancel_abandoned_streams or handler.flow_controller is not None:
+        unary_stream["SendStreamingMessage"] = _SendStreamingMessageHandler(handler)
+    if handler.subscription_hub is not None or handler.flow_controller is not None:
+        unary_stream["SubscribeToTask"] = _SubscribeToTaskHandler(handler)
+    if handler.batch_concurrency > 0:
+        server.register_unary_unary(
+            service_name=BATCH_SERVICE,
+            method_name=SEND_MESSAGES_METHOD,
+            handler=_SendMessagesHandler(handler),
+        )
+    if handler.flow_controller is not None:
+        server.register_unary_unary(
+            service_name=FLOW_CONTROL_SERVICE,
+            method_name=GRANT_CREDITS_METHOD,
+            handler=_GrantCreditsHandler(handler.flow_controller),
+        )
+    register_servicer(
+        a2a_pb2_slimrpc.add_A2AServiceServicer_to_server,
+        handler,
+        server,
+        unary_unary=unary_unary,
+        unary_stream=unary_stream,
+    )
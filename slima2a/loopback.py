@@ -0,0 +1,544 @@
+# Copyright AGNTCY Contributors (https://github.com/agntcy)
+# SPDX-License-Identifier: Apache-2.0
+
+"""In-process loopback implementation of the slimrpc Channel and Server.
+
+The loopback classes implement the parts of ``slim_bindings.Channel`` and
+``slim_bindings.Server`` used by the generated stubs and servicers, so that a
+client transport and a handler can talk to each other inside one event loop
+without a SLIM node. They are meant for tests, benchmarks and profiling.
+
+Example:
+    >>> server = LoopbackServer()
+    >>> add_SRPCHandler_to_server(SRPCHandler(agent_card, request_handler), server)
+    >>> client_config = ClientConfig(
+    ...     supported_protocol_bindings=["slimrpc"],
+    ...     slimrpc_channel_factory=loopback_channel_factory(
+    ...         {"agntcy/demo/echo_agent": server}
+    ...     ),
+    ... )
+"""
+
+import asyncio
+import contextlib
+import logging
+from collections.abc import Callable, Coroutine, Mapping
+from datetime import datetime, timedelta, timezone
+from typing import Any, cast
+
+import slim_bindings
+
+logger = logging.getLogger(__name__)
+
+SlimRPCError = slim_bindings.RpcError.Rpc  # type: ignore[attr-defined]
+
+DEFAULT_TIMEOUT = timedelta(minutes=5)
+"""Deadline of loopback calls made without a timeout."""
+
+
+def _parse_name(name: str) -> slim_bindings.Name:
+    parts = name.split("/")
+    if len(parts) != 3:
+        raise ValueError(
+            f"Invalid remote format: '{name}'. Expected format: 'component1/component2/component'"
+        )
+    return slim_bindings.Name(parts[0], parts[1], parts[2])
+
+
+def _rpc_error(code: slim_bindings.RpcCode, message: str) -> slim_bindings.RpcError:
+    return cast(
+        slim_bindings.RpcError, SlimRPCError(code=code, message=message, details=None)
+    )
+
+
+def _deadline_exceeded() -> slim_bindings.RpcError:
+    return _rpc_error(slim_bindings.RpcCode.DEADLINE_EXCEEDED, "deadline exceeded")
+
+
+def _stream_data(data: bytes) -> slim_bindings.StreamMessage:
+    return cast(slim_bindings.StreamMessage, slim_bindings.StreamMessage.DATA(data))  # type: ignore[call-arg]
+
+
+def _stream_error(error: slim_bindings.RpcError) -> slim_bindings.StreamMessage:
+    return cast(slim_bindings.StreamMessage, slim_bindings.StreamMessage.ERROR(error))  # type: ignore[call-arg]
+
+
+def _stream_end() -> slim_bindings.StreamMessage:
+    return cast(slim_bindings.StreamMessage, slim_bindings.StreamMessage.END())
+
+
+def _multicast_data(
+    source: slim_bindings.Name, data: bytes
+) -> slim_bindings.MulticastStreamMessage:
+    item = slim_bindings.RpcMulticastItem(
+        context=slim_bindings.RpcMessageContext(source=source), message=data
+    )
+    return cast(
+        slim_bindings.MulticastStreamMessage,
+        slim_bindings.MulticastStreamMessage.DATA(item),
+    )
+
+
+def _multicast_error(
+    error: slim_bindings.RpcError,
+) -> slim_bindings.MulticastStreamMessage:
+    return cast(
+        slim_bindings.MulticastStreamMessage,
+        slim_bindings.MulticastStreamMessage.ERROR(error),  # type: ignore[call-arg]
+    )
+
+
+def _multicast_end() -> slim_bindings.MulticastStreamMessage:
+    return cast(
+        slim_bindings.MulticastStreamMessage,
+        slim_bindings.MulticastStreamMessage.END(),
+    )
+
+
+class LoopbackContext:
+    """Stand-in for the ``slim_bindings.Context`` passed to method handlers."""
+
+    def __init__(
+        self,
+        deadline: datetime,
+        metadata: dict[str, str] | None = None,
+        session_id: str = "loopback",
+    ) -> None:
+        """Initializes the LoopbackContext.
+
+        Args:
+            deadline: The caller's deadline (timezone aware).
+            metadata: The metadata sent by the caller.
+            session_id: The session id reported to the handler.
+        """
+        self._deadline = deadline
+        self._metadata = dict(metadata or {})
+        self._session_id = session_id
+
+    def deadline(self) -> datetime:
+        return self._deadline
+
+    def remaining_time(self) -> timedelta:
+        return max(self._deadline - datetime.now(timezone.utc), timedelta(0))
+
+    def is_deadline_exceeded(self) -> bool:
+        return datetime.now(timezone.utc) >= self._deadline
+
+    def metadata(self) -> dict[str, str]:
+        return self._metadata
+
+    def session_id(self) -> str:
+        return self._session_id
+
+
+class LoopbackResponseSink:
+    """Stand-in for the ``slim_bindings.ResponseSink`` of streaming handlers.
+
+    Messages are queued for the LoopbackResponseStream of the caller. With a
+    ``max_buffered`` limit, ``send_async`` waits while the caller lags behind.
+    """
+
+    def __init__(self, max_buffered: int = 0) -> None:
+        """Initializes the LoopbackResponseSink.
+
+        Args:
+            max_buffered: Maximum number of queued messages. 0 is unbounded.
+        """
+        self._queue: asyncio.Queue[slim_bindings.StreamMessage] = asyncio.Queue(
+            max_buffered
+        )
+        self._closed = False
+
+    async def send_async(self, data: bytes) -> None:
+        self._check_open()
+        await self._queue.put(_stream_data(data))
+
+    async def send_error_async(self, error: slim_bindings.RpcError) -> None:
+        self._check_open()
+        self._closed = True
+        await self._queue.put(_stream_error(error))
+
+    async def close_async(self) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        await self._queue.put(_stream_end())
+
+    async def is_closed_async(self) -> bool:
+        return self._closed
+
+    async def _next(self) -> slim_bindings.StreamMessage:
+        return await self._queue.get()
+
+    def _check_open(self) -> None:
+        if self._closed:
+            raise _rpc_error(slim_bindings.RpcCode.CANCELLED, "stream is closed")
+
+
+class LoopbackResponseStream:
+    """Stand-in for ``slim_bindings.ResponseStreamReader``."""
+
+    def __init__(
+        self,
+        sink: LoopbackResponseSink,
+        task: asyncio.Task[None],
+        deadline: datetime,
+    ) -> None:
+        self._sink = sink
+        self._task = task
+        self._deadline = deadline
+        self._done = False
+
+    async def next_async(self) -> slim_bindings.StreamMessage:
+        if self._done:
+            return _stream_end()
+        remaining = (self._deadline - datetime.now(timezone.utc)).total_seconds()
+        try:
+            message = await asyncio.wait_for(self._sink._next(), max(remaining, 0))
+        except asyncio.TimeoutError:
+            self.cancel()
+            return _stream_error(_deadline_exceeded())
+        if not message.is_data():
+            self._done = True
+        return message
+
+    def cancel(self) -> None:
+        """Stops the handler producing the stream."""
+        self._done = True
+        self._task.cancel()
+
+    def __del__(self) -> None:
+        self.cancel()
+
+
+class LoopbackServer:
+    """Stand-in for ``slim_bindings.Server`` dispatching loopback calls."""
+
+    def __init__(self, max_buffered: int = 0) -> None:
+        """Initializes the LoopbackServer.
+
+        Args:
+            max_buffered: Maximum number of messages buffered per response
+                          stream. 0 is unbounded.
+        """
+        self.max_buffered = max_buffered
+        self._unary_unary: dict[tuple[str, str], slim_bindings.UnaryUnaryHandler] = {}
+        self._unary_stream: dict[tuple[str, str], slim_bindings.UnaryStreamHandler] = {}
+        self._shutdown = asyncio.Event()
+
+    def register_unary_unary(
+        self,
+        service_name: str,
+        method_name: str,
+        handler: slim_bindings.UnaryUnaryHandler,
+    ) -> None:
+        self._unary_unary[(service_name, method_name)] = handler
+
+    def register_unary_stream(
+        self,
+        service_name: str,
+        method_name: str,
+        handler: slim_bindings.UnaryStreamHandler,
+    ) -> None:
+        self._unary_stream[(service_name, method_name)] = handler
+
+    async def serve_async(self) -> None:
+        await self._shutdown.wait()
+
+    async def shutdown_async(self) -> None:
+        self._shutdown.set()
+
+    async def handle_unary(
+        self,
+        service_name: str,
+        method_name: str,
+        request: bytes,
+        context: LoopbackContext,
+    ) -> bytes:
+        """Runs the unary-unary handler of a method."""
+        handler = self._unary_unary.get((service_name, method_name))
+        if handler is None:
+            raise self._unimplemented(service_name, method_name)
+        return await handler.handle(request, context)  # type: ignore[arg-type]
+
+    def handle_stream(
+        self,
+        service_name: str,
+        method_name: str,
+        request: bytes,
+        context: LoopbackContext,
+    ) -> LoopbackResponseStream:
+        """Starts the unary-stream handler of a method."""
+        handler = self._unary_stream.get((service_name, method_name))
+        if handler is None:
+            raise self._unimplemented(service_name, method_name)
+        sink = LoopbackResponseSink(self.max_buffered)
+        task = asyncio.create_task(self._run_stream(handler, request, context, sink))
+        return LoopbackResponseStream(sink, task, context.deadline())
+
+    async def _run_stream(
+        self,
+        handler: slim_bindings.UnaryStreamHandler,
+        request: bytes,
+        context: LoopbackContext,
+        sink: LoopbackResponseSink,
+    ) -> None:
+        try:
+            await handler.handle(request, context, sink)  # type: ignore[arg-type]
+        except slim_bindings.RpcError as e:
+            with contextlib.suppress(slim_bindings.RpcError):
+                await sink.send_error_async(e)
+        except Exception as e:
+            logger.exception("Loopback stream handler failed")
+            with contextlib.suppress(slim_bindings.RpcError):
+                await sink.send_error_async(
+                    _rpc_error(slim_bindings.RpcCode.INTERNAL, str(e))
+                )
+        await sink.close_async()
+
+    def _unimplemented(self, service_name: str, method_name: str) -> Exception:
+        return _rpc_error(
+            slim_bindings.RpcCode.UNIMPLEMENTED,
+            f"method {service_name}/{method_name} is not registered",
+        )
+
+
+def _new_context(
+    timeout: timedelta | None,
+    metadata: dict[str, str] | None,
+    default_timeout: timedelta,
+) -> LoopbackContext:
+    deadline = datetime.now(timezone.utc) + (timeout or default_timeout)
+    return LoopbackContext(deadline, metadata)
+
+
+async def _call_with_deadline(
+    call: Coroutine[Any, Any, bytes],
+    context: LoopbackContext,
+) -> bytes:
+    task = asyncio.ensure_future(call)
+    try:
+        done, _ = await asyncio.wait(
+            {task}, timeout=context.remaining_time().total_seconds()
+        )
+    except BaseException:
+        task.cancel()
+        raise
+    if not done:
+        task.cancel()
+        raise _deadline_exceeded()
+    return task.result()
+
+
+class LoopbackChannel:
+    """Stand-in for a unicast ``slim_bindings.Channel`` bound to one server."""
+
+    def __init__(
+        self,
+        server: LoopbackServer,
+        default_timeout: timedelta = DEFAULT_TIMEOUT,
+    ) -> None:
+        """Initializes the LoopbackChannel.
+
+        Args:
+            server: The LoopbackServer receiving the calls.
+            default_timeout: Deadline of calls made without a timeout.
+        """
+        self.server = server
+        self.default_timeout = default_timeout
+
+    async def call_unary_async(
+        self,
+        service_name: str,
+        method_name: str,
+        request: bytes,
+        timeout: timedelta | None,
+        metadata: dict[str, str] | None,
+    ) -> bytes:
+        context = _new_context(timeout, metadata, self.default_timeout)
+        return await _call_with_deadline(
+            self.server.handle_unary(service_name, method_name, request, context),
+            context,
+        )
+
+    async def call_unary_stream_async(
+        self,
+        service_name: str,
+        method_name: str,
+        request: bytes,
+        timeout: timedelta | None,
+        metadata: dict[str, str] | None,
+    ) -> LoopbackResponseStream:
+        context = _new_context(timeout, metadata, self.default_timeout)
+        return self.server.handle_stream(service_name, method_name, request, context)
+
+    async def close_async(self, timeout: timedelta | None = None) -> None:
+        return None
+
+
+class LoopbackMulticastReader:
+    """Stand-in for ``slim_bindings.MulticastResponseReader``."""
+
+    def __init__(self, deadline: datetime) -> None:
+        self._queue: asyncio.Queue[slim_bindings.MulticastStreamMessage] = (
+            asyncio.Queue()
+        )
+        self._deadline = deadline
+        self._tasks: list[asyncio.Task[None]] = []
+        self._done = False
+
+    def _start(self, members: list[Coroutine[Any, Any, None]]) -> None:
+        # Member calls only reference the queue, so dropping the reader
+        # cancels them like dropping a native reader does.
+        queue = self._queue
+        self._tasks = [asyncio.create_task(member) for member in members]
+        remaining = len(self._tasks)
+
+        def finished(_: asyncio.Task[None]) -> None:
+            nonlocal remaining
+            remaining -= 1
+            if remaining == 0:
+                queue.put_nowait(_multicast_end())
+
+        for task in self._tasks:
+            task.add_done_callback(finished)
+        if not self._tasks:
+            queue.put_nowait(_multicast_end())
+
+    async def next_async(self) -> slim_bindings.MulticastStreamMessage:
+        if self._done:
+            return _multicast_end()
+        remaining = (self._deadline - datetime.now(timezone.utc)).total_seconds()
+        try:
+            message = await asyncio.wait_for(self._queue.get(), max(remaining, 0))
+        except asyncio.TimeoutError:
+            self.cancel()
+            return _multicast_error(_deadline_exceeded())
+        if message.is_end():
+            self._done = True
+        return message
+
+    def cancel(self) -> None:
+        """Stops every member call still running."""
+        self._done = True
+        for task in self._tasks:
+            task.cancel()
+
+    def __del__(self) -> None:
+        self.cancel()
+
+
+class LoopbackGroupChannel:
+    """Stand-in for a group ``slim_bindings.Channel`` over several servers."""
+
+    def __init__(
+        self,
+        members: Mapping[str, LoopbackServer],
+        default_timeout: timedelta = DEFAULT_TIMEOUT,
+    ) -> None:
+        """Initializes the LoopbackGroupChannel.
+
+        Args:
+            members: The LoopbackServers of the group, keyed by SLIM name.
+            default_timeout: Deadline of calls made without a timeout.
+        """
+        self.members = dict(members)
+        self.default_timeout = default_timeout
+
+    async def call_multicast_unary_async(
+        self,
+        service_name: str,
+        method_name: str,
+        request: bytes,
+        timeout: timedelta | None,
+        metadata: dict[str, str] | None,
+    ) -> LoopbackMulticastReader:
+        context = _new_context(timeout, metadata, self.default_timeout)
+        reader = LoopbackMulticastReader(context.deadline())
+        put = reader._queue.put_nowait
+
+        async def call(name: str, server: LoopbackServer) -> None:
+            try:
+                data = await server.handle_unary(
+                    service_name, method_name, request, context
+                )
+            except slim_bindings.RpcError as e:
+                put(_multicast_error(e))
+                return
+            put(_multicast_data(_parse_name(name), data))
+
+        reader._start([call(n, s) for n, s in self.members.items()])
+        return reader
+
+    async def call_multicast_unary_stream_async(
+        self,
+        service_name: str,
+        method_name: str,
+        request: bytes,
+        timeout: timedelta | None,
+        metadata: dict[str, str] | None,
+    ) -> LoopbackMulticastReader:
+        context = _new_context(timeout, metadata, self.default_timeout)
+        reader = LoopbackMulticastReader(context.deadline())
+        put = reader._queue.put_nowait
+
+        async def call(name: str, server: LoopbackServer) -> None:
+            source = _parse_name(name)
+            try:
+                stream = server.handle_stream(
+                    service_name, method_name, request, context
+                )
+            except slim_bindings.RpcError as e:
+                put(_multicast_error(e))
+                return
+            try:
+                while True:
+                    message = await stream.next_async()
+                    if message.is_data():
+                        put(_multicast_data(source, message[0]))  # type: ignore[index]
+                        continue
+                    if message.is_error():
+                        put(
+                            _multicast_error(message[0])  # type: ignore[index]
+                        )
+                    return
+            finally:
+                stream.cancel()
+
+        reader._start([call(n, s) for n, s in self.members.items()])
+        return reader
+
+    async def close_async(self, timeout: timedelta | None = None) -> None:
+        return None
+
+
+def loopback_channel_factory(
+    servers: Mapping[str, LoopbackServer],
+) -> Callable[[str], slim_bindings.Channel]:
+    """Returns a ``slimrpc_channel_factory`` connecting to loopback servers.
+
+    Args:
+        servers: The LoopbackServers reachable by the client, keyed by SLIM name.
+    """
+
+    def factory(remote: str) -> slim_bindings.Channel:
+        _parse_name(remote)
+        return LoopbackChannel(servers[remote])  # type: ignore[return-value]
+
+    return factory
+
+
+def loopback_group_channel_factory(
+    servers: Mapping[str, LoopbackServer],
+) -> Callable[[list[str]], slim_bindings.Channel]:
+    """Returns a ``slimrpc_group_channel_factory`` over loopback servers.
+
+    Args:
+        servers: The LoopbackServers reachable by the client, keyed by SLIM name.
+    """
+
+    def factory(remotes: list[str]) -> slim_bindings.Channel:
+        members = {remote: servers[remote] for remote in remotes}
+        return LoopbackGroupChannel(members)  # type: ignore[return-value]
+
+    return factory
@@ -0,0 +1,111 @@
+# Copyright AGNTCY Contributors (https://github.com/agntcy)
+# SPDX-License-Identifier: Apache-2.0
+
+"""Membership changes of a multicast group applied without rebuilding its channel."""
+
+import asyncio
+from collections.abc import AsyncGenerator, Awaitable, Callable
+from typing import Any, TypeVar
+
+import slim_bindings
+
+T = TypeVar("T")
+
+_DONE = object()
+
+
+class _Failed:
+    """Queue entry carrying the error that ended a merged stream."""
+
+    def __init__(self, error: Exception) -> None:
+        self.error = error
+
+
+def member_context(name: str) -> slim_bindings.RpcMessageContext:
+    """Returns the multicast source identifying the member ``name``."""
+    parts = name.split("/")
+    if len(parts) != 3:
+        raise ValueError(
+            f"Invalid remote format: '{name}'. Expected format: 'component1/component2/component'"
+        )
+    return slim_bindings.RpcMessageContext(
+        source=slim_bindings.Name(parts[0], parts[1], parts[2])
+    )
+
+
+async def read_member(
+    name: str,
+    open_call: Callable[[], Awaitable[Any]],
+    deserialize: Callable[[bytes], T],
+    streaming: bool = False,
+    raise_errors: bool = False,
+) -> AsyncGenerator[tuple[Any, T | Exception], None]:
+    """Reads a unicast call to one member like a multicast call.
+
+    Responses are attributed to ``name`` as if they came from the group, so
+    they can be merged with its stream.
+
+    Args:
+        name: The SLIM name of the member.
+        open_call: Starts the call and returns its response, or its response
+                   stream when ``streaming`` is set.
+        deserialize: Parses a response.
+        streaming: Whether the call is a unary-stream call.
+        raise_errors: Raise the member's error instead of yielding it.
+    """
+    source = member_context(name)
+    try:
+        if not streaming:
+            yield source, deserialize(await open_call())
+            return
+        stream = await open_call()
+        while True:
+            message = await stream.next_async()
+            if message.is_end():
+                return
+            if message.is_error():
+                raise message[0]
+            if message.is_data():
+                yield source, deserialize(message[0])
+    except Exception as e:
+        if raise_errors:
+            raise
+        yield source, e
+
+
+async def merge_streams(
+    streams: list[AsyncGenerator[T, None]],
+) -> AsyncGenerator[T, None]:
+    """Yields the items of several streams as they arrive.
+
+    The first error raised by a stream is raised, and the other streams are
+    closed when the merged stream is.
+    """
+    queue: asyncio.Queue[Any] = asyncio.Queue()
+
+    async def pump(stream: AsyncGenerator[T, None]) -> None:
+        try:
+            async for item in stream:
+                queue.put_nowait(item)
+        except Exception as e:
+            queue.put_nowait(_Failed(e))
+        finally:
+            queue.put_nowait(_DONE)
+
+    tasks = [asyncio.create_task(pump(stream)) for stream in streams]
+    remaining = len(tasks)
+    try:
+        while remaining:
+            item = await queue.get()
+            if item is _DONE:
+                remaining -= 1
+                continue
+            if isinstance(item, _Failed):
+                raise item.error
+            yield item
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        for stream in streams:
+            await stream.aclose()
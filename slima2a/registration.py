@@ -0,0 +1,70 @@
+# Copyright AGNTCY Contributors (https://github.com/agntcy)
+# SPDX-License-Identifier: Apache-2.0
+
+"""Registration of servicers with byte-level method overrides."""
+
+from collections.abc import Callable, Mapping
+
+import slim_bindings
+
+
+class _OverridingServer:
+    """Forwards registrations to a server, substituting overridden handlers."""
+
+    def __init__(
+        self,
+        server: slim_bindings.Server,
+        unary_unary: Mapping[str, slim_bindings.UnaryUnaryHandler],
+        unary_stream: Mapping[str, slim_bindings.UnaryStreamHandler],
+    ) -> None:
+        self._server = server
+        self._unary_unary = unary_unary
+        self._unary_stream = unary_stream
+
+    def register_unary_unary(
+        self,
+        service_name: str,
+        method_name: str,
+        handler: slim_bindings.UnaryUnaryHandler,
+    ) -> None:
+        self._server.register_unary_unary(
+            service_name=service_name,
+            method_name=method_name,
+            handler=self._unary_unary.get(method_name, handler),
+        )
+
+    def register_unary_stream(
+        self,
+        service_name: str,
+        method_name: str,
+        handler: slim_bindings.UnaryStreamHandler,
+    ) -> None:
+        self._server.register_unary_stream(
+            service_name=service_name,
+            method_name=method_name,
+            handler=self._unary_stream.get(method_name, handler),
+        )
+
+
+def register_servicer(
+    add_to_server: Callable[[object, slim_bindings.Server], None],
+    servicer: object,
+    server: slim_bindings.Server,
+    unary_unary: Mapping[str, slim_bindings.UnaryUnaryHandler] | None = None,
+    unary_stream: Mapping[str, slim_bindings.UnaryStreamHandler] | None = None,
+) -> None:
+    """Registers ``servicer`` through a generated ``add_*_to_server`` function.
+
+    The generated method handlers deserialize every request and serialize every
+    response. The given handlers, keyed by method name, replace them so a
+    servicer can answer with bytes it has already serialized.
+
+    Args:
+        add_to_server: The generated registration function of the service.
+        servicer: The servicer passed to ``add_to_server``.
+        server: The slimrpc server the methods are registered with.
+        unary_unary: Replacement unary-unary handlers, keyed by method name.
+        unary_stream: Replacement unary-stream handlers, keyed by method name.
+    """
+    overriding = _OverridingServer(server, unary_unary or {}, unary_stream or {})
+    add_to_server(servicer, overriding)  # type: ignore[arg-type]
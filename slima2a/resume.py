@@ -0,0 +1,216 @@
+# Copyright AGNTCY Contributors (https://github.com/agntcy)
+# SPDX-License-Identifier: Apache-2.0
+
+"""Sequence numbers and replay of stream events for resuming broken streams."""
+
+from collections import OrderedDict, deque
+from collections.abc import Hashable
+from dataclasses import dataclass
+
+import slim_bindings
+from a2a.types.a2a_pb2 import StreamResponse
+from google.protobuf.struct_pb2 import Struct
+from google.rpc import code_pb2
+
+SlimRPCError = slim_bindings.RpcError.Rpc  # type: ignore[attr-defined]
+
+RESUME_AFTER_HEADER = "x-slima2a-resume-after"
+"""Request metadata asking SubscribeToTask to replay events after a sequence number."""
+
+SEQUENCE_METADATA_KEY = "slima2a.seq"
+"""Key of the sequence number stamped into the metadata of stream events."""
+
+_TRANSIENT_CODES = frozenset(
+    {slim_bindings.RpcCode.UNAVAILABLE.value, slim_bindings.RpcCode.ABORTED.value}
+)
+
+
+def _metadata(response: StreamResponse) -> Struct | None:
+    which = response.WhichOneof("payload")
+    if which is None:
+        return None
+    return getattr(response, which).metadata
+
+
+def stamp_sequence(response: StreamResponse, seq: int) -> None:
+    """Stores ``seq`` in the metadata of the event carried by ``response``."""
+    metadata = _metadata(response)
+    if metadata is not None:
+        metadata[SEQUENCE_METADATA_KEY] = seq
+
+
+def pop_sequence(response: StreamResponse) -> int | None:
+    """Removes and returns the sequence number stamped into ``response``, if any."""
+    metadata = _metadata(response)
+    if metadata is None or SEQUENCE_METADATA_KEY not in metadata:
+        return None
+    seq = int(metadata.fields[SEQUENCE_METADATA_KEY].number_value)
+    del metadata[SEQUENCE_METADATA_KEY]
+    return seq
+
+
+def response_task_id(response: StreamResponse) -> str:
+    """Returns the id of the task ``response`` is about, or "" for messages."""
+    which = response.WhichOneof("payload")
+    if which == "task":
+        return response.task.id
+    if which in ("status_update", "artifact_update"):
+        return str(getattr(response, which).task_id)
+    return ""
+
+
+def _code(error: slim_bindings.RpcError) -> object:
+    code = getattr(error, "code", None)
+    return getattr(code, "value", code)
+
+
+def is_transient_error(error: slim_bindings.RpcError) -> bool:
+    """Returns whether a stream broken by ``error`` may be resumed."""
+    return _code(error) in _TRANSIENT_CODES
+
+
+def is_replay_gap(error: slim_bindings.RpcError) -> bool:
+    """Returns whether ``error`` reports events that can no longer be replayed."""
+    return _code(error) == slim_bindings.RpcCode.OUT_OF_RANGE.value
+
+
+@dataclass
+class ReplayBufferStats:
+    """Counters describing the behaviour of a ReplayBuffer."""
+
+    recorded: int = 0
+    resumed: int = 0
+    replayed: int = 0
+    gaps: int = 0
+    """Resumes refused because their events were dropped from the buffer."""
+
+
+class _TaskEvents:
+    def __init__(self, max_events: int) -> None:
+        self.next_seq = 1
+        self.events: deque[tuple[int, StreamResponse, object]] = deque(
+            maxlen=max_events
+        )
+
+
+class ReplayBuffer:
+    """Keeps the last events streamed for each task, numbered in order.
+
+    Every event of a message stream or task subscription is stamped with
+    the next sequence number of its task and kept in a ring of
+    ``max_events`` per task. A
+    client whose stream broke resubscribes to the task asking for the events
+    after the last sequence number it received, and gets them replayed
+    before the live events. The buffers of the ``max_tasks`` most recently
+    streamed tasks are kept.
+
+    Example:
+        >>> handler = SRPCHandler(
+        ...     agent_card, request_handler, replay_buffer=ReplayBuffer()
+        ... )
+    """
+
+    def __init__(self, max_events: int = 64, max_tasks: int = 1024) -> None:
+        """Initializes the ReplayBuffer.
+
+        Args:
+            max_events: Maximum number of events kept per task.
+            max_tasks: Maximum number of tasks whose events are kept.
+        """
+        if max_events < 1:
+            raise ValueError("max_events must be at least 1")
+        if max_tasks < 1:
+            raise ValueError("max_tasks must be at least 1")
+        self.max_events = max_events
+        self.max_tasks = max_tasks
+        self.stats = ReplayBufferStats()
+        self._tasks: OrderedDict[Hashable, _TaskEvents] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._tasks)
+
+    def record(
+        self, key: Hashable, response: StreamResponse, event: object = None
+    ) -> int:
+        """Stamps ``response`` with the next sequence number of ``key`` and keeps it.
+
+        Args:
+            key: Identifies the task the event is about.
+            response: The response streamed for the event.
+            event: The source event ``response`` was built from, as produced
+                   by the request handler before any coalescing. Streams
+                   observing the same event, e.g. a message stream and a
+                   subscription to its task, get the sequence number it was
+                   kept under.
+
+        Returns:
+            The sequence number of the event.
+        """
+        task = self._tasks.get(key)
+        if task is None:
+            task = self._tasks[key] = _TaskEvents(self.max_events)
+            while len(self._tasks) > self.max_tasks:
+                self._tasks.popitem(last=False)
+        else:
+            self._tasks.move_to_end(key)
+            kept = self._find(task, event)
+            if kept is not None:
+                stamp_sequence(response, kept[0])
+                return kept[0]
+        seq = task.next_seq
+        task.next_seq += 1
+        stamp_sequence(response, seq)
+        task.events.append((seq, response, event))
+        self.stats.recorded += 1
+        return seq
+
+    def find(self, key: Hashable, event: object) -> tuple[int, StreamResponse] | None:
+        """Returns the sequence number and response kept for the source ``event``.
+
+        Returns:
+            None if ``event`` was not recorded or was dropped from the buffer.
+        """
+        task = self._tasks.get(key)
+        if task is None:
+            return None
+        return self._find(task, event)
+
+    @staticmethod
+    def _find(task: _TaskEvents, event: object) -> tuple[int, StreamResponse] | None:
+        if event is None:
+            return None
+        # Streams observe an event shortly after it was recorded, so it is
+        # looked up from the newest end.
+        for seq, response, kept in reversed(task.events):
+            if kept is event:
+                return seq, response
+        return None
+
+    def replay(self, key: Hashable, after: int) -> list[StreamResponse]:
+        """Returns the kept events of ``key`` numbered after ``after``.
+
+        Raises:
+            SlimRPCError: OUT_OF_RANGE when some of those events were already
+                          dropped from the buffer, or the task was dropped
+                          and numbered anew. The client then has to fetch
+                          the task instead of resuming its stream.
+        """
+        self.stats.resumed += 1
+        task = self._tasks.get(key)
+        if task is None:
+            missing = after > 0
+        else:
+            oldest = task.events[0][0] if task.events else task.next_seq
+            missing = oldest > after + 1 or after >= task.next_seq
+        if missing:
+            self.stats.gaps += 1
+            raise SlimRPCError(
+                code=code_pb2.OUT_OF_RANGE,
+                message=f"Events after {after} are no longer kept for replay",
+                details=None,
+            )
+        if task is None:
+            return []
+        events = [response for seq, response, _ in task.events if seq > after]
+        self.stats.replayed += len(events)
+        return events
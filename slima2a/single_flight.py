@@ -0,0 +1,53 @@
+# Copyright AGNTCY Contributors (https://github.com/agntcy)
+# SPDX-License-Identifier: Apache-2.0
+
+"""De-duplication of concurrent calls sharing a key."""
+
+import asyncio
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Generic, TypeVar
+
+T = TypeVar("T")
+
+
+class SingleFlight(Generic[T]):
+    """Runs at most one call per key at a time.
+
+    Callers asking for a key whose call is already in flight wait for that
+    call's result instead of starting their own. The shared call keeps
+    running when the caller that started it is cancelled, as long as other
+    callers may still need its result.
+
+    Example:
+        >>> flight: SingleFlight[Task] = SingleFlight()
+        >>> task = await flight.do(task_id, lambda: fetch_task(task_id))
+    """
+
+    def __init__(self) -> None:
+        """Initializes the SingleFlight."""
+        self.shared_calls = 0
+        self._calls: dict[Hashable, asyncio.Future[T]] = {}
+
+    def __len__(self) -> int:
+        return len(self._calls)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._calls
+
+    async def do(self, key: Hashable, call: Callable[[], Awaitable[T]]) -> T:
+        """Returns the result of ``call``, shared with concurrent callers of ``key``."""
+        future = self._calls.get(key)
+        if future is None:
+            future = asyncio.ensure_future(call())
+            self._calls[key] = future
+            future.add_done_callback(lambda done: self._forget(key, done))
+        else:
+            self.shared_calls += 1
+        return await asyncio.shield(future)
+
+    def _forget(self, key: Hashable, future: asyncio.Future[T]) -> None:
+        if self._calls.get(key) is future:
+            del self._calls[key]
+        if not future.cancelled():
+            # Mark the exception as retrieved when every caller went away.
+            future.exception()
@@ -0,0 +1,221 @@
+# Copyright AGNTCY Contributors (https://github.com/agntcy)
+# SPDX-License-Identifier: Apache-2.0
+
+"""Server and client side caches for GetTask results."""
+
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+
+from a2a.types.a2a_pb2 import GetTaskRequest, Task, TaskState
+
+from slima2a.single_flight import SingleFlight
+
+TERMINAL_TASK_STATES = frozenset(
+    {
+        TaskState.TASK_STATE_COMPLETED,
+        TaskState.TASK_STATE_FAILED,
+        TaskState.TASK_STATE_CANCELED,
+        TaskState.TASK_STATE_REJECTED,
+    }
+)
+"""States a task never leaves."""
+
+
+@dataclass
+class TaskCacheStats:
+    """Counters describing the behaviour of a task cache."""
+
+    hits: int = 0
+    misses: int = 0
+    fetches: int = 0
+    """RPCs sent. Misses beyond that were served by a concurrent fetch."""
+    evictions: int = 0
+
+
+TaskCacheKey = tuple[str, str, str, int | None]
+"""User name, tenant, task id and history length of a GetTask request."""
+
+
+class SerializedTaskCache:
+    """Caches the serialized GetTask responses of tasks in a terminal state.
+
+    Tasks that are completed, failed, canceled or rejected never change, so
+    handlers answer polls for them with the cached bytes instead of loading
+    the task and serializing its history and artifacts again. Entries are
+    keyed by caller, tenant, task id and history length, and evicted in least
+    recently used order once they take more than ``max_bytes``.
+
+    Example:
+        >>> handler = SRPCHandler(
+        ...     agent_card, request_handler, task_cache=SerializedTaskCache()
+        ... )
+    """
+
+    def __init__(self, max_bytes: int = 64 * 1024 * 1024) -> None:
+        """Initializes the SerializedTaskCache.
+
+        Args:
+            max_bytes: Maximum total size of the cached responses.
+        """
+        if max_bytes < 1:
+            raise ValueError("max_bytes must be at least 1")
+        self.max_bytes = max_bytes
+        self.size = 0
+        self.stats = TaskCacheStats()
+        self._entries: OrderedDict[TaskCacheKey, bytes] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: TaskCacheKey) -> bytes | None:
+        """Returns the cached response for ``key``, if any."""
+        data = self._entries.get(key)
+        if data is None:
+            self.stats.misses += 1
+            return None
+        self.stats.hits += 1
+        self._entries.move_to_end(key)
+        return data
+
+    def put(self, key: TaskCacheKey, task: Task) -> bytes:
+        """Serializes ``task``, caching the bytes if the task is terminal."""
+        data = task.SerializeToString()
+        if task.status.state not in TERMINAL_TASK_STATES or len(data) > self.max_bytes:
+            return data
+        previous = self._entries.pop(key, None)
+        if previous is not None:
+            self.size -= len(previous)
+        self._entries[key] = data
+        self.size += len(data)
+        while self.size > self.max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self.size -= len(evicted)
+            self.stats.evictions += 1
+        return data
+
+    def invalidate(self, task_id: str) -> int:
+        """Drops every response cached for ``task_id``.
+
+        Returns:
+            The number of responses dropped.
+        """
+        keys = [key for key in self._entries if key[2] == task_id]
+        for key in keys:
+            self.size -= len(self._entries.pop(key))
+        return len(keys)
+
+
+@dataclass
+class _CachedTask:
+    task: Task
+    expires_at: float
+
+
+_Key = tuple[str, bytes, tuple[tuple[str, str], ...]]
+
+
+def _copy_task(task: Task) -> Task:
+    copy = Task()
+    copy.CopyFrom(task)
+    return copy
+
+
+class AgentTaskCache:
+    """Shares GetTask calls of slimrpc transports polling the same tasks.
+
+    Concurrent identical GetTask requests to one agent are served by a single
+    RPC whose result is handed to every caller. With ``terminal_ttl`` set,
+    tasks in a terminal state, which can no longer change, are also served
+    from the cache for that many seconds. Requests are only shared when they
+    carry the same metadata, so callers with different credentials never see
+    each other's results. Every caller receives its own copy.
+
+    Example:
+        >>> client_config = ClientConfig(
+        ...     slimrpc_channel_factory=factory,
+        ...     slimrpc_task_cache=AgentTaskCache(terminal_ttl=5),
+        ... )
+    """
+
+    def __init__(
+        self,
+        terminal_ttl: float = 0.0,
+        max_size: int = 1024,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initializes the AgentTaskCache.
+
+        Args:
+            terminal_ttl: Seconds a task in a terminal state is served from
+                          the cache. 0 only coalesces concurrent requests.
+            max_size: Maximum number of tasks kept in the cache.
+            clock: Monotonic clock used to expire tasks.
+        """
+        if max_size < 1:
+            raise ValueError("max_size must be at least 1")
+        self.terminal_ttl = terminal_ttl
+        self.max_size = max_size
+        self.stats = TaskCacheStats()
+        self._clock = clock
+        self._entries: OrderedDict[_Key, _CachedTask] = OrderedDict()
+        self._flight: SingleFlight[Task] = SingleFlight()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    async def get_or_fetch(
+        self,
+        name: str,
+        request: GetTaskRequest,
+        fetch: Callable[[], Awaitable[Task]],
+        metadata: dict[str, str] | None = None,
+    ) -> Task:
+        """Returns the task asked for by ``request``, calling ``fetch`` if needed.
+
+        Args:
+            name: The SLIM name of the agent (e.g. "agntcy/demo/echo_agent").
+            request: The GetTask request.
+            fetch: Sends ``request`` to the agent.
+            metadata: The slimrpc metadata the request is sent with.
+        """
+        key: _Key = (
+            name,
+            request.SerializeToString(deterministic=True),
+            tuple(sorted((metadata or {}).items())),
+        )
+        entry = self._entries.get(key)
+        if entry is not None:
+            if self._clock() < entry.expires_at:
+                self.stats.hits += 1
+                self._entries.move_to_end(key)
+                return _copy_task(entry.task)
+            del self._entries[key]
+
+        self.stats.misses += 1
+        task = await self._flight.do(key, lambda: self._fetch(key, fetch))
+        return _copy_task(task)
+
+    def invalidate(self, name: str) -> int:
+        """Drops every task cached for agent ``name``.
+
+        Returns:
+            The number of tasks dropped.
+        """
+        keys = [key for key in self._entries if key[0] == name]
+        for key in keys:
+            del self._entries[key]
+        return len(keys)
+
+    async def _fetch(self, key: _Key, fetch: Callable[[], Awaitable[Task]]) -> Task:
+        self.stats.fetches += 1
+        task = await fetch()
+        if self.terminal_ttl > 0 and task.status.state in TERMINAL_TASK_STATES:
+            self._entries[key] = _CachedTask(
+                task=_copy_task(task), expires_at=self._clock() + self.terminal_ttl
+            )
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+        return task
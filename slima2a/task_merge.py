@@ -0,0 +1,183 @@
+# Copyright AGNTCY Contributors (https://github.com/agntcy)
+# SPDX-License-Identifier: Apache-2.0
+
+"""K-way merge of the ListTasks pages of several agents into global pages."""
+
+import asyncio
+import base64
+import heapq
+import json
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from typing import Any
+
+from a2a.types.a2a_pb2 import ListTasksRequest, ListTasksResponse, Task
+from a2a.utils.constants import DEFAULT_LIST_TASKS_PAGE_SIZE
+from a2a.utils.errors import InvalidParamsError
+
+PageFetcher = Callable[[str, ListTasksRequest], Awaitable[ListTasksResponse]]
+"""Fetches one page of tasks from the named member."""
+FirstPagesFetcher = Callable[
+    [ListTasksRequest], Awaitable[dict[str, ListTasksResponse]]
+]
+"""Fetches the first page of every member at once, keyed by member name."""
+
+
+def status_timestamp_key(task: Task) -> tuple[bool, str, str]:
+    """Sorts tasks like the a2a task stores: by status timestamp, then id.
+
+    Use with ``descending=True`` to get the newest tasks first.
+    """
+    has_timestamp = task.HasField("status") and task.status.HasField("timestamp")
+    return (
+        has_timestamp,
+        task.status.timestamp.ToJsonString() if has_timestamp else "",
+        task.id,
+    )
+
+
+def encode_merged_page_token(cursors: dict[str, tuple[str, int]], total: int) -> str:
+    """Encodes the position of every member into a global page token."""
+    data = json.dumps({"c": cursors, "t": total}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(data.encode()).decode()
+
+
+def decode_merged_page_token(token: str) -> tuple[dict[str, tuple[str, int]], int]:
+    """Decodes a global page token into member cursors and the total size."""
+    try:
+        data = json.loads(base64.urlsafe_b64decode(token.encode()))
+        cursors = {
+            str(name): (str(page_token), int(skip))
+            for name, (page_token, skip) in data["c"].items()
+        }
+        return cursors, int(data["t"])
+    except (ValueError, KeyError, TypeError) as e:
+        raise InvalidParamsError(f"Invalid page token: {token}") from e
+
+
+class _Member:
+    """The page of one member currently being merged."""
+
+    def __init__(
+        self,
+        name: str,
+        page_token: str,
+        response: ListTasksResponse,
+        skip: int,
+    ) -> None:
+        self.name = name
+        self.page_token = page_token
+        self.tasks = response.tasks
+        self.next_page_token = response.next_page_token
+        self.total_size = response.total_size
+        self.position = skip
+
+    @property
+    def exhausted(self) -> bool:
+        return self.position >= len(self.tasks) and not self.next_page_token
+
+
+@dataclass
+class _Head:
+    """Heap entry holding the next task of a member."""
+
+    key: Any
+    member: _Member
+    descending: bool
+
+    def __lt__(self, other: "_Head") -> bool:
+        if self.key == other.key:
+            return self.member.name < other.member.name
+        return (self.key > other.key) if self.descending else (self.key < other.key)
+
+
+async def merge_list_tasks(
+    members: list[str],
+    request: ListTasksRequest,
+    fetch: PageFetcher,
+    fetch_first_pages: FirstPagesFetcher | None = None,
+    key: Callable[[Task], Any] = status_timestamp_key,
+    descending: bool = True,
+) -> ListTasksResponse:
+    """Returns one global page of the tasks of ``members``, merged in order.
+
+    Each member must return its tasks sorted by ``key``. Member pages are
+    fetched lazily, so only one page per member is held at a time no matter
+    how many tasks the members have.
+
+    Args:
+        members: The names of the members.
+        request: The ListTasks request. Its page_token is a global token
+                 returned by a previous call, and its page_size the size of
+                 the merged page and of the member pages.
+        fetch: Fetches a page from a member.
+        fetch_first_pages: Fetches the first pages of all members in one
+                           call, e.g. a multicast ListTasks. Used instead of
+                           ``fetch`` for the first global page.
+        key: The sort key of the tasks.
+        descending: Whether tasks are sorted from the largest key.
+    """
+    page_size = request.page_size or DEFAULT_LIST_TASKS_PAGE_SIZE
+    if request.page_token:
+        cursors, total = decode_merged_page_token(request.page_token)
+    else:
+        cursors, total = dict.fromkeys(members, ("", 0)), -1
+
+    def member_request(page_token: str) -> ListTasksRequest:
+        member_request = ListTasksRequest()
+        member_request.CopyFrom(request)
+        member_request.page_size = page_size
+        member_request.page_token = page_token
+        return member_request
+
+    first_pages = {}
+    if not request.page_token and fetch_first_pages is not None:
+        first_pages = await fetch_first_pages(member_request(""))
+
+    async def load(name: str, page_token: str, skip: int) -> _Member:
+        response = None if page_token else first_pages.get(name)
+        if response is None:
+            response = await fetch(name, member_request(page_token))
+        return _Member(name, page_token, response, skip)
+
+    loaded = await asyncio.gather(
+        *(load(name, token, skip) for name, (token, skip) in cursors.items())
+    )
+    if total < 0:
+        total = sum(m.total_size for m in loaded)
+
+    async def advance(member: _Member) -> None:
+        # Follows the member's page token once its page is consumed.
+        while member.position >= len(member.tasks) and member.next_page_token:
+            page_token = member.next_page_token
+            response = await fetch(member.name, member_request(page_token))
+            member.page_token = page_token
+            member.tasks = response.tasks
+            member.next_page_token = response.next_page_token
+            member.position = 0
+        if member.position < len(member.tasks):
+            heapq.heappush(
+                heads,
+                _Head(key(member.tasks[member.position]), member, descending),
+            )
+
+    heads: list[_Head] = []
+    for member in loaded:
+        await advance(member)
+
+    tasks: list[Task] = []
+    while heads:
+        member = heapq.heappop(heads).member
+        tasks.append(member.tasks[member.position])
+        member.position += 1
+        if len(tasks) == page_size:
+            break
+        await advance(member)
+
+    remaining = {m.name: (m.page_token, m.position) for m in loaded if not m.exhausted}
+    return ListTasksResponse(
+        tasks=tasks,
+        next_page_token=encode_merged_page_token(remaining, total) if remaining else "",
+        page_size=page_size,
+        total_size=total,
+    )
@@ -0,0 +1,136 @@
+# Copyright AGNTCY Contributors (https://github.com/agntcy)
+# SPDX-License-Identifier: Apache-2.0
+
+import asyncio
+from collections.abc import AsyncGenerator
+from typing import cast
+
+from a2a.server.context import ServerCallContext
+from a2a.server.events import Event
+from a2a.server.request_handlers.request_handler import RequestHandler
+from a2a.types import a2a_pb2
+
+from slima2a.client_transport import SRPCTransport
+from slima2a.handler import SRPCHandler, add_SRPCHandler_to_server
+from slima2a.loopback import LoopbackServer, loopback_channel_factory
+
+
+class EndlessRequestHandler:
+    """Streams working updates until the task is cancelled."""
+
+    def __init__(self) -> None:
+        self.events = 0
+        self.closed = asyncio.Event()
+        self.cancelled: list[str] = []
+
+    async def on_message_send_stream(
+        self, params: a2a_pb2.SendMessageRequest, context: ServerCallContext
+    ) -> AsyncGenerator[Event]:
+        try:
+            yield a2a_pb2.Task(
+                id="task-1",
+                context_id="c-1",
+                status=a2a_pb2.TaskStatus(state=a2a_pb2.TASK_STATE_WORKING),
+            )
+            while not self.cancelled:
+                self.events += 1
+                yield a2a_pb2.TaskStatusUpdateEvent(
+                    task_id="task-1",
+                    context_id="c-1",
+                    status=a2a_pb2.TaskStatus(state=a2a_pb2.TASK_STATE_WORKING),
+                )
+                await asyncio.sleep(0.001)
+        finally:
+            self.closed.set()
+
+    async def on_cancel_task(
+        self, params: a2a_pb2.CancelTaskRequest, context: ServerCallContext
+    ) -> a2a_pb2.Task:
+        self.cancelled.append(params.id)
+        return a2a_pb2.Task(
+            id=params.id,
+            status=a2a_pb2.TaskStatus(state=a2a_pb2.TASK_STATE_CANCELED),
+        )
+
+
+def make_transport(
+    request_handler: EndlessRequestHandler,
+    server_cancels: bool,
+    client_cancels: bool,
+) -> tuple[SRPCHandler, SRPCTransport]:
+    server = LoopbackServer(max_buffered=1)
+    handler = SRPCHandler(
+        a2a_pb2.AgentCard(
+            name="agent",
+            capabilities=a2a_pb2.AgentCapabilities(streaming=True),
+        ),
+        cast(RequestHandler, request_handler),
+        cancel_abandoned_streams=server_cancels,
+    )
+    add_SRPCHandler_to_server(handler, server)  # type: ignore[arg-type]
+    channel = loopback_channel_factory({"agntcy/demo/agent": server})(
+        "agntcy/demo/agent"
+    )
+    return handler, SRPCTransport(
+        channel, None, cancel_abandoned_streams=client_cancels
+    )
+
+
+async def read_two_events(transport: SRPCTransport) -> None:
+    stream = transport.send_message_streaming(
+        a2a_pb2.SendMessageRequest(message=a2a_pb2.Message(message_id="m"))
+    )
+    await anext(stream)
+    await anext(stream)
+    await stream.aclose()
+
+
+def test_server_cancels_abandoned_stream() -> None:
+    request_handler = EndlessRequestHandler()
+    handler, transport = make_transport(
+        request_handler, server_cancels=True, client_cancels=False
+    )
+
+    async def scenario() -> None:
+        await read_two_events(transport)
+        await asyncio.wait_for(request_handler.closed.wait(), 1)
+
+    asyncio.run(scenario())
+    assert request_handler.cancelled == ["task-1"]
+    assert handler.stats.abandoned_streams == 1
+    assert request_handler.events < 10
+
+
+def test_client_cancels_abandoned_stream() -> None:
+    request_handler = EndlessRequestHandler()
+    handler, transport = make_transport(
+        request_handler, server_cancels=False, client_cancels=True
+    )
+
+    async def scenario() -> None:
+        await read_two_events(transport)
+        await transport.close()
+
+    asyncio.run(scenario())
+    assert request_handler.cancelled == ["task-1"]
+    assert handler.stats.abandoned_streams == 0
+
+
+def test_finished_stream_is_not_cancelled() -> None:
+    request_handler = EndlessRequestHandler()
+    request_handler.cancelled.append("done")
+    _, transport = make_transport(
+        request_handler, server_cancels=True, client_cancels=True
+    )
+
+    async def scenario() -> int:
+        count = 0
+        async for _ in transport.send_message_streaming(
+            a2a_pb2.SendMessageRequest(message=a2a_pb2.Message(message_id="m"))
+        ):
+            count += 1
+        await transport.close()
+        return count
+
+    assert asyncio.run(scenario()) == 1
+    assert request_handler.cancelled == ["done"]
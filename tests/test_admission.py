@@ -0,0 +1,80 @@
+# Copyright AGNTCY Contributors (https://github.com/agntcy)
+# SPDX-License-Identifier: Apache-2.0
+
+import asyncio
+
+import pytest
+from google.rpc import code_pb2
+
+from slima2a.admission import AdmissionController, SlimRPCError
+
+
+def test_admission_queues_then_rejects() -> None:
+    async def scenario() -> None:
+        admission = AdmissionController(max_in_flight=1, max_queue=1)
+
+        await admission.acquire("SendMessage")
+        queued = asyncio.create_task(admission.acquire("SendMessage"))
+        await asyncio.sleep(0)
+        assert admission.stats.queue_depth == 1
+
+        with pytest.raises(SlimRPCError) as exc_info:
+            await admission.acquire("SendMessage")
+        assert exc_info.value.code == code_pb2.RESOURCE_EXHAUSTED
+
+        admission.release("SendMessage")
+        await queued
+        assert admission.stats.in_flight == 1
+        assert admission.stats.queue_depth == 0
+        assert admission.stats.rejected_by_method == {"SendMessage": 1}
+
+    asyncio.run(scenario())
+
+
+def test_admission_method_limits_are_independent() -> None:
+    async def scenario() -> None:
+        admission = AdmissionController(method_limits={"SendStreamingMessage": 1})
+
+        await admission.acquire("SendStreamingMessage")
+        await admission.acquire("GetTask")
+        with pytest.raises(SlimRPCError):
+            await admission.acquire("SendStreamingMessage")
+        assert admission.stats.in_flight == 2
+
+    asyncio.run(scenario())
+
+
+def test_admission_queue_timeout() -> None:
+    async def scenario() -> None:
+        admission = AdmissionController(
+            max_in_flight=1, max_queue=4, queue_timeout=0.01
+        )
+
+        async with admission.admit("SendMessage"):
+            with pytest.raises(SlimRPCError):
+                await admission.acquire("SendMessage")
+            assert admission.stats.queue_depth == 0
+        assert admission.stats.in_flight == 0
+
+    asyncio.run(scenario())
+
+
+def test_freed_slot_goes_to_the_oldest_waiter() -> None:
+    async def scenario() -> None:
+        admission = AdmissionController(max_in_flight=1, max_queue=2)
+
+        await admission.acquire("SendMessage")
+        first = asyncio.create_task(admission.acquire("SendMessage"))
+        await asyncio.sleep(0)
+        admission.release("SendMessage")
+        late = asyncio.create_task(admission.acquire("SendMessage"))
+        await asyncio.sleep(0)
+
+        assert first.done()
+        assert not late.done()
+        assert admission.stats.in_flight == 1
+        assert admission.stats.queue_depth == 1
+        admission.release("SendMessage")
+        await late
+
+    asyncio.run(scenario())
@@ -0,0 +1,122 @@
+# Copyright AGNTCY Contributors (https://github.com/agntcy)
+# SPDX-License-Identifier: Apache-2.0
+
+import asyncio
+from typing import cast
+
+import pytest
+import slim_bindings
+from a2a.server.context import ServerCallContext
+from a2a.server.request_handlers.request_handler import RequestHandler
+from a2a.types import a2a_pb2
+from a2a.utils.errors import InvalidParamsError
+from google.rpc import code_pb2
+
+from slima2a.batch import MessageBatcher, decode_frames, encode_frames
+from slima2a.client_transport import SRPCTransport
+from slima2a.handler import SRPCHandler, add_SRPCHandler_to_server
+from slima2a.loopback import LoopbackServer, loopback_channel_factory
+
+
+class ClassifyingRequestHandler:
+    def __init__(self) -> None:
+        self.running = 0
+        self.max_running = 0
+
+    async def on_message_send(
+        self, params: a2a_pb2.SendMessageRequest, context: ServerCallContext
+    ) -> a2a_pb2.Message:
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        try:
+            await asyncio.sleep(0.005)
+            if params.message.message_id == "bad":
+                raise InvalidParamsError("cannot classify")
+            return a2a_pb2.Message(message_id=f"re-{params.message.message_id}")
+        finally:
+            self.running -= 1
+
+
+def make_transport(
+    request_handler: ClassifyingRequestHandler,
+    message_batcher: MessageBatcher | None = None,
+) -> tuple[SRPCHandler, SRPCTransport]:
+    server = LoopbackServer()
+    handler = SRPCHandler(
+        a2a_pb2.AgentCard(name="agent"),
+        cast(RequestHandler, request_handler),
+        batch_concurrency=3,
+    )
+    add_SRPCHandler_to_server(handler, server)  # type: ignore[arg-type]
+    channel = loopback_channel_factory({"agntcy/demo/agent": server})(
+        "agntcy/demo/agent"
+    )
+    return handler, SRPCTransport(channel, None, message_batcher=message_batcher)
+
+
+def make_request(message_id: str) -> a2a_pb2.SendMessageRequest:
+    return a2a_pb2.SendMessageRequest(message=a2a_pb2.Message(message_id=message_id))
+
+
+def test_batch_returns_each_result() -> None:
+    request_handler = ClassifyingRequestHandler()
+    handler, transport = make_transport(request_handler)
+    ids = ["a", "bad", "b", "c", "d", "e"]
+
+    results = asyncio.run(transport.send_messages_batch([make_request(i) for i in ids]))
+
+    assert len(results) == len(ids)
+    for message_id, result in zip(ids, results, strict=True):
+        if message_id == "bad":
+            assert isinstance(result, slim_bindings.RpcError)
+            assert result.code == code_pb2.INVALID_ARGUMENT  # type: ignore[attr-defined]
+        else:
+            assert isinstance(result, a2a_pb2.SendMessageResponse)
+            assert result.message.message_id == f"re-{message_id}"
+    assert request_handler.max_running == 3
+    assert handler.stats.batches == 1
+
+
+def test_concurrent_calls_are_batched() -> None:
+    request_handler = ClassifyingRequestHandler()
+    handler, transport = make_transport(request_handler, MessageBatcher(window=0.01))
+    ids = [str(i) for i in range(10)] + ["bad"]
+
+    async def send(message_id: str) -> str:
+        response = await transport.send_message(make_request(message_id))
+        return response.message.message_id
+
+    async def send_all() -> list[str | BaseException]:
+        return list(await asyncio.gather(*map(send, ids), return_exceptions=True))
+
+    results = asyncio.run(send_all())
+    assert results[:-1] == [f"re-{i}" for i in ids[:-1]]
+    assert isinstance(results[-1], slim_bindings.RpcError)
+    assert handler.stats.batches == 1
+    assert handler.stats.batched_messages == len(ids)
+
+
+def test_full_batches_are_sent_at_once() -> None:
+    batcher = MessageBatcher(window=60, max_batch_size=2)
+    sent: list[list[int]] = []
+
+    async def send(items: list[int]) -> list[int | Exception]:
+        sent.append(items)
+        return [item * 10 for item in items]
+
+    async def submit_all() -> list[int]:
+        return list(
+            await asyncio.gather(*(batcher.submit("k", i, send) for i in range(4)))
+        )
+
+    assert asyncio.run(submit_all()) == [0, 10, 20, 30]
+    assert sent == [[0, 1], [2, 3]]
+    assert batcher.stats.full_batches == 2
+    assert len(batcher) == 0
+
+
+def test_frames_round_trip() -> None:
+    frames = [b"", b"one", b"two" * 100]
+    assert decode_frames(encode_frames(frames)) == frames
+    with pytest.raises(ValueError):
+        decode_frames(encode_frames(frames)[:-1])
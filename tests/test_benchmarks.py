@@ -0,0 +1,44 @@
+# Copyright AGNTCY Contributors (https://github.com/agntcy)
+# SPDX-License-Identifier: Apache-2.0
+
+import asyncio
+import json
+
+import pytest
+
+from benchmarks.harness import measure, percentile
+from benchmarks.run import report
+from benchmarks.scenarios import SCENARIOS
+
+
+def test_percentile_uses_nearest_rank() -> None:
+    samples = [float(i) for i in range(1, 101)]
+    assert percentile(samples, 50) == 50.0
+    assert percentile(samples, 99) == 99.0
+    assert percentile([3.0], 99) == 3.0
+    assert percentile([], 50) == 0.0
+
+
+def test_measure_counts_calls() -> None:
+    calls = 0
+
+    async def call() -> None:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0)
+
+    result = asyncio.run(measure("noop", call, 20, warmup=5, trace_iterations=3))
+    assert calls == 28
+    assert result.iterations == 20
+    assert result.requests_per_second > 0
+    assert result.p50_ms <= result.p99_ms
+
+
+@pytest.mark.parametrize("name", list(SCENARIOS))
+def test_scenarios_run_over_loopback(name: str) -> None:
+    scenario, _ = SCENARIOS[name]
+    result = asyncio.run(scenario(3, 2))
+    assert result.name == name
+    assert result.iterations == 3
+    report_json = json.loads(json.dumps(report([result])))
+    assert report_json["results"][0]["name"] == name
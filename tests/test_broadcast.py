@@ -0,0 +1,164 @@
+# Copyright AGNTCY Contributors (https://github.com/agntcy)
+# SPDX-License-Identifier: Apache-2.0
+
+import asyncio
+from collections.abc import AsyncGenerator
+from typing import cast
+
+import pytest
+import slim_bindings
+from a2a.server.context import ServerCallContext
+from a2a.server.events import Event
+from a2a.server.request_handlers.request_handler import RequestHandler
+from a2a.types import a2a_pb2
+from google.rpc import code_pb2
+
+from slima2a.broadcast import SlimRPCError, SubscriptionHub
+from slima2a.client_transport import SRPCTransport
+from slima2a.handler import SRPCHandler, add_SRPCHandler_to_server
+from slima2a.loopback import LoopbackServer, loopback_channel_factory
+
+UPDATES = 5
+
+
+def working_task() -> a2a_pb2.Task:
+    return a2a_pb2.Task(
+        id="task-1",
+        context_id="c-1",
+        status=a2a_pb2.TaskStatus(state=a2a_pb2.TASK_STATE_WORKING),
+    )
+
+
+class GatedRequestHandler:
+    def __init__(self) -> None:
+        self.release = asyncio.Event()
+        self.subscriptions = 0
+
+    async def on_get_task(
+        self, params: a2a_pb2.GetTaskRequest, context: ServerCallContext
+    ) -> a2a_pb2.Task:
+        return working_task()
+
+    async def on_subscribe_to_task(
+        self, params: a2a_pb2.SubscribeToTaskRequest, context: ServerCallContext
+    ) -> AsyncGenerator[Event]:
+        self.subscriptions += 1
+        yield working_task()
+        await self.release.wait()
+        for i in range(UPDATES):
+            yield a2a_pb2.TaskStatusUpdateEvent(
+                task_id="task-1",
+                context_id="c-1",
+                status=a2a_pb2.TaskStatus(
+                    state=a2a_pb2.TASK_STATE_COMPLETED
+                    if i == UPDATES - 1
+                    else a2a_pb2.TASK_STATE_WORKING
+                ),
+            )
+
+
+def test_subscribers_share_one_serialized_stream() -> None:
+    hub = SubscriptionHub()
+
+    async def scenario() -> tuple[GatedRequestHandler, list[list[str]]]:
+        request_handler = GatedRequestHandler()
+        server = LoopbackServer()
+        add_SRPCHandler_to_server(
+            SRPCHandler(
+                a2a_pb2.AgentCard(
+                    name="agent",
+                    capabilities=a2a_pb2.AgentCapabilities(streaming=True),
+                ),
+                cast(RequestHandler, request_handler),
+                subscription_hub=hub,
+            ),
+            server,  # type: ignore[arg-type]
+        )
+        channel = loopback_channel_factory({"agntcy/demo/agent": server})(
+            "agntcy/demo/agent"
+        )
+        transport = SRPCTransport(channel, None)
+
+        async def subscribe() -> list[str]:
+            return [
+                response.WhichOneof("payload") or ""
+                async for response in transport.subscribe(
+                    a2a_pb2.SubscribeToTaskRequest(id="task-1")
+                )
+            ]
+
+        subscribers = [asyncio.create_task(subscribe()) for _ in range(3)]
+        for _ in range(1000):
+            if hub.stats.subscribers == 3:
+                break
+            await asyncio.sleep(0.001)
+        request_handler.release.set()
+        return request_handler, list(await asyncio.gather(*subscribers))
+
+    request_handler, received = asyncio.run(scenario())
+    assert received == [["task"] + ["status_update"] * UPDATES] * 3
+    assert request_handler.subscriptions == 1
+    assert hub.stats.streams == 1
+    assert hub.stats.joined == 2
+    # Events are serialized once for all subscribers.
+    assert hub.stats.events == 1 + UPDATES
+    assert len(hub) == 0
+
+
+def test_lagging_subscriber_is_disconnected() -> None:
+    hub = SubscriptionHub(max_queue=2)
+    release = asyncio.Event()
+
+    async def upstream() -> AsyncGenerator[bytes, None]:
+        yield b"first"
+        await release.wait()
+        for i in range(5):
+            yield str(i).encode()
+            await asyncio.sleep(0)
+
+    async def snapshot() -> bytes:
+        return b"snapshot"
+
+    async def scenario() -> tuple[list[bytes], int]:
+        fast = hub.subscribe("task-1", upstream, snapshot)
+        slow = hub.subscribe("task-1", upstream, snapshot)
+        received = [await anext(fast), await anext(slow)]
+        release.set()
+        received.extend([item async for item in fast])
+        with pytest.raises(SlimRPCError) as exc_info:
+            async for _ in slow:
+                pass
+        return received, exc_info.value.code
+
+    received, code = asyncio.run(scenario())
+    assert received == [b"first", b"snapshot", b"0", b"1", b"2", b"3", b"4"]
+    assert code == code_pb2.RESOURCE_EXHAUSTED
+    assert hub.stats.lagged == 1
+
+
+def test_upstream_errors_reach_every_subscriber() -> None:
+    hub = SubscriptionHub()
+
+    async def upstream() -> AsyncGenerator[bytes, None]:
+        yield b"first"
+        await asyncio.sleep(0.01)
+        raise SlimRPCError(code=code_pb2.INTERNAL, message="boom", details=None)
+
+    async def snapshot() -> bytes:
+        return b"snapshot"
+
+    async def consume(stream: AsyncGenerator[bytes, None]) -> list[bytes]:
+        return [item async for item in stream]
+
+    async def scenario() -> list[BaseException | list[bytes]]:
+        return list(
+            await asyncio.gather(
+                consume(hub.subscribe("task-1", upstream, snapshot)),
+                consume(hub.subscribe("task-1", upstream, snapshot)),
+                return_exceptions=True,
+            )
+        )
+
+    results = asyncio.run(scenario())
+    assert all(isinstance(result, slim_bindings.RpcError) for result in results)
+    assert len(hub) == 0
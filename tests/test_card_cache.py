@@ -0,0 +1,251 @@
+# Copyright AGNTCY Contributors (https://github.com/agntcy)
+# SPDX-License-Identifier: Apache-2.0
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from datetime import timedelta
+from typing import cast
+
+import slim_bindings
+from a2a.compat.v0_3 import a2a_v0_3_pb2
+from a2a.server.request_handlers.request_handler import RequestHandler
+from a2a.types.a2a_pb2 import (
+    AgentCapabilities,
+    AgentCard,
+    AgentInterface,
+    GetExtendedAgentCardRequest,
+)
+
+from slima2a.card_cache import AgentCardCache, SerializedCardCache
+from slima2a.client_transport import SRPCTransport
+from slima2a.compat.v3_0.handler import (
+    SRPCCompatHandler,
+    add_SRPCCompatHandler_to_server,
+)
+from slima2a.handler import SRPCHandler, add_SRPCHandler_to_server
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class RecordingServer:
+    def __init__(self) -> None:
+        self.handlers: dict[str, slim_bindings.UnaryUnaryHandler] = {}
+        self.streams: dict[str, slim_bindings.UnaryStreamHandler] = {}
+
+    def register_unary_unary(
+        self,
+        service_name: str,
+        method_name: str,
+        handler: slim_bindings.UnaryUnaryHandler,
+    ) -> None:
+        self.handlers[method_name] = handler
+
+    def register_unary_stream(
+        self,
+        service_name: str,
+        method_name: str,
+        handler: slim_bindings.UnaryStreamHandler,
+    ) -> None:
+        self.streams[method_name] = handler
+
+
+class CardChannel:
+    def __init__(self) -> None:
+        self.calls = 0
+
+    async def call_unary_async(
+        self,
+        service_name: str,
+        method_name: str,
+        request: bytes,
+        timeout: timedelta | None,
+        metadata: dict[str, str] | None,
+    ) -> bytes:
+        self.calls += 1
+        await asyncio.sleep(0.01)
+        return AgentCard(name="extended").SerializeToString()
+
+
+def call(server: RecordingServer, method: str) -> bytes:
+    context = cast(slim_bindings.Context, object())
+    return asyncio.run(server.handlers[method].handle(b"", context))
+
+
+def test_card_cache_reuses_bytes_until_card_changes() -> None:
+    card_cache = SerializedCardCache()
+    handler = SRPCHandler(
+        AgentCard(name="agent"),
+        cast(RequestHandler, object()),
+        card_cache=card_cache,
+    )
+
+    first = handler.serialized_extended_agent_card()
+    assert handler.serialized_extended_agent_card() is first
+    assert card_cache.stats.hits == 1
+
+    handler.agent_card = AgentCard(name="renamed")
+    assert AgentCard.FromString(handler.serialized_extended_agent_card()).name == (
+        "renamed"
+    )
+    assert card_cache.stats.misses == 2
+
+
+def test_card_cache_bounds_modifier_output() -> None:
+    calls: list[str] = []
+
+    def modifier(card: AgentCard) -> AgentCard:
+        calls.append(card.name)
+        return AgentCard(name=f"{card.name}-{len(calls)}")
+
+    clock = FakeClock()
+    card_cache = SerializedCardCache(modifier_ttl=10, clock=clock)
+    card = AgentCard(name="agent")
+
+    def serve() -> str:
+        data = card_cache.get("1.0", card, modifier, AgentCard.SerializeToString)
+        return AgentCard.FromString(data).name
+
+    assert serve() == "agent-1"
+    assert serve() == "agent-1"
+    clock.now = 11
+    assert serve() == "agent-2"
+
+    uncached = SerializedCardCache()
+    uncached.get("1.0", card, modifier, AgentCard.SerializeToString)
+    uncached.get("1.0", card, modifier, AgentCard.SerializeToString)
+    assert len(calls) == 4
+
+
+def test_registered_handlers_serve_cached_cards() -> None:
+    card_cache = SerializedCardCache()
+    card = AgentCard(
+        name="agent",
+        version="1.2.3",
+        supported_interfaces=[
+            AgentInterface(
+                url="agntcy/demo/agent",
+                protocol_binding="slimrpc",
+                protocol_version="0.3",
+            )
+        ],
+    )
+    request_handler = cast(RequestHandler, object())
+    server = RecordingServer()
+    compat_server = RecordingServer()
+
+    add_SRPCHandler_to_server(
+        SRPCHandler(card, request_handler, card_cache=card_cache),
+        cast(slim_bindings.Server, server),
+    )
+    add_SRPCCompatHandler_to_server(
+        SRPCCompatHandler(card, request_handler, card_cache=card_cache),
+        cast(slim_bindings.Server, compat_server),
+    )
+
+    assert AgentCard.FromString(call(server, "GetExtendedAgentCard")) == card
+    compat_card = a2a_v0_3_pb2.AgentCard.FromString(call(compat_server, "GetAgentCard"))
+    assert compat_card.name == "agent"
+    assert compat_card.version == "1.2.3"
+    assert "SendMessage" in server.handlers
+    assert "SendStreamingMessage" in compat_server.streams
+    call(compat_server, "GetAgentCard")
+    assert card_cache.stats.misses == 2
+    assert card_cache.stats.hits == 1
+
+
+def test_agent_card_cache_single_flight_and_ttl() -> None:
+    clock = FakeClock()
+    card_cache = AgentCardCache(ttl=60, clock=clock)
+    fetches: list[str] = []
+
+    async def fetch() -> AgentCard:
+        fetches.append("fetch")
+        await asyncio.sleep(0.01)
+        return AgentCard(name="agent")
+
+    async def resolve(count: int) -> list[AgentCard]:
+        return await asyncio.gather(
+            *(
+                card_cache.get_or_fetch("agntcy/demo/agent", fetch, "1.0")
+                for _ in range(count)
+            )
+        )
+
+    cards = asyncio.run(resolve(50))
+    assert len(fetches) == 1
+    assert {card.name for card in cards} == {"agent"}
+    cards[0].name = "mutated"
+    assert asyncio.run(resolve(1))[0].name == "agent"
+    assert len(fetches) == 1
+
+    clock.now = 61
+    asyncio.run(resolve(1))
+    assert len(fetches) == 2
+    assert card_cache.invalidate("agntcy/demo/agent") == 1
+    assert len(card_cache) == 0
+
+
+def test_transports_share_extended_card_cache() -> None:
+    card_cache = AgentCardCache()
+    card = AgentCard(
+        name="agent", capabilities=AgentCapabilities(extended_agent_card=True)
+    )
+    channel = CardChannel()
+    transports = [
+        SRPCTransport(
+            cast(slim_bindings.Channel, channel),
+            card,
+            url="agntcy/demo/agent",
+            card_cache=card_cache,
+        )
+        for _ in range(3)
+    ]
+
+    async def resolve() -> list[AgentCard]:
+        return await asyncio.gather(
+            *(
+                transport.get_extended_agent_card(GetExtendedAgentCardRequest())
+                for transport in transports
+            )
+        )
+
+    assert [c.name for c in asyncio.run(resolve())] == ["extended"] * 3
+    assert channel.calls == 1
+
+
+def test_extended_card_cache_is_keyed_by_credentials() -> None:
+    card_cache = AgentCardCache()
+    credentials: list[str] = []
+
+    def fetcher(token: str) -> Callable[[], Awaitable[AgentCard]]:
+        async def fetch() -> AgentCard:
+            credentials.append(token)
+            await asyncio.sleep(0.01)
+            return AgentCard(name=f"extended-{token}")
+
+        return fetch
+
+    async def resolve(token: str) -> AgentCard:
+        return await card_cache.get_or_fetch(
+            "agntcy/demo/agent",
+            fetcher(token),
+            "1.0",
+            metadata={"authorization": f"Bearer {token}"},
+        )
+
+    async def scenario() -> list[AgentCard]:
+        return list(await asyncio.gather(resolve("a"), resolve("b"), resolve("a")))
+
+    assert [c.name for c in asyncio.run(scenario())] == [
+        "extended-a",
+        "extended-b",
+        "extended-a",
+    ]
+    assert sorted(credentials) == ["a", "b"]
+    assert len(card_cache) == 2
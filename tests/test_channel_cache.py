@@ -0,0 +1,215 @@
+# Copyright AGNTCY Contributors (https://github.com/agntcy)
+# SPDX-License-Identifier: Apache-2.0
+
+import asyncio
+from datetime import timedelta
+from typing import cast
+
+import pytest
+import slim_bindings
+
+from slima2a.channel_cache import ChannelCache, ChannelLease, group_channel_key
+from slima2a.client_transport import SRPCTransport, slimrpc_group_channel_factory
+
+
+def new_channel() -> slim_bindings.Channel:
+    return cast(slim_bindings.Channel, object())
+
+
+class ClosableChannel:
+    def __init__(self) -> None:
+        self.closed = False
+
+    def close(self, timeout: timedelta | None) -> None:
+        self.closed = True
+
+    async def close_async(self, timeout: timedelta | None) -> None:
+        self.closed = True
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_channel_cache_reuses_channels() -> None:
+    cache = ChannelCache(max_size=2, idle_ttl=None)
+    created: list[str] = []
+
+    def create(remote: str) -> slim_bindings.Channel:
+        created.append(remote)
+        return new_channel()
+
+    first = cache.get_or_create("a/b/c", lambda: create("a/b/c"))
+    second = cache.get_or_create("a/b/c", lambda: create("a/b/c"))
+
+    assert first is second
+    assert created == ["a/b/c"]
+    assert cache.stats.hits == 1
+    assert cache.stats.misses == 1
+
+
+def test_channel_cache_evicts_least_recently_used() -> None:
+    cache = ChannelCache(max_size=2, idle_ttl=None)
+
+    cache.get_or_create("a", new_channel)
+    cache.get_or_create("b", new_channel)
+    cache.get_or_create("a", new_channel)
+    cache.get_or_create("c", new_channel)
+
+    assert "a" in cache
+    assert "b" not in cache
+    assert "c" in cache
+    assert cache.stats.evictions == 1
+
+
+def test_channel_cache_expires_idle_channels() -> None:
+    clock = FakeClock()
+    cache = ChannelCache(max_size=4, idle_ttl=10.0, clock=clock)
+
+    channel = cache.get_or_create("a", new_channel)
+    clock.now = 5.0
+    assert cache.get_or_create("a", new_channel) is channel
+
+    clock.now = 20.0
+    assert cache.get_or_create("a", new_channel) is not channel
+    assert cache.stats.expirations == 1
+
+
+def test_channel_cache_invalidate() -> None:
+    cache = ChannelCache()
+    channel = cache.get_or_create("a", new_channel)
+
+    assert cache.invalidate("a")
+    assert not cache.invalidate("a")
+    assert cache.get_or_create("a", new_channel) is not channel
+    assert cache.stats.invalidations == 1
+
+
+def test_dropped_channels_are_closed() -> None:
+    clock = FakeClock()
+    cache = ChannelCache(max_size=1, idle_ttl=10.0, clock=clock)
+    channels = [ClosableChannel() for _ in range(4)]
+
+    def get(key: str, channel: ClosableChannel) -> None:
+        cache.get_or_create(key, lambda: cast(slim_bindings.Channel, channel))
+
+    get("a", channels[0])
+    get("b", channels[1])
+    assert channels[0].closed
+    assert not channels[1].closed
+
+    clock.now = 20.0
+    get("c", channels[2])
+    assert channels[1].closed
+
+    async def invalidate_in_loop() -> None:
+        get("d", channels[3])
+        cache.invalidate("d")
+        await cache.wait_closed()
+
+    asyncio.run(invalidate_in_loop())
+    assert all(channel.closed for channel in channels)
+
+
+def test_channel_cache_rejects_invalid_size() -> None:
+    with pytest.raises(ValueError):
+        ChannelCache(max_size=0)
+
+
+def test_group_channels_are_cached_by_member_set(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    created: list[list[str]] = []
+
+    def new_group(
+        local_app: object, members: list[slim_bindings.Name], conn_id: int
+    ) -> slim_bindings.Channel:
+        created.append(["/".join(m.components()) for m in members])
+        return new_channel()
+
+    monkeypatch.setattr(slim_bindings.Channel, "new_group_with_connection", new_group)
+    cache = ChannelCache()
+    factory = slimrpc_group_channel_factory(
+        cast(slim_bindings.App, object()), 1, cache=cache
+    )
+
+    def channel(remotes: list[str]) -> slim_bindings.Channel:
+        return cast(ChannelLease, factory(remotes)).channel
+
+    first = channel(["a/b/c", "a/b/d"])
+    assert channel(["a/b/d", "a/b/c", "a/b/d"]) is first
+    assert created == [["a/b/c", "a/b/d"]]
+    assert group_channel_key(["a/b/d", "a/b/c"]) in cache
+
+    other = channel(["a/b/d", "a/b/e"])
+    assert cache.invalidate_member("a/b/d") == 2
+    assert cache.invalidate_member("a/b/d") == 0
+    assert channel(["a/b/c", "a/b/d"]) is not first
+    assert channel(["a/b/d", "a/b/e"]) is not other
+
+
+def test_dropped_group_channels_are_closed(monkeypatch: pytest.MonkeyPatch) -> None:
+    def new_group(
+        local_app: object, members: list[slim_bindings.Name], conn_id: int
+    ) -> slim_bindings.Channel:
+        return cast(slim_bindings.Channel, ClosableChannel())
+
+    monkeypatch.setattr(slim_bindings.Channel, "new_group_with_connection", new_group)
+    cache = ChannelCache(max_size=2)
+    factory = slimrpc_group_channel_factory(
+        cast(slim_bindings.App, object()), 1, cache=cache
+    )
+
+    def released(remotes: list[str]) -> ClosableChannel:
+        lease = cast(ChannelLease, factory(remotes))
+        channel = cast(ClosableChannel, lease.channel)
+        lease.close()
+        return channel
+
+    first = released(["a/b/c", "a/b/d"])
+    second = released(["a/b/c", "a/b/e"])
+    # A membership change drops and closes the groups of the member.
+    assert cache.invalidate_member("a/b/d") == 1
+    assert first.closed
+    assert not second.closed
+
+    released(["a/b/f", "a/b/g"])
+    released(["a/b/f", "a/b/h"])
+    assert second.closed
+
+
+def test_leased_channels_are_closed_once_released() -> None:
+    clock = FakeClock()
+    cache = ChannelCache(max_size=1, idle_ttl=10.0, clock=clock)
+    channels = {key: ClosableChannel() for key in ("a", "b", "c")}
+
+    def lease(key: str) -> slim_bindings.Channel:
+        return cache.lease(key, lambda: cast(slim_bindings.Channel, channels[key]))
+
+    async def scenario() -> None:
+        transport = SRPCTransport(lease("a"), None, owns_channel=True)
+        # The transport keeps its channel past the idle TTL and after it
+        # was evicted by another remote.
+        clock.now = 20.0
+        other = lease("b")
+        assert "a" not in cache
+        assert cast(ChannelLease, transport.channel).channel is channels["a"]
+        assert not channels["a"].closed
+
+        await transport.close()
+        await cache.wait_closed()
+        assert channels["a"].closed
+
+        # A released channel expires once idle for the TTL.
+        await other.close_async(None)
+        clock.now = 40.0
+        lease("c")
+        await cache.wait_closed()
+        assert channels["b"].closed
+        assert not channels["c"].closed
+
+    asyncio.run(scenario())
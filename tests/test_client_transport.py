@@ -0,0 +1,64 @@
+# Copyright AGNTCY Contributors (https://github.com/agntcy)
+# SPDX-License-Identifier: Apache-2.0
+
+import asyncio
+from datetime import timedelta
+from typing import cast
+
+import slim_bindings
+from a2a.client.client import ClientCallContext
+from a2a.types.a2a_pb2 import GetTaskRequest, Task
+from a2a.utils.constants import PROTOCOL_VERSION_CURRENT, VERSION_HEADER
+
+from slima2a.client_transport import SRPCTransport
+
+
+class RecordingChannel:
+    def __init__(self) -> None:
+        self.calls: list[tuple[str, timedelta | None, dict[str, str] | None]] = []
+
+    async def call_unary_async(
+        self,
+        service_name: str,
+        method_name: str,
+        request: bytes,
+        timeout: timedelta | None,
+        metadata: dict[str, str] | None,
+    ) -> bytes:
+        self.calls.append((method_name, timeout, metadata))
+        return Task(id="task-1").SerializeToString()
+
+
+def test_transport_forwards_context_timeout_and_metadata() -> None:
+    channel = RecordingChannel()
+    transport = SRPCTransport(
+        cast(slim_bindings.Channel, channel), None, default_timeout=30.0
+    )
+    context = ClientCallContext(timeout=2.5, service_parameters={"x-tenant": "acme"})
+
+    task = asyncio.run(transport.get_task(GetTaskRequest(id="task-1"), context=context))
+
+    assert task.id == "task-1"
+    assert channel.calls == [
+        (
+            "GetTask",
+            timedelta(seconds=2.5),
+            {VERSION_HEADER: PROTOCOL_VERSION_CURRENT, "x-tenant": "acme"},
+        )
+    ]
+
+
+def test_transport_uses_default_timeout() -> None:
+    channel = RecordingChannel()
+    transport = SRPCTransport(
+        cast(slim_bindings.Channel, channel), None, default_timeout=30.0
+    )
+
+    asyncio.run(transport.get_task(GetTaskRequest(id="task-1")))
+    _, timeout, _ = channel.calls[0]
+    assert timeout == timedelta(seconds=30)
+
+    transport.default_timeout = None
+    asyncio.run(transport.get_task(GetTaskRequest(id="task-1")))
+    _, timeout, _ = channel.calls[1]
+    assert timeout is None
@@ -0,0 +1,96 @@
+# Copyright AGNTCY Contributors (https://github.com/agntcy)
+# SPDX-License-Identifier: Apache-2.0
+
+import asyncio
+from collections.abc import AsyncGenerator
+
+from a2a.server.events import Event
+from a2a.types import a2a_pb2
+
+from slima2a.coalescing import ArtifactUpdateCoalescer
+
+
+def chunk(text: str, append: bool = True, last: bool = False) -> Event:
+    return a2a_pb2.TaskArtifactUpdateEvent(
+        task_id="task-1",
+        context_id="ctx-1",
+        artifact=a2a_pb2.Artifact(
+            artifact_id="artifact-1", parts=[a2a_pb2.Part(text=text)]
+        ),
+        append=append,
+        last_chunk=last,
+    )
+
+
+async def produce(events: list[Event], delay: float = 0) -> AsyncGenerator[Event]:
+    for event in events:
+        if delay:
+            await asyncio.sleep(delay)
+        yield event
+
+
+async def collect(stream: AsyncGenerator[Event]) -> list[Event]:
+    return [event async for event in stream]
+
+
+def texts(event: Event) -> list[str]:
+    assert isinstance(event, a2a_pb2.TaskArtifactUpdateEvent)
+    return [part.text for part in event.artifact.parts]
+
+
+def test_coalescer_merges_appends_until_last_chunk() -> None:
+    coalescer = ArtifactUpdateCoalescer(max_delay=1.0)
+    first = chunk("a", append=False)
+    events = [
+        a2a_pb2.Task(id="task-1"),
+        first,
+        chunk("b"),
+        chunk("c", last=True),
+        a2a_pb2.TaskStatusUpdateEvent(task_id="task-1"),
+    ]
+
+    result = asyncio.run(collect(coalescer.coalesce(produce(events))))
+
+    assert len(result) == 3
+    assert texts(result[1]) == ["a", "b", "c"]
+    assert isinstance(result[1], a2a_pb2.TaskArtifactUpdateEvent)
+    assert result[1].last_chunk
+    assert not result[1].append
+    assert texts(first) == ["a"]
+    assert coalescer.stats.merged == 2
+    assert coalescer.stats.events_out == 3
+
+
+def test_coalescer_yields_the_last_source_of_each_event() -> None:
+    coalescer = ArtifactUpdateCoalescer(max_delay=1.0)
+    events = [a2a_pb2.Task(id="task-1"), chunk("a"), chunk("b", last=True)]
+
+    async def sources() -> list[tuple[Event, Event]]:
+        return [pair async for pair in coalescer.coalesce_sources(produce(events))]
+
+    (task, task_source), (merged, merged_source) = asyncio.run(sources())
+    assert task is task_source is events[0]
+    assert texts(merged) == ["a", "b"]
+    assert merged_source is events[2]
+
+
+def test_coalescer_flushes_on_size_and_other_artifacts() -> None:
+    coalescer = ArtifactUpdateCoalescer(max_delay=1.0, max_events=2)
+    other = chunk("x")
+    assert isinstance(other, a2a_pb2.TaskArtifactUpdateEvent)
+    other.artifact.artifact_id = "artifact-2"
+    events = [chunk("a"), chunk("b"), chunk("c"), other]
+
+    result = asyncio.run(collect(coalescer.coalesce(produce(events))))
+
+    assert [texts(event) for event in result] == [["a", "b"], ["c"], ["x"]]
+
+
+def test_coalescer_flushes_after_max_delay() -> None:
+    coalescer = ArtifactUpdateCoalescer(max_delay=0.01)
+    events = [chunk("a"), chunk("b"), chunk("c")]
+
+    result = asyncio.run(collect(coalescer.coalesce(produce(events, delay=0.05))))
+
+    assert [texts(event) for event in result] == [["a"], ["b"], ["c"]]
+    assert coalescer.stats.merged == 0
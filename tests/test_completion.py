@@ -0,0 +1,211 @@
+# Copyright AGNTCY Contributors (https://github.com/agntcy)
+# SPDX-License-Identifier: Apache-2.0
+
+import asyncio
+import time
+from typing import Any
+
+import pytest
+import slim_bindings
+from a2a.server.agent_execution import AgentExecutor, RequestContext
+from a2a.server.events import EventQueue
+from a2a.server.request_handlers import DefaultRequestHandler
+from a2a.server.tasks import InMemoryTaskStore
+from a2a.server.tasks.task_updater import TaskUpdater
+from a2a.types import a2a_pb2
+
+from slima2a.client_transport import ClientConfig, MulticastClient
+from slima2a.completion import (
+    CompletionPolicy,
+    MulticastSummary,
+    is_final_stream_response,
+    member_name,
+)
+from slima2a.handler import SRPCHandler, add_SRPCHandler_to_server
+from slima2a.loopback import LoopbackServer, loopback_group_channel_factory
+
+AGENTS = ["agntcy/demo/agent1", "agntcy/demo/agent2", "agntcy/demo/agent3"]
+
+
+class DelayedExecutor(AgentExecutor):
+    def __init__(self, delay: float) -> None:
+        self.delay = delay
+        self.cancelled = False
+
+    async def execute(self, context: RequestContext, event_queue: EventQueue) -> None:
+        assert context.task_id is not None
+        assert context.context_id is not None
+        updater = TaskUpdater(event_queue, context.task_id, context.context_id)
+        await updater.submit()
+        try:
+            await asyncio.sleep(self.delay)
+        except asyncio.CancelledError:
+            self.cancelled = True
+            raise
+        await updater.complete()
+
+    async def cancel(self, context: RequestContext, event_queue: EventQueue) -> None:
+        return None
+
+
+def make_client(
+    delays: list[float | None],
+) -> tuple[MulticastClient, list[DelayedExecutor]]:
+    servers = {}
+    executors = []
+    for url, delay in zip(AGENTS, delays, strict=True):
+        executor = DelayedExecutor(delay or 0)
+        card = a2a_pb2.AgentCard(
+            name=url,
+            capabilities=a2a_pb2.AgentCapabilities(streaming=True),
+            supported_interfaces=[
+                a2a_pb2.AgentInterface(url=url, protocol_binding="slimrpc")
+            ],
+        )
+        server = LoopbackServer()
+        # A server without handlers fails every call, standing in for a broken agent.
+        if delay is not None:
+            add_SRPCHandler_to_server(
+                SRPCHandler(card, DefaultRequestHandler(executor, InMemoryTaskStore())),
+                server,  # type: ignore[arg-type]
+            )
+        servers[url] = server
+        executors.append(executor)
+    config = ClientConfig(
+        slimrpc_group_channel_factory=loopback_group_channel_factory(servers)
+    )
+    return MulticastClient.create(AGENTS, config), executors
+
+
+def make_request() -> a2a_pb2.SendMessageRequest:
+    return a2a_pb2.SendMessageRequest(
+        message=a2a_pb2.Message(
+            message_id="m-1",
+            role=a2a_pb2.ROLE_USER,
+            parts=[a2a_pb2.Part(text="hello")],
+        )
+    )
+
+
+def test_policies_resolve_required_responses() -> None:
+    assert CompletionPolicy.first().required_responses(3) == 1
+    assert CompletionPolicy.first_n(2).required_responses(None) == 2
+    assert CompletionPolicy.majority().required_responses(3) == 2
+    assert CompletionPolicy.majority().required_responses(4) == 3
+    assert CompletionPolicy.all().required_responses(3) is None
+
+    with pytest.raises(ValueError):
+        CompletionPolicy.majority().required_responses(None)
+    with pytest.raises(ValueError):
+        CompletionPolicy.first_n(0)
+
+
+def test_final_stream_responses() -> None:
+    working = a2a_pb2.StreamResponse(
+        status_update=a2a_pb2.TaskStatusUpdateEvent(
+            status=a2a_pb2.TaskStatus(state=a2a_pb2.TASK_STATE_WORKING)
+        )
+    )
+    done = a2a_pb2.StreamResponse(
+        task=a2a_pb2.Task(
+            status=a2a_pb2.TaskStatus(state=a2a_pb2.TASK_STATE_INPUT_REQUIRED)
+        )
+    )
+    assert not is_final_stream_response(working)
+    assert is_final_stream_response(done)
+    assert is_final_stream_response(a2a_pb2.StreamResponse(message=a2a_pb2.Message()))
+
+
+def test_quorum_cancels_stragglers() -> None:
+    client, executors = make_client([0, 0, 5])
+
+    async def scenario() -> int:
+        answers = 0
+        async for _, _ in client.send_message(
+            make_request(), completion=CompletionPolicy.majority()
+        ):
+            answers += 1
+        # Let the cancellation reach the straggler.
+        await asyncio.sleep(0.05)
+        return answers
+
+    started = time.monotonic()
+    assert asyncio.run(scenario()) == 2
+    assert time.monotonic() - started < 2
+    assert executors[2].cancelled
+
+
+def test_streaming_first_and_deadline() -> None:
+    client, _ = make_client([0, 5, 5])
+
+    async def first() -> list[a2a_pb2.StreamResponse]:
+        return [
+            response
+            async for _, response in client.send_message_streaming(
+                make_request(), completion=CompletionPolicy.first()
+            )
+        ]
+
+    responses = asyncio.run(first())
+    assert is_final_stream_response(responses[-1])
+    assert sum(map(is_final_stream_response, responses)) == 1
+
+    async def deadline() -> set[str]:
+        return {
+            str(source.source)
+            async for source, _ in client.send_message(
+                make_request(), completion=CompletionPolicy.all(deadline=0.2)
+            )
+        }
+
+    started = time.monotonic()
+    sources = asyncio.run(deadline())
+    assert time.monotonic() - started < 2
+    assert len(sources) == 1
+    assert next(iter(sources)).startswith(AGENTS[0])
+
+
+def test_partial_results_report_errors_and_stragglers() -> None:
+    policy = CompletionPolicy(member_timeout=0.2, partial_results=True)
+
+    async def scenario(delays: list[float | None]) -> tuple[list[str], int, Any]:
+        client, _ = make_client(delays)
+        answered, errors, summary = [], 0, None
+        async for source, response in client.send_message(
+            make_request(), completion=policy
+        ):
+            if isinstance(response, MulticastSummary):
+                summary = response
+            elif isinstance(response, Exception):
+                assert source is None
+                errors += 1
+            else:
+                answered.append(member_name(source))
+        return answered, errors, summary
+
+    answered, errors, summary = asyncio.run(scenario([0, None, 0]))
+    assert sorted(answered) == [AGENTS[0], AGENTS[2]]
+    assert errors == 1
+    assert summary == MulticastSummary(
+        answered=answered, timed_out=[], failed=[AGENTS[1]]
+    )
+
+    started = time.monotonic()
+    answered, errors, summary = asyncio.run(scenario([0, 0, 5]))
+    assert time.monotonic() - started < 2
+    assert sorted(answered) == AGENTS[:2]
+    assert errors == 0
+    assert summary.timed_out == [AGENTS[2]]
+
+
+def test_errors_still_raise_without_partial_results() -> None:
+    client, _ = make_client([None, 5, 5])
+
+    async def scenario() -> None:
+        async for _ in client.send_message(
+            make_request(), completion=CompletionPolicy.first()
+        ):
+            pass
+
+    with pytest.raises(slim_bindings.RpcError):
+        asyncio.run(scenario())
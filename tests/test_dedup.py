@@ -0,0 +1,206 @@
+# Copyright AGNTCY Contributors (https://github.com/agntcy)
+# SPDX-License-Identifier: Apache-2.0
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+from typing import cast
+
+import pytest
+import slim_bindings
+from a2a.server.agent_execution import AgentExecutor, RequestContext
+from a2a.server.context import ServerCallContext
+from a2a.server.events import EventQueue
+from a2a.server.request_handlers import DefaultRequestHandler
+from a2a.server.request_handlers.request_handler import RequestHandler
+from a2a.server.tasks import InMemoryTaskStore
+from a2a.types import a2a_pb2
+from a2a.utils.errors import InternalError
+from google.rpc import code_pb2
+
+from slima2a.dedup import MessageDeduplicator
+from slima2a.handler import SlimRPCError, SRPCHandler
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class FakeContext:
+    def __init__(self, timeout: float = 30.0) -> None:
+        self._deadline = datetime.now(timezone.utc) + timedelta(seconds=timeout)
+
+    def metadata(self) -> dict[str, str]:
+        return {}
+
+    def deadline(self) -> datetime:
+        return self._deadline
+
+    def remaining_time(self) -> timedelta:
+        return max(self._deadline - datetime.now(timezone.utc), timedelta(0))
+
+    def is_deadline_exceeded(self) -> bool:
+        return datetime.now(timezone.utc) >= self._deadline
+
+
+class CountingRequestHandler:
+    def __init__(self, delay: float = 0.02) -> None:
+        self.delay = delay
+        self.executions = 0
+        self.fail = False
+
+    async def on_message_send(
+        self,
+        params: a2a_pb2.SendMessageRequest,
+        context: ServerCallContext,
+    ) -> a2a_pb2.Task:
+        self.executions += 1
+        await asyncio.sleep(self.delay)
+        if self.fail:
+            raise InternalError("agent failed")
+        return a2a_pb2.Task(id=f"task-{self.executions}")
+
+
+def make_handler(
+    request_handler: CountingRequestHandler, deduplicator: MessageDeduplicator
+) -> SRPCHandler:
+    return SRPCHandler(
+        a2a_pb2.AgentCard(name="test"),
+        cast(RequestHandler, request_handler),
+        enforce_deadlines=True,
+        message_deduplicator=deduplicator,
+    )
+
+
+def make_request(message_id: str, tenant: str = "") -> a2a_pb2.SendMessageRequest:
+    return a2a_pb2.SendMessageRequest(
+        tenant=tenant, message=a2a_pb2.Message(message_id=message_id)
+    )
+
+
+async def send(
+    handler: SRPCHandler,
+    request: a2a_pb2.SendMessageRequest,
+    timeout: float = 30.0,
+) -> str:
+    context = cast(slim_bindings.Context, FakeContext(timeout))
+    return (await handler.SendMessage(request, context)).task.id
+
+
+def test_duplicates_share_one_execution() -> None:
+    request_handler = CountingRequestHandler()
+    clock = FakeClock()
+    deduplicator = MessageDeduplicator(window=60, clock=clock)
+    handler = make_handler(request_handler, deduplicator)
+
+    async def concurrent() -> list[str]:
+        return list(
+            await asyncio.gather(
+                *(send(handler, make_request("m-1")) for _ in range(3))
+            )
+        )
+
+    assert asyncio.run(concurrent()) == ["task-1"] * 3
+    assert asyncio.run(send(handler, make_request("m-1"))) == "task-1"
+    assert request_handler.executions == 1
+    assert deduplicator.stats.joined == 2
+    assert deduplicator.stats.replayed == 1
+    assert deduplicator.stats.suppressed == 3
+
+    # Other messages and other tenants run on their own.
+    assert asyncio.run(send(handler, make_request("m-2"))) == "task-2"
+    assert asyncio.run(send(handler, make_request("m-1", tenant="t"))) == "task-3"
+
+    clock.now = 60
+    assert asyncio.run(send(handler, make_request("m-1"))) == "task-4"
+    assert len(deduplicator) == 1
+
+
+class SlowAgentExecutor(AgentExecutor):
+    def __init__(self, delay: float) -> None:
+        self.delay = delay
+        self.executions = 0
+
+    async def execute(self, context: RequestContext, event_queue: EventQueue) -> None:
+        self.executions += 1
+        task_id = context.task_id or ""
+        context_id = context.context_id or ""
+        await event_queue.enqueue_event(
+            a2a_pb2.Task(
+                id=task_id,
+                context_id=context_id,
+                status=a2a_pb2.TaskStatus(state=a2a_pb2.TASK_STATE_WORKING),
+            )
+        )
+        await asyncio.sleep(self.delay)
+        await event_queue.enqueue_event(
+            a2a_pb2.TaskStatusUpdateEvent(
+                task_id=task_id,
+                context_id=context_id,
+                status=a2a_pb2.TaskStatus(state=a2a_pb2.TASK_STATE_COMPLETED),
+            )
+        )
+
+    async def cancel(self, context: RequestContext, event_queue: EventQueue) -> None:
+        raise AssertionError("the shared execution must not be cancelled")
+
+
+def test_retry_after_timeout_picks_up_the_result() -> None:
+    executor = SlowAgentExecutor(delay=0.2)
+    deduplicator = MessageDeduplicator()
+    handler = SRPCHandler(
+        a2a_pb2.AgentCard(name="test"),
+        DefaultRequestHandler(executor, InMemoryTaskStore()),
+        enforce_deadlines=True,
+        message_deduplicator=deduplicator,
+    )
+
+    def request() -> a2a_pb2.SendMessageRequest:
+        return a2a_pb2.SendMessageRequest(
+            message=a2a_pb2.Message(message_id="m-1", role=a2a_pb2.ROLE_USER)
+        )
+
+    async def retry() -> a2a_pb2.Task:
+        context = cast(slim_bindings.Context, FakeContext(0.05))
+        with pytest.raises(SlimRPCError) as exc_info:
+            await handler.SendMessage(request(), context)
+        assert exc_info.value.code == code_pb2.DEADLINE_EXCEEDED
+        context = cast(slim_bindings.Context, FakeContext(2))
+        return (await handler.SendMessage(request(), context)).task
+
+    task = asyncio.run(retry())
+    assert task.status.state == a2a_pb2.TASK_STATE_COMPLETED
+    assert executor.executions == 1
+    assert deduplicator.stats.joined == 1
+    assert handler.stats.deadline_cancelled_calls == 1
+
+
+def test_failures_are_not_remembered() -> None:
+    request_handler = CountingRequestHandler(delay=0)
+    request_handler.fail = True
+    handler = make_handler(request_handler, MessageDeduplicator())
+
+    with pytest.raises(SlimRPCError):
+        asyncio.run(send(handler, make_request("m-1")))
+    request_handler.fail = False
+    assert asyncio.run(send(handler, make_request("m-1"))) == "task-2"
+
+
+def test_results_are_bounded_by_memory() -> None:
+    response = a2a_pb2.SendMessageResponse(task=a2a_pb2.Task(id="t" * 100))
+    deduplicator = MessageDeduplicator(max_bytes=3 * response.ByteSize())
+
+    async def execute() -> a2a_pb2.SendMessageResponse:
+        return response
+
+    async def run_all() -> None:
+        for i in range(5):
+            await deduplicator.run(("", "", f"m-{i}"), execute)
+
+    asyncio.run(run_all())
+    assert len(deduplicator) == 3
+    assert deduplicator.size == 3 * response.ByteSize()
+    assert deduplicator.stats.evictions == 2
@@ -0,0 +1,149 @@
+# Copyright AGNTCY Contributors (https://github.com/agntcy)
+# SPDX-License-Identifier: Apache-2.0
+
+import asyncio
+
+from a2a.server.agent_execution import AgentExecutor, RequestContext
+from a2a.server.events import EventQueue
+from a2a.server.request_handlers import DefaultRequestHandler
+from a2a.server.tasks import InMemoryTaskStore
+from a2a.server.tasks.task_updater import TaskUpdater
+from a2a.types import a2a_pb2
+
+from slima2a.client_transport import (
+    ClientConfig,
+    MultiAgentClientFactory,
+    SRPCTransport,
+)
+from slima2a.completion import CompletionPolicy, MulticastSummary
+from slima2a.fan_out import FanOutClient
+from slima2a.handler import SRPCHandler, add_SRPCHandler_to_server
+from slima2a.loopback import LoopbackServer, loopback_channel_factory
+
+# One agent only speaks slimrpc, the other a protocol without multicast.
+AGENTS = {"agntcy/demo/agent1": "slimrpc", "agntcy/demo/agent2": "unicast"}
+
+
+class CountingExecutor(AgentExecutor):
+    running = 0
+    max_running = 0
+
+    async def execute(self, context: RequestContext, event_queue: EventQueue) -> None:
+        assert context.task_id is not None
+        assert context.context_id is not None
+        CountingExecutor.running += 1
+        CountingExecutor.max_running = max(
+            CountingExecutor.max_running, CountingExecutor.running
+        )
+        try:
+            updater = TaskUpdater(event_queue, context.task_id, context.context_id)
+            await updater.submit()
+            await asyncio.sleep(0.05)
+            await updater.complete()
+        finally:
+            CountingExecutor.running -= 1
+
+    async def cancel(self, context: RequestContext, event_queue: EventQueue) -> None:
+        return None
+
+
+def make_card(url: str, binding: str) -> a2a_pb2.AgentCard:
+    return a2a_pb2.AgentCard(
+        name=url,
+        capabilities=a2a_pb2.AgentCapabilities(streaming=True),
+        supported_interfaces=[
+            a2a_pb2.AgentInterface(url=url, protocol_binding=binding)
+        ],
+    )
+
+
+def make_factory(
+    servers: dict[str, LoopbackServer], fan_out_concurrency: int = 16
+) -> MultiAgentClientFactory:
+    config = ClientConfig(
+        supported_protocol_bindings=["slimrpc", "unicast"],
+        streaming=False,
+        slimrpc_channel_factory=loopback_channel_factory(servers),
+    )
+    factory = MultiAgentClientFactory(config, fan_out_concurrency=fan_out_concurrency)
+    factory.register("unicast", SRPCTransport.create)
+    return factory
+
+
+def make_servers(broken: str | None = None) -> dict[str, LoopbackServer]:
+    servers = {}
+    for url, binding in AGENTS.items():
+        server = LoopbackServer()
+        if url != broken:
+            request_handler = DefaultRequestHandler(
+                CountingExecutor(), InMemoryTaskStore()
+            )
+            add_SRPCHandler_to_server(
+                SRPCHandler(make_card(url, binding), request_handler),
+                server,  # type: ignore[arg-type]
+            )
+        servers[url] = server
+    return servers
+
+
+def make_request() -> a2a_pb2.SendMessageRequest:
+    return a2a_pb2.SendMessageRequest(
+        message=a2a_pb2.Message(
+            message_id="m-1",
+            role=a2a_pb2.ROLE_USER,
+            parts=[a2a_pb2.Part(text="hello")],
+        )
+    )
+
+
+def create_client(factory: MultiAgentClientFactory) -> FanOutClient:
+    client = factory.create([make_card(url, b) for url, b in AGENTS.items()])
+    assert isinstance(client, FanOutClient)
+    return client
+
+
+def test_fan_out_without_common_multicast_protocol() -> None:
+    client = create_client(make_factory(make_servers(), fan_out_concurrency=1))
+
+    async def scenario() -> dict[str, int]:
+        states: dict[str, int] = {}
+        async for source, response in client.send_message(make_request()):
+            states[source] = response.task.status.state
+        return states
+
+    CountingExecutor.max_running = 0
+    assert asyncio.run(scenario()) == dict.fromkeys(
+        AGENTS, a2a_pb2.TASK_STATE_COMPLETED
+    )
+    assert CountingExecutor.max_running == 1
+
+
+def test_fan_out_completion_and_attributed_errors() -> None:
+    client = create_client(make_factory(make_servers(broken="agntcy/demo/agent2")))
+
+    async def scenario() -> list[tuple[str | None, object]]:
+        return [
+            item
+            async for item in client.get_task(
+                a2a_pb2.GetTaskRequest(id="missing"),
+                completion=CompletionPolicy(partial_results=True),
+            )
+        ]
+
+    items = asyncio.run(scenario())
+    assert {source for source, response in items[:-1]} == set(AGENTS)
+    assert all(isinstance(response, Exception) for _, response in items[:-1])
+    assert items[-1] == (
+        None,
+        MulticastSummary(failed=[str(source) for source, _ in items[:-1]]),
+    )
+
+    async def first() -> int:
+        answers = 0
+        async for _ in create_client(make_factory(make_servers())).send_message(
+            make_request(), completion=CompletionPolicy.first()
+        ):
+            answers += 1
+        return answers
+
+    assert asyncio.run(first()) == 1
@@ -0,0 +1,142 @@
+# Copyright AGNTCY Contributors (https://github.com/agntcy)
+# SPDX-License-Identifier: Apache-2.0
+
+import asyncio
+from collections.abc import AsyncGenerator
+from typing import cast
+
+import pytest
+from a2a.server.context import ServerCallContext
+from a2a.server.events import Event
+from a2a.server.request_handlers.request_handler import RequestHandler
+from a2a.types import a2a_pb2
+from google.rpc import code_pb2
+
+from slima2a.client_transport import SRPCTransport
+from slima2a.flow_control import CreditFlowController, SlimRPCError
+from slima2a.handler import SRPCHandler, add_SRPCHandler_to_server
+from slima2a.loopback import LoopbackServer, loopback_channel_factory
+
+EVENTS = 40
+WINDOW = 4
+
+
+class FastRequestHandler:
+    """Streams working updates as fast as they are pulled."""
+
+    def __init__(self) -> None:
+        self.produced = 0
+
+    async def on_message_send_stream(
+        self, params: a2a_pb2.SendMessageRequest, context: ServerCallContext
+    ) -> AsyncGenerator[Event]:
+        for _ in range(EVENTS):
+            self.produced += 1
+            yield a2a_pb2.TaskStatusUpdateEvent(
+                task_id="task-1",
+                context_id="c-1",
+                status=a2a_pb2.TaskStatus(state=a2a_pb2.TASK_STATE_WORKING),
+            )
+
+
+def make_transport(
+    request_handler: FastRequestHandler,
+    flow_controller: CreditFlowController,
+    credit_window: int,
+) -> SRPCTransport:
+    server = LoopbackServer()
+    add_SRPCHandler_to_server(
+        SRPCHandler(
+            a2a_pb2.AgentCard(
+                name="agent",
+                capabilities=a2a_pb2.AgentCapabilities(streaming=True),
+            ),
+            cast(RequestHandler, request_handler),
+            flow_controller=flow_controller,
+        ),
+        server,  # type: ignore[arg-type]
+    )
+    channel = loopback_channel_factory({"agntcy/demo/agent": server})(
+        "agntcy/demo/agent"
+    )
+    return SRPCTransport(channel, None, credit_window=credit_window)
+
+
+def stream(transport: SRPCTransport) -> AsyncGenerator[a2a_pb2.StreamResponse]:
+    return transport.send_message_streaming(
+        a2a_pb2.SendMessageRequest(message=a2a_pb2.Message(message_id="m"))
+    )
+
+
+def test_slow_reader_bounds_the_producer() -> None:
+    request_handler = FastRequestHandler()
+    flow_controller = CreditFlowController()
+    transport = make_transport(request_handler, flow_controller, WINDOW)
+
+    async def read_slowly() -> tuple[int, int]:
+        received = 0
+        ahead = 0
+        async for _ in stream(transport):
+            received += 1
+            await asyncio.sleep(0.001)
+            ahead = max(ahead, request_handler.produced - received)
+        return received, ahead
+
+    received, ahead = asyncio.run(read_slowly())
+    assert received == EVENTS
+    # One more event may be pulled from the agent while waiting for a credit.
+    assert ahead <= WINDOW + 1
+    assert flow_controller.stats.streams == 1
+    assert flow_controller.stats.stalls > 0
+    assert flow_controller.stats.stalled_seconds > 0
+    assert len(flow_controller) == 0
+
+
+def test_readers_without_window_are_not_paced() -> None:
+    request_handler = FastRequestHandler()
+    flow_controller = CreditFlowController()
+    transport = make_transport(request_handler, flow_controller, 0)
+
+    async def read_slowly() -> int:
+        stream_ = stream(transport)
+        await anext(stream_)
+        await asyncio.sleep(0.01)
+        produced = request_handler.produced
+        await stream_.aclose()
+        return produced
+
+    assert asyncio.run(read_slowly()) == EVENTS
+    assert flow_controller.stats.streams == 0
+
+
+def test_stalled_reader_is_disconnected() -> None:
+    request_handler = FastRequestHandler()
+    flow_controller = CreditFlowController(stall_timeout=0.01)
+    transport = make_transport(request_handler, flow_controller, 2)
+
+    async def stall() -> None:
+        stream_ = stream(transport)
+        await anext(stream_)
+        await asyncio.sleep(0.1)
+        async for _ in stream_:
+            pass
+
+    with pytest.raises(SlimRPCError) as exc_info:
+        asyncio.run(stall())
+    assert exc_info.value.code == code_pb2.RESOURCE_EXHAUSTED
+    assert flow_controller.stats.timeouts == 1
+
+
+def test_window_capped_by_server() -> None:
+    request_handler = FastRequestHandler()
+    flow_controller = CreditFlowController(max_window=8, stall_timeout=1.0)
+    transport = make_transport(request_handler, flow_controller, EVENTS)
+
+    async def read_all() -> int:
+        received = 0
+        async for _ in stream(transport):
+            received += 1
+        return received
+
+    assert asyncio.run(read_all()) == EVENTS
+    assert flow_controller.stats.timeouts == 0
@@ -0,0 +1,171 @@
+# Copyright AGNTCY Contributors (https://github.com/agntcy)
+# SPDX-License-Identifier: Apache-2.0
+
+import asyncio
+from collections.abc import AsyncGenerator
+from datetime import datetime, timedelta, timezone
+from typing import cast
+
+import pytest
+import slim_bindings
+from a2a.server.agent_execution import AgentExecutor, RequestContext
+from a2a.server.context import ServerCallContext
+from a2a.server.events import Event, EventQueue
+from a2a.server.request_handlers import DefaultRequestHandler
+from a2a.server.request_handlers.request_handler import RequestHandler
+from a2a.server.tasks import InMemoryTaskStore
+from a2a.types import a2a_pb2
+from google.rpc import code_pb2
+
+from slima2a.handler import DEADLINE_STATE_KEY, SlimRPCError, SRPCHandler
+
+
+class FakeContext:
+    def __init__(self, timeout: float = 30.0) -> None:
+        self._deadline = datetime.now(timezone.utc) + timedelta(seconds=timeout)
+
+    def metadata(self) -> dict[str, str]:
+        return {}
+
+    def deadline(self) -> datetime:
+        return self._deadline
+
+    def remaining_time(self) -> timedelta:
+        return max(self._deadline - datetime.now(timezone.utc), timedelta(0))
+
+    def is_deadline_exceeded(self) -> bool:
+        return datetime.now(timezone.utc) >= self._deadline
+
+
+class SlowRequestHandler:
+    def __init__(self) -> None:
+        self.cancelled: list[str] = []
+        self.contexts: list[ServerCallContext] = []
+
+    async def on_message_send(
+        self,
+        params: a2a_pb2.SendMessageRequest,
+        context: ServerCallContext,
+    ) -> a2a_pb2.Task:
+        self.contexts.append(context)
+        await asyncio.sleep(10)
+        return a2a_pb2.Task(id=params.message.task_id)
+
+    async def on_message_send_stream(
+        self,
+        params: a2a_pb2.SendMessageRequest,
+        context: ServerCallContext,
+    ) -> AsyncGenerator[Event]:
+        yield a2a_pb2.Task(id="task-1")
+        await asyncio.sleep(10)
+
+    async def on_cancel_task(
+        self,
+        params: a2a_pb2.CancelTaskRequest,
+        context: ServerCallContext,
+    ) -> a2a_pb2.Task:
+        self.cancelled.append(params.id)
+        return a2a_pb2.Task(id=params.id)
+
+
+def make_handler(request_handler: SlowRequestHandler) -> SRPCHandler:
+    agent_card = a2a_pb2.AgentCard(
+        name="test", capabilities=a2a_pb2.AgentCapabilities(streaming=True)
+    )
+    return SRPCHandler(
+        agent_card, cast(RequestHandler, request_handler), enforce_deadlines=True
+    )
+
+
+def as_context(context: FakeContext) -> slim_bindings.Context:
+    return cast(slim_bindings.Context, context)
+
+
+def test_send_message_cancelled_at_deadline() -> None:
+    request_handler = SlowRequestHandler()
+    handler = make_handler(request_handler)
+    request = a2a_pb2.SendMessageRequest(
+        message=a2a_pb2.Message(message_id="m-1", task_id="task-1")
+    )
+    context = FakeContext(timeout=0.05)
+
+    with pytest.raises(SlimRPCError) as exc_info:
+        asyncio.run(handler.SendMessage(request, as_context(context)))
+
+    assert exc_info.value.code == code_pb2.DEADLINE_EXCEEDED
+    assert handler.stats.deadline_cancelled_calls == 1
+    assert request_handler.cancelled == ["task-1"]
+    assert request_handler.contexts[0].state[DEADLINE_STATE_KEY] == context.deadline()
+
+
+def test_send_streaming_message_cancelled_at_deadline() -> None:
+    request_handler = SlowRequestHandler()
+    handler = make_handler(request_handler)
+    request = a2a_pb2.SendMessageRequest(message=a2a_pb2.Message(message_id="m-1"))
+
+    async def consume() -> list[a2a_pb2.StreamResponse]:
+        responses = []
+        async for response in handler.SendStreamingMessage(
+            request, as_context(FakeContext(timeout=0.05))
+        ):
+            responses.append(response)
+        return responses
+
+    with pytest.raises(SlimRPCError) as exc_info:
+        asyncio.run(consume())
+
+    assert exc_info.value.code == code_pb2.DEADLINE_EXCEEDED
+    assert handler.stats.deadline_cancelled_calls == 1
+    assert request_handler.cancelled == ["task-1"]
+
+
+class SleepingAgentExecutor(AgentExecutor):
+    def __init__(self) -> None:
+        self.stopped = asyncio.Event()
+
+    async def execute(self, context: RequestContext, event_queue: EventQueue) -> None:
+        await event_queue.enqueue_event(
+            a2a_pb2.Task(
+                id=context.task_id,
+                context_id=context.context_id,
+                status=a2a_pb2.TaskStatus(state=a2a_pb2.TASK_STATE_WORKING),
+            )
+        )
+        try:
+            await asyncio.sleep(10)
+        finally:
+            self.stopped.set()
+
+    async def cancel(self, context: RequestContext, event_queue: EventQueue) -> None:
+        await event_queue.enqueue_event(
+            a2a_pb2.TaskStatusUpdateEvent(
+                task_id=context.task_id,
+                context_id=context.context_id,
+                status=a2a_pb2.TaskStatus(state=a2a_pb2.TASK_STATE_CANCELED),
+            )
+        )
+
+
+def test_new_task_cancelled_at_deadline() -> None:
+    executor = SleepingAgentExecutor()
+    task_store = InMemoryTaskStore()
+    handler = SRPCHandler(
+        a2a_pb2.AgentCard(name="test"),
+        DefaultRequestHandler(executor, task_store),
+        enforce_deadlines=True,
+    )
+    request = a2a_pb2.SendMessageRequest(
+        message=a2a_pb2.Message(message_id="m-1", role=a2a_pb2.ROLE_USER)
+    )
+
+    async def send() -> None:
+        with pytest.raises(SlimRPCError) as exc_info:
+            await handler.SendMessage(request, as_context(FakeContext(timeout=0.05)))
+        assert exc_info.value.code == code_pb2.DEADLINE_EXCEEDED
+        await asyncio.wait_for(executor.stopped.wait(), 1)
+
+    asyncio.run(send())
+    assert handler.stats.deadline_cancelled_calls == 1
+    task = asyncio.run(task_store.get(request.message.task_id, ServerCallContext()))
+    assert task is not None
+    assert task.status.state == a2a_pb2.TASK_STATE_CANCELED
@@ -0,0 +1,146 @@
+# Copyright AGNTCY Contributors (https://github.com/agntcy)
+# SPDX-License-Identifier: Apache-2.0
+
+import asyncio
+from datetime import timedelta
+
+import pytest
+import slim_bindings
+from a2a.server.agent_execution import AgentExecutor, RequestContext
+from a2a.server.events import EventQueue
+from a2a.server.request_handlers import DefaultRequestHandler
+from a2a.server.tasks import InMemoryTaskStore
+from a2a.server.tasks.task_updater import TaskUpdater
+from a2a.types import a2a_pb2
+
+from slima2a.client_transport import ClientConfig, MulticastClient, SRPCTransport
+from slima2a.handler import SRPCHandler, add_SRPCHandler_to_server
+from slima2a.loopback import (
+    LoopbackChannel,
+    LoopbackServer,
+    loopback_channel_factory,
+    loopback_group_channel_factory,
+)
+
+AGENTS = ["agntcy/demo/agent1", "agntcy/demo/agent2"]
+
+
+class ChunkingExecutor(AgentExecutor):
+    async def execute(self, context: RequestContext, event_queue: EventQueue) -> None:
+        assert context.task_id is not None
+        assert context.context_id is not None
+        updater = TaskUpdater(event_queue, context.task_id, context.context_id)
+        await updater.submit()
+        for i in range(3):
+            await updater.add_artifact(
+                [a2a_pb2.Part(text=f"chunk-{i}")],
+                artifact_id="result",
+                append=i > 0,
+                last_chunk=i == 2,
+            )
+        await updater.complete()
+
+    async def cancel(self, context: RequestContext, event_queue: EventQueue) -> None:
+        return None
+
+
+def make_card(url: str) -> a2a_pb2.AgentCard:
+    return a2a_pb2.AgentCard(
+        name=url,
+        capabilities=a2a_pb2.AgentCapabilities(streaming=True),
+        supported_interfaces=[
+            a2a_pb2.AgentInterface(url=url, protocol_binding="slimrpc")
+        ],
+    )
+
+
+def make_servers() -> dict[str, LoopbackServer]:
+    servers = {}
+    for url in AGENTS:
+        server = LoopbackServer()
+        request_handler = DefaultRequestHandler(ChunkingExecutor(), InMemoryTaskStore())
+        add_SRPCHandler_to_server(
+            SRPCHandler(make_card(url), request_handler),
+            server,  # type: ignore[arg-type]
+        )
+        servers[url] = server
+    return servers
+
+
+def make_request() -> a2a_pb2.SendMessageRequest:
+    return a2a_pb2.SendMessageRequest(
+        message=a2a_pb2.Message(
+            message_id="m-1",
+            role=a2a_pb2.ROLE_USER,
+            parts=[a2a_pb2.Part(text="hello")],
+        )
+    )
+
+
+def test_loopback_unary_and_streaming() -> None:
+    servers = make_servers()
+    config = ClientConfig(slimrpc_channel_factory=loopback_channel_factory(servers))
+    transport = SRPCTransport.create(make_card(AGENTS[0]), AGENTS[0], config)
+    assert isinstance(transport, SRPCTransport)
+
+    async def scenario() -> list[str]:
+        response = await transport.send_message(make_request())
+        assert response.task.status.state == a2a_pb2.TASK_STATE_COMPLETED
+        task = await transport.get_task(a2a_pb2.GetTaskRequest(id=response.task.id))
+        assert [p.text for p in task.artifacts[0].parts] == [
+            "chunk-0",
+            "chunk-1",
+            "chunk-2",
+        ]
+        return [
+            event.WhichOneof("payload") or ""
+            async for event in transport.send_message_streaming(make_request())
+        ]
+
+    payloads = asyncio.run(scenario())
+    assert payloads.count("artifact_update") == 3
+    assert payloads[-1] == "status_update"
+
+
+def test_loopback_multicast_fans_out_to_members() -> None:
+    servers = make_servers()
+    config = ClientConfig(
+        slimrpc_group_channel_factory=loopback_group_channel_factory(servers)
+    )
+    client = MulticastClient.create(AGENTS, config)
+
+    async def scenario() -> tuple[set[str], int]:
+        sources = set()
+        async for source, _ in client.send_message(make_request()):
+            sources.add(str(source.source))
+        chunks = 0
+        async for _, event in client.send_message_streaming(make_request()):
+            chunks += event.HasField("artifact_update")
+        return sources, chunks
+
+    sources, chunks = asyncio.run(scenario())
+    assert {source.rsplit("/", 1)[0] for source in sources} == set(AGENTS)
+    assert chunks == 6
+
+
+def test_loopback_reports_unknown_methods_and_deadlines() -> None:
+    class SlowHandler(slim_bindings.UnaryUnaryHandler):
+        async def handle(self, request: bytes, context: slim_bindings.Context) -> bytes:
+            await asyncio.sleep(1)
+            return request
+
+    server = LoopbackServer()
+    server.register_unary_unary("svc", "Slow", SlowHandler())
+    channel = LoopbackChannel(server)
+
+    with pytest.raises(slim_bindings.RpcError) as exc_info:
+        asyncio.run(channel.call_unary_async("svc", "Missing", b"", None, None))
+    assert "svc/Missing" in str(exc_info.value)
+
+    with pytest.raises(slim_bindings.RpcError) as exc_info:
+        asyncio.run(
+            channel.call_unary_async(
+                "svc", "Slow", b"", timedelta(milliseconds=10), None
+            )
+        )
+    assert "deadline" in str(exc_info.value)
@@ -0,0 +1,240 @@
+# Copyright AGNTCY Contributors (https://github.com/agntcy)
+# SPDX-License-Identifier: Apache-2.0
+
+import asyncio
+from typing import cast
+
+import pytest
+import slim_bindings
+from a2a.server.agent_execution import AgentExecutor, RequestContext
+from a2a.server.events import EventQueue
+from a2a.server.request_handlers import DefaultRequestHandler
+from a2a.server.tasks import InMemoryTaskStore
+from a2a.server.tasks.task_updater import TaskUpdater
+from a2a.types import a2a_pb2
+
+from slima2a.client_transport import (
+    ClientConfig,
+    MulticastClient,
+    SRPCMulticastTransport,
+)
+from slima2a.completion import CompletionPolicy, MulticastSummary, member_name
+from slima2a.handler import SRPCHandler, add_SRPCHandler_to_server
+from slima2a.loopback import (
+    LoopbackServer,
+    loopback_channel_factory,
+    loopback_group_channel_factory,
+)
+
+AGENTS = ["agntcy/demo/agent1", "agntcy/demo/agent2", "agntcy/demo/agent3"]
+
+
+class StreamingExecutor(AgentExecutor):
+    def __init__(self, name: str, calls: list[str]) -> None:
+        self.name = name
+        self.calls = calls
+
+    async def execute(self, context: RequestContext, event_queue: EventQueue) -> None:
+        self.calls.append(self.name)
+        assert context.task_id is not None
+        assert context.context_id is not None
+        updater = TaskUpdater(event_queue, context.task_id, context.context_id)
+        await updater.submit()
+        await updater.start_work()
+        await updater.complete()
+
+    async def cancel(self, context: RequestContext, event_queue: EventQueue) -> None:
+        return None
+
+
+class ClosableChannel:
+    def __init__(self, channel: slim_bindings.Channel) -> None:
+        self.channel = channel
+        self.closed = False
+
+    def __getattr__(self, name: str) -> object:
+        return getattr(self.channel, name)
+
+    async def close_async(self, timeout: object = None) -> None:
+        self.closed = True
+
+
+class Factories:
+    def __init__(self) -> None:
+        servers = {}
+        self.calls: list[str] = []
+        for url in AGENTS:
+            card = a2a_pb2.AgentCard(
+                name=url,
+                capabilities=a2a_pb2.AgentCapabilities(streaming=True),
+                supported_interfaces=[
+                    a2a_pb2.AgentInterface(url=url, protocol_binding="slimrpc")
+                ],
+            )
+            server = LoopbackServer()
+            add_SRPCHandler_to_server(
+                SRPCHandler(
+                    card,
+                    DefaultRequestHandler(
+                        StreamingExecutor(url, self.calls), InMemoryTaskStore()
+                    ),
+                ),
+                server,  # type: ignore[arg-type]
+            )
+            servers[url] = server
+        self.groups: list[list[str]] = []
+        self.unicasts: list[str] = []
+        self.channels: list[ClosableChannel] = []
+        self._group = loopback_group_channel_factory(servers)
+        self._unicast = loopback_channel_factory(servers)
+
+    def group(self, remotes: list[str]) -> slim_bindings.Channel:
+        self.groups.append(list(remotes))
+        return self._track(self._group(remotes))
+
+    def unicast(self, remote: str) -> slim_bindings.Channel:
+        self.unicasts.append(remote)
+        return self._track(self._unicast(remote))
+
+    def _track(self, channel: slim_bindings.Channel) -> slim_bindings.Channel:
+        self.channels.append(ClosableChannel(channel))
+        return cast(slim_bindings.Channel, self.channels[-1])
+
+
+def make_config(factories: Factories) -> ClientConfig:
+    return ClientConfig(
+        slimrpc_channel_factory=factories.unicast,
+        slimrpc_group_channel_factory=factories.group,
+    )
+
+
+def make_client(factories: Factories) -> MulticastClient:
+    return MulticastClient.create(AGENTS[:2], make_config(factories))
+
+
+def make_request() -> a2a_pb2.SendMessageRequest:
+    return a2a_pb2.SendMessageRequest(
+        message=a2a_pb2.Message(
+            message_id="m-1",
+            role=a2a_pb2.ROLE_USER,
+            parts=[a2a_pb2.Part(text="hello")],
+        )
+    )
+
+
+async def answers(client: MulticastClient) -> dict[str, int]:
+    return {
+        member_name(source): response.task.status.state
+        async for source, response in client.send_message(make_request())
+    }
+
+
+def test_members_join_without_rebuilding_the_group() -> None:
+    factories = Factories()
+    client = make_client(factories)
+    client.add_member(AGENTS[2])
+    assert client.agent_names == AGENTS
+
+    assert asyncio.run(answers(client)) == dict.fromkeys(
+        AGENTS, a2a_pb2.TASK_STATE_COMPLETED
+    )
+    assert sorted(factories.calls) == AGENTS
+
+    async def streaming() -> list[object]:
+        finals: list[object] = []
+        async for source, response in client.send_message_streaming(
+            make_request(),
+            completion=CompletionPolicy(partial_results=True),
+        ):
+            if source is None:
+                finals.append(response)
+            elif response.HasField("status_update"):
+                assert member_name(source) in AGENTS
+        return finals
+
+    (summary,) = asyncio.run(streaming())
+    assert isinstance(summary, MulticastSummary)
+    assert sorted(summary.answered) == AGENTS
+    # The group channel is only opened once; the new member is reached alone.
+    assert factories.groups == [AGENTS[:2]]
+    assert factories.unicasts == [AGENTS[2]]
+
+    client.rebuild_group()
+    assert factories.groups[-1] == AGENTS
+    assert asyncio.run(answers(client)) == dict.fromkeys(
+        AGENTS, a2a_pb2.TASK_STATE_COMPLETED
+    )
+    assert factories.unicasts == [AGENTS[2]]
+
+
+def test_removed_members_no_longer_receive_calls() -> None:
+    factories = Factories()
+    client = make_client(factories)
+    client.add_member(AGENTS[2])
+    client.remove_member(AGENTS[2])
+    client.remove_member(AGENTS[0])
+    assert client.agent_names == AGENTS[1:2]
+    # The group is only rebuilt once, before the next call.
+    assert factories.groups == [AGENTS[:2]]
+
+    assert asyncio.run(answers(client)).keys() == {AGENTS[1]}
+    assert factories.calls == [AGENTS[1]]
+    assert factories.groups == [AGENTS[:2], AGENTS[1:2]]
+
+    assert asyncio.run(answers(client)).keys() == {AGENTS[1]}
+    assert factories.calls == [AGENTS[1]] * 2
+    assert len(factories.groups) == 2
+
+
+def test_readding_a_removed_member() -> None:
+    factories = Factories()
+    client = make_client(factories)
+    client.remove_member(AGENTS[1])
+    client.add_member(AGENTS[1])
+    client.add_member(AGENTS[1])
+    assert asyncio.run(answers(client)).keys() == set(AGENTS[:2])
+    # The agent rejoins the rebuilt group rather than a unicast channel.
+    assert factories.unicasts == []
+    assert factories.groups == [AGENTS[:2], [AGENTS[0], AGENTS[1]]]
+
+    client.remove_member(AGENTS[1])
+    assert asyncio.run(answers(client)).keys() == {AGENTS[0]}
+
+    client = MulticastClient.create(
+        AGENTS[:2], ClientConfig(slimrpc_group_channel_factory=factories.group)
+    )
+    with pytest.raises(ValueError):
+        client.add_member(AGENTS[2])
+
+
+def test_dropped_channels_are_closed() -> None:
+    factories = Factories()
+    transport = SRPCMulticastTransport.create(AGENTS[:2], make_config(factories))
+
+    async def scenario() -> None:
+        transport.add_member(AGENTS[2])
+        group, unicast = factories.channels
+        stream = transport.send_message(make_request())
+        await anext(stream)
+
+        # A call in flight keeps the channels it started with open.
+        transport.remove_member(AGENTS[2])
+        transport.rebuild_group()
+        await asyncio.sleep(0)
+        assert not group.closed
+        assert not unicast.closed
+
+        async for _ in stream:
+            pass
+        await asyncio.sleep(0)
+        assert group.closed
+        assert unicast.closed
+
+        await transport.list_member_tasks(AGENTS[0], a2a_pb2.ListTasksRequest())
+        assert factories.channels[-1].closed
+
+        transport.add_member(AGENTS[2])
+        await transport.close()
+        assert all(channel.closed for channel in factories.channels)
+
+    asyncio.run(scenario())
@@ -0,0 +1,198 @@
+# Copyright AGNTCY Contributors (https://github.com/agntcy)
+# SPDX-License-Identifier: Apache-2.0
+
+import pytest
+from a2a.compat.v0_3 import a2a_v0_3_pb2, conversions, proto_utils
+from a2a.compat.v0_3 import types as types_v03
+from a2a.server.events import Event
+from a2a.types import a2a_pb2
+from a2a.utils.errors import InvalidParamsError
+from google.protobuf import struct_pb2
+
+from slima2a.compat.v3_0 import proto_conversions
+
+
+def make_message(role: int = a2a_pb2.ROLE_AGENT) -> a2a_pb2.Message:
+    message = a2a_pb2.Message(
+        message_id="m-1",
+        context_id="c-1",
+        task_id="t-1",
+        role=role,  # type: ignore[arg-type]
+        extensions=["ext"],
+        parts=[
+            a2a_pb2.Part(text="hello"),
+            a2a_pb2.Part(raw=b"\x00\x01binary", media_type="application/x"),
+            a2a_pb2.Part(url="https://example.com/f", filename="f.txt"),
+            a2a_pb2.Part(data=struct_pb2.Value(number_value=3)),
+        ],
+    )
+    message.metadata.update({"k": "v"})
+    message.parts[0].metadata.update({"lang": "en"})
+    message.parts.add().data.struct_value.update({"a": 1, "b": ["x"]})
+    return message
+
+
+def make_task() -> a2a_pb2.Task:
+    task = a2a_pb2.Task(
+        id="t-1",
+        context_id="c-1",
+        status=a2a_pb2.TaskStatus(
+            state=a2a_pb2.TASK_STATE_COMPLETED, message=make_message()
+        ),
+        history=[make_message(a2a_pb2.ROLE_USER), make_message()],
+        artifacts=[
+            a2a_pb2.Artifact(
+                artifact_id="a-1",
+                name="result",
+                description="the result",
+                parts=[a2a_pb2.Part(text="out")],
+                extensions=["ext"],
+            )
+        ],
+    )
+    task.metadata.update({"owner": "me"})
+    return task
+
+
+def sdk_to_compat_task(task: a2a_pb2.Task) -> a2a_v0_3_pb2.Task:
+    return proto_utils.ToProto.task(conversions.to_compat_task(task))
+
+
+def sdk_to_core_task(task: a2a_v0_3_pb2.Task) -> a2a_pb2.Task:
+    return conversions.to_core_task(proto_utils.FromProto.task(task))
+
+
+def test_task_matches_sdk_conversion() -> None:
+    task = make_task()
+    compat = proto_conversions.to_compat_task(task)
+    assert compat == sdk_to_compat_task(task)
+
+    core = proto_conversions.to_core_task(compat)
+    expected = sdk_to_core_task(compat)
+    assert core.history == expected.history
+    assert core.artifacts == expected.artifacts
+    assert core.status.state == expected.status.state
+    assert core.status.message == expected.status.message
+    assert core.metadata == expected.metadata
+    # Everything except the v0.3-only reference_task_ids survives a round trip.
+    assert core == task
+
+
+def test_status_timestamp_is_kept_and_missing_message_stays_missing() -> None:
+    task = a2a_pb2.Task(
+        id="t-1", status=a2a_pb2.TaskStatus(state=a2a_pb2.TASK_STATE_SUBMITTED)
+    )
+    task.status.timestamp.FromSeconds(1_700_000_000)
+
+    core = proto_conversions.to_core_task(proto_conversions.to_compat_task(task))
+    assert core.status.timestamp == task.status.timestamp
+    assert not core.status.HasField("message")
+
+
+def test_send_message_request_matches_sdk_conversion() -> None:
+    request = a2a_pb2.SendMessageRequest(
+        message=make_message(a2a_pb2.ROLE_USER),
+        configuration=a2a_pb2.SendMessageConfiguration(
+            accepted_output_modes=["text/plain"],
+            history_length=2,
+            return_immediately=False,
+            task_push_notification_config=a2a_pb2.TaskPushNotificationConfig(
+                id="p-1",
+                url="https://example.com/hook",
+                token="tok",
+                authentication=a2a_pb2.AuthenticationInfo(
+                    scheme="Bearer", credentials="secret"
+                ),
+            ),
+        ),
+    )
+    request.metadata.update({"trace": "1"})
+
+    compat = proto_conversions.to_compat_send_message_request(request)
+    req_v03 = conversions.to_compat_send_message_request(request, request_id=0)
+    assert compat == a2a_v0_3_pb2.SendMessageRequest(
+        request=proto_utils.ToProto.message(req_v03.params.message),
+        configuration=proto_utils.ToProto.message_send_configuration(
+            req_v03.params.configuration
+        ),
+        metadata=proto_utils.ToProto.metadata(req_v03.params.metadata),
+    )
+
+    core = proto_conversions.to_core_send_message_request(compat)
+    assert core == conversions.to_core_send_message_request(
+        types_v03.SendMessageRequest(
+            id=0, params=proto_utils.FromProto.message_send_params(compat)
+        )
+    )
+
+
+def test_unset_blocking_is_forwarded_like_the_sdk() -> None:
+    compat = proto_conversions.to_compat_send_message_request(
+        a2a_pb2.SendMessageRequest(message=make_message(a2a_pb2.ROLE_USER))
+    )
+    assert compat.HasField("configuration")
+
+    core = proto_conversions.to_core_send_message_request(
+        a2a_v0_3_pb2.SendMessageRequest(request=compat.request)
+    )
+    assert core.configuration.return_immediately
+    assert core.configuration.HasField("history_length")
+
+
+def test_stream_events_match_sdk_conversion() -> None:
+    events: list[Event] = [
+        make_message(),
+        make_task(),
+        a2a_pb2.TaskStatusUpdateEvent(
+            task_id="t-1",
+            context_id="c-1",
+            status=a2a_pb2.TaskStatus(state=a2a_pb2.TASK_STATE_CANCELED),
+        ),
+        a2a_pb2.TaskArtifactUpdateEvent(
+            task_id="t-1",
+            context_id="c-1",
+            artifact=a2a_pb2.Artifact(
+                artifact_id="a-1", parts=[a2a_pb2.Part(text="chunk")]
+            ),
+            append=True,
+            last_chunk=True,
+        ),
+    ]
+    for event in events:
+        compat = proto_conversions.to_compat_stream_response(event)
+        core_response = a2a_pb2.StreamResponse()
+        field = {
+            a2a_pb2.Message: "message",
+            a2a_pb2.Task: "task",
+            a2a_pb2.TaskStatusUpdateEvent: "status_update",
+            a2a_pb2.TaskArtifactUpdateEvent: "artifact_update",
+        }[type(event)]
+        getattr(core_response, field).CopyFrom(event)
+        assert compat == proto_utils.ToProto.stream_response(
+            conversions.to_compat_stream_response(core_response).result
+        )
+        assert proto_conversions.to_core_stream_response(compat) == core_response
+
+    status = proto_conversions.to_compat_stream_response(events[2])
+    assert status.status_update.final
+
+
+def test_task_names_are_parsed() -> None:
+    request = proto_conversions.to_core_get_task_request(
+        a2a_v0_3_pb2.GetTaskRequest(name="tasks/t-1", history_length=3)
+    )
+    assert request == a2a_pb2.GetTaskRequest(id="t-1", history_length=3)
+    assert not proto_conversions.to_core_get_task_request(
+        a2a_v0_3_pb2.GetTaskRequest(name="tasks/t-1")
+    ).HasField("history_length")
+    assert (
+        proto_conversions.to_core_cancel_task_request(
+            a2a_v0_3_pb2.CancelTaskRequest(name="tasks/t-2")
+        ).id
+        == "t-2"
+    )
+
+    with pytest.raises(InvalidParamsError):
+        proto_conversions.to_core_subscribe_to_task_request(
+            a2a_v0_3_pb2.TaskSubscriptionRequest(name="t-3")
+        )
@@ -0,0 +1,390 @@
+# Copyright AGNTCY Contributors (https://github.com/agntcy)
+# SPDX-License-Identifier: Apache-2.0
+
+import asyncio
+from collections.abc import AsyncGenerator
+from typing import cast
+
+import pytest
+import slim_bindings
+from a2a.client.client import ClientCallContext
+from a2a.server.context import ServerCallContext
+from a2a.server.events import Event
+from a2a.server.request_handlers.request_handler import RequestHandler
+from a2a.types import a2a_pb2
+from a2a.utils.errors import UnsupportedOperationError
+from google.rpc import code_pb2
+
+from slima2a.broadcast import SubscriptionHub
+from slima2a.client_transport import SRPCTransport
+from slima2a.coalescing import ArtifactUpdateCoalescer
+from slima2a.handler import SlimRPCError, SRPCHandler, add_SRPCHandler_to_server
+from slima2a.loopback import LoopbackServer, loopback_channel_factory
+from slima2a.resume import (
+    RESUME_AFTER_HEADER,
+    SEQUENCE_METADATA_KEY,
+    ReplayBuffer,
+    is_replay_gap,
+)
+
+
+def task(state: a2a_pb2.TaskState) -> a2a_pb2.Task:
+    return a2a_pb2.Task(
+        id="task-1", context_id="c-1", status=a2a_pb2.TaskStatus(state=state)
+    )
+
+
+def update(state: a2a_pb2.TaskState) -> a2a_pb2.TaskStatusUpdateEvent:
+    return a2a_pb2.TaskStatusUpdateEvent(
+        task_id="task-1", context_id="c-1", status=a2a_pb2.TaskStatus(state=state)
+    )
+
+
+def append(text: str, last_chunk: bool = False) -> a2a_pb2.TaskArtifactUpdateEvent:
+    return a2a_pb2.TaskArtifactUpdateEvent(
+        task_id="task-1",
+        context_id="c-1",
+        artifact=a2a_pb2.Artifact(artifact_id="a-1", parts=[a2a_pb2.Part(text=text)]),
+        append=True,
+        last_chunk=last_chunk,
+    )
+
+
+class BrokenStreamRequestHandler:
+    """Drops the first stream, then finishes the task on subscription."""
+
+    def __init__(self, drop: bool = True) -> None:
+        self.drop = drop
+        self.subscriptions = 0
+
+    async def on_message_send_stream(
+        self, params: a2a_pb2.SendMessageRequest, context: ServerCallContext
+    ) -> AsyncGenerator[Event]:
+        yield task(a2a_pb2.TASK_STATE_WORKING)
+        yield update(a2a_pb2.TASK_STATE_WORKING)
+        if self.drop:
+            raise SlimRPCError(
+                code=code_pb2.UNAVAILABLE, message="connection lost", details=None
+            )
+        yield update(a2a_pb2.TASK_STATE_COMPLETED)
+
+    async def on_subscribe_to_task(
+        self, params: a2a_pb2.SubscribeToTaskRequest, context: ServerCallContext
+    ) -> AsyncGenerator[Event]:
+        self.subscriptions += 1
+        if not self.drop:
+            raise UnsupportedOperationError("task is in a terminal state")
+        yield task(a2a_pb2.TASK_STATE_WORKING)
+        yield update(a2a_pb2.TASK_STATE_COMPLETED)
+
+
+class BrokenSubscriptionRequestHandler:
+    """Leaves the task working, then drops the first subscription to it."""
+
+    def __init__(self) -> None:
+        self.subscriptions = 0
+
+    async def on_message_send_stream(
+        self, params: a2a_pb2.SendMessageRequest, context: ServerCallContext
+    ) -> AsyncGenerator[Event]:
+        yield task(a2a_pb2.TASK_STATE_WORKING)
+        yield update(a2a_pb2.TASK_STATE_WORKING)
+
+    async def on_subscribe_to_task(
+        self, params: a2a_pb2.SubscribeToTaskRequest, context: ServerCallContext
+    ) -> AsyncGenerator[Event]:
+        self.subscriptions += 1
+        yield task(a2a_pb2.TASK_STATE_WORKING)
+        if self.subscriptions == 1:
+            yield update(a2a_pb2.TASK_STATE_INPUT_REQUIRED)
+            raise SlimRPCError(
+                code=code_pb2.UNAVAILABLE, message="connection lost", details=None
+            )
+        yield update(a2a_pb2.TASK_STATE_COMPLETED)
+
+
+class LaggingStreamRequestHandler(BrokenStreamRequestHandler):
+    """Drops the first stream after the replay buffer moved past its client."""
+
+    def __init__(self, replay_buffer: ReplayBuffer) -> None:
+        super().__init__()
+        self.replay_buffer = replay_buffer
+
+    async def on_message_send_stream(
+        self, params: a2a_pb2.SendMessageRequest, context: ServerCallContext
+    ) -> AsyncGenerator[Event]:
+        yield task(a2a_pb2.TASK_STATE_WORKING)
+        yield update(a2a_pb2.TASK_STATE_WORKING)
+        # Events the client never received push its last one out of the buffer.
+        key = (context.user.user_name, context.tenant, "task-1")
+        for _ in range(self.replay_buffer.max_events + 1):
+            self.replay_buffer.record(
+                key,
+                a2a_pb2.StreamResponse(
+                    status_update=update(a2a_pb2.TASK_STATE_WORKING)
+                ),
+            )
+        raise SlimRPCError(
+            code=code_pb2.UNAVAILABLE, message="connection lost", details=None
+        )
+
+
+class ChunkedArtifactRequestHandler:
+    """Streams a chunked artifact, handing the same events to every stream."""
+
+    def __init__(self) -> None:
+        self.events: list[Event] = [
+            task(a2a_pb2.TASK_STATE_WORKING),
+            append("a"),
+            append("b"),
+            append("c", last_chunk=True),
+        ]
+
+    async def on_message_send_stream(
+        self, params: a2a_pb2.SendMessageRequest, context: ServerCallContext
+    ) -> AsyncGenerator[Event]:
+        for event in self.events:
+            yield event
+
+    async def on_subscribe_to_task(
+        self, params: a2a_pb2.SubscribeToTaskRequest, context: ServerCallContext
+    ) -> AsyncGenerator[Event]:
+        for event in self.events:
+            yield event
+
+
+def make_transport(
+    request_handler: object,
+    replay_buffer: ReplayBuffer,
+    subscription_hub: SubscriptionHub | None = None,
+    stream_coalescer: ArtifactUpdateCoalescer | None = None,
+) -> SRPCTransport:
+    server = LoopbackServer()
+    add_SRPCHandler_to_server(
+        SRPCHandler(
+            a2a_pb2.AgentCard(
+                name="agent",
+                capabilities=a2a_pb2.AgentCapabilities(streaming=True),
+            ),
+            cast(RequestHandler, request_handler),
+            replay_buffer=replay_buffer,
+            subscription_hub=subscription_hub,
+            stream_coalescer=stream_coalescer,
+        ),
+        server,  # type: ignore[arg-type]
+    )
+    channel = loopback_channel_factory({"agntcy/demo/agent": server})(
+        "agntcy/demo/agent"
+    )
+    return SRPCTransport(channel, None, stream_resume_attempts=1)
+
+
+def describe(response: a2a_pb2.StreamResponse) -> str:
+    which = response.WhichOneof("payload") or ""
+    assert SEQUENCE_METADATA_KEY not in getattr(response, which).metadata
+    if which == "task":
+        return f"task:{a2a_pb2.TaskState.Name(response.task.status.state)}"
+    if which == "artifact_update":
+        parts = response.artifact_update.artifact.parts
+        return "artifact:" + "".join(part.text for part in parts)
+    return f"update:{a2a_pb2.TaskState.Name(response.status_update.status.state)}"
+
+
+def test_broken_stream_is_resumed() -> None:
+    request_handler = BrokenStreamRequestHandler()
+    replay_buffer = ReplayBuffer()
+    transport = make_transport(request_handler, replay_buffer)
+
+    async def stream() -> list[str]:
+        return [
+            describe(response)
+            async for response in transport.send_message_streaming(
+                a2a_pb2.SendMessageRequest(message=a2a_pb2.Message(message_id="m"))
+            )
+        ]
+
+    assert asyncio.run(stream()) == [
+        "task:TASK_STATE_WORKING",
+        "update:TASK_STATE_WORKING",
+        "task:TASK_STATE_WORKING",
+        "update:TASK_STATE_COMPLETED",
+    ]
+    assert request_handler.subscriptions == 1
+    assert replay_buffer.stats.resumed == 1
+    # Events of the resumed stream continue the sequence of the task.
+    assert replay_buffer.stats.recorded == 4
+
+
+def test_finished_task_is_replayed_from_the_buffer() -> None:
+    request_handler = BrokenStreamRequestHandler(drop=False)
+    replay_buffer = ReplayBuffer()
+    transport = make_transport(request_handler, replay_buffer)
+
+    async def scenario() -> list[str]:
+        async for _ in transport.send_message_streaming(
+            a2a_pb2.SendMessageRequest(message=a2a_pb2.Message(message_id="m"))
+        ):
+            pass
+        return [
+            describe(response)
+            async for response in transport.subscribe(
+                a2a_pb2.SubscribeToTaskRequest(id="task-1"),
+                context=ClientCallContext(
+                    service_parameters={RESUME_AFTER_HEADER: "1"}
+                ),
+            )
+        ]
+
+    assert asyncio.run(scenario()) == [
+        "update:TASK_STATE_WORKING",
+        "update:TASK_STATE_COMPLETED",
+    ]
+    # The final event was replayed, the terminal task is not subscribed to.
+    assert request_handler.subscriptions == 0
+    assert replay_buffer.stats.replayed == 2
+
+
+@pytest.mark.parametrize("shared", [False, True])
+def test_broken_subscription_is_resumed(shared: bool) -> None:
+    request_handler = BrokenSubscriptionRequestHandler()
+    replay_buffer = ReplayBuffer()
+    transport = make_transport(
+        request_handler, replay_buffer, SubscriptionHub() if shared else None
+    )
+
+    async def scenario() -> list[str]:
+        async for _ in transport.send_message_streaming(
+            a2a_pb2.SendMessageRequest(message=a2a_pb2.Message(message_id="m"))
+        ):
+            pass
+        return [
+            describe(response)
+            async for response in transport.subscribe(
+                a2a_pb2.SubscribeToTaskRequest(id="task-1")
+            )
+        ]
+
+    # The events of the message stream are not replayed to the subscriber.
+    assert asyncio.run(scenario()) == [
+        "task:TASK_STATE_WORKING",
+        "update:TASK_STATE_INPUT_REQUIRED",
+        "task:TASK_STATE_WORKING",
+        "update:TASK_STATE_COMPLETED",
+    ]
+    assert request_handler.subscriptions == 2
+    assert replay_buffer.stats.replayed == 0
+
+
+def test_resume_past_the_buffer_starts_over_from_the_task() -> None:
+    replay_buffer = ReplayBuffer(max_events=2)
+    request_handler = LaggingStreamRequestHandler(replay_buffer)
+    transport = make_transport(request_handler, replay_buffer)
+
+    async def stream() -> list[str]:
+        return [
+            describe(response)
+            async for response in transport.send_message_streaming(
+                a2a_pb2.SendMessageRequest(message=a2a_pb2.Message(message_id="m"))
+            )
+        ]
+
+    # The dropped events are not silently skipped: the task is subscribed
+    # to afresh and its stream starts over from the task.
+    assert asyncio.run(stream()) == [
+        "task:TASK_STATE_WORKING",
+        "update:TASK_STATE_WORKING",
+        "task:TASK_STATE_WORKING",
+        "update:TASK_STATE_COMPLETED",
+    ]
+    assert request_handler.subscriptions == 1
+    assert replay_buffer.stats.gaps == 1
+
+
+def test_resume_past_the_buffer_is_refused() -> None:
+    replay_buffer = ReplayBuffer(max_events=1)
+    transport = make_transport(BrokenStreamRequestHandler(drop=False), replay_buffer)
+
+    async def scenario() -> None:
+        async for _ in transport.send_message_streaming(
+            a2a_pb2.SendMessageRequest(message=a2a_pb2.Message(message_id="m"))
+        ):
+            pass
+        async for _ in transport.subscribe(
+            a2a_pb2.SubscribeToTaskRequest(id="task-1"),
+            context=ClientCallContext(service_parameters={RESUME_AFTER_HEADER: "1"}),
+        ):
+            pass
+
+    with pytest.raises(slim_bindings.RpcError) as excinfo:
+        asyncio.run(scenario())
+    assert is_replay_gap(excinfo.value)
+
+
+def test_coalesced_events_are_resumed_without_duplicates() -> None:
+    replay_buffer = ReplayBuffer()
+    transport = make_transport(
+        ChunkedArtifactRequestHandler(),
+        replay_buffer,
+        stream_coalescer=ArtifactUpdateCoalescer(max_delay=1.0),
+    )
+
+    async def scenario() -> tuple[list[str], list[str]]:
+        streamed = [
+            describe(response)
+            async for response in transport.send_message_streaming(
+                a2a_pb2.SendMessageRequest(message=a2a_pb2.Message(message_id="m"))
+            )
+        ]
+        resumed = [
+            describe(response)
+            async for response in transport.subscribe(
+                a2a_pb2.SubscribeToTaskRequest(id="task-1"),
+                context=ClientCallContext(
+                    service_parameters={RESUME_AFTER_HEADER: "1"}
+                ),
+            )
+        ]
+        return streamed, resumed
+
+    streamed, resumed = asyncio.run(scenario())
+    assert streamed == ["task:TASK_STATE_WORKING", "artifact:abc"]
+    # Each chunk is numbered once, before coalescing. The replayed chunks
+    # cover the merged update the live subscription sends again, which the
+    # client drops by its number.
+    assert resumed == ["artifact:a", "artifact:b", "artifact:c"]
+    assert replay_buffer.stats.recorded == 4
+
+
+def test_event_seen_by_several_streams_keeps_its_number() -> None:
+    replay_buffer = ReplayBuffer()
+    event = update(a2a_pb2.TASK_STATE_WORKING)
+    first = replay_buffer.record(
+        "task-1", a2a_pb2.StreamResponse(status_update=event), event
+    )
+    second = replay_buffer.record(
+        "task-1", a2a_pb2.StreamResponse(status_update=event), event
+    )
+    assert first == second == 1
+    assert len(replay_buffer.replay("task-1", 0)) == 1
+
+
+def test_replay_buffer_is_bounded() -> None:
+    replay_buffer = ReplayBuffer(max_events=2, max_tasks=1)
+    for _ in range(3):
+        replay_buffer.record(
+            "task-1", a2a_pb2.StreamResponse(task=task(a2a_pb2.TASK_STATE_WORKING))
+        )
+    assert len(replay_buffer.replay("task-1", 1)) == 2
+    with pytest.raises(slim_bindings.RpcError) as excinfo:
+        replay_buffer.replay("task-1", 0)
+    assert is_replay_gap(excinfo.value)
+    assert replay_buffer.stats.gaps == 1
+
+    replay_buffer.record(
+        "task-2", a2a_pb2.StreamResponse(task=task(a2a_pb2.TASK_STATE_WORKING))
+    )
+    assert len(replay_buffer) == 1
+    assert replay_buffer.replay("task-1", 0) == []
+    # A dropped task cannot replay the events after a number it handed out.
+    with pytest.raises(slim_bindings.RpcError):
+        replay_buffer.replay("task-1", 3)
@@ -0,0 +1,52 @@
+# Copyright AGNTCY Contributors (https://github.com/agntcy)
+# SPDX-License-Identifier: Apache-2.0
+
+import asyncio
+
+import pytest
+
+from slima2a.single_flight import SingleFlight
+
+
+def test_single_flight_shares_results_and_errors() -> None:
+    async def scenario() -> None:
+        flight: SingleFlight[int] = SingleFlight()
+        calls: list[str] = []
+
+        async def compute() -> int:
+            calls.append("compute")
+            await asyncio.sleep(0.01)
+            return 42
+
+        async def fail() -> int:
+            await asyncio.sleep(0.01)
+            raise ValueError("boom")
+
+        results = await asyncio.gather(*(flight.do("a", compute) for _ in range(5)))
+        assert results == [42] * 5
+        assert calls == ["compute"]
+        assert flight.shared_calls == 4
+        assert len(flight) == 0
+
+        with pytest.raises(ValueError):
+            await asyncio.gather(flight.do("b", fail), flight.do("b", fail))
+
+    asyncio.run(scenario())
+
+
+def test_single_flight_survives_leader_cancellation() -> None:
+    async def scenario() -> None:
+        flight: SingleFlight[int] = SingleFlight()
+
+        async def compute() -> int:
+            await asyncio.sleep(0.02)
+            return 7
+
+        leader = asyncio.create_task(flight.do("a", compute))
+        await asyncio.sleep(0)
+        follower = asyncio.create_task(flight.do("a", compute))
+        await asyncio.sleep(0)
+        leader.cancel()
+        assert await follower == 7
+
+    asyncio.run(scenario())
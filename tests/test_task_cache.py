@@ -0,0 +1,207 @@
+# Copyright AGNTCY Contributors (https://github.com/agntcy)
+# SPDX-License-Identifier: Apache-2.0
+
+import asyncio
+from datetime import timedelta
+from typing import cast
+
+import pytest
+import slim_bindings
+from a2a.auth.user import UnauthenticatedUser
+from a2a.client.client import ClientCallContext
+from a2a.server.context import ServerCallContext
+from a2a.server.request_handlers import DefaultRequestHandler
+from a2a.server.tasks import InMemoryTaskStore
+from a2a.types.a2a_pb2 import (
+    AgentCard,
+    GetTaskRequest,
+    Part,
+    Task,
+    TaskState,
+    TaskStatus,
+)
+
+from slima2a.client_transport import SRPCTransport
+from slima2a.handler import SRPCHandler, add_SRPCHandler_to_server
+from slima2a.loopback import LoopbackServer, loopback_channel_factory
+from slima2a.task_cache import AgentTaskCache, SerializedTaskCache
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TaskChannel:
+    def __init__(self) -> None:
+        self.calls = 0
+        self.state = TaskState.TASK_STATE_WORKING
+
+    async def call_unary_async(
+        self,
+        service_name: str,
+        method_name: str,
+        request: bytes,
+        timeout: timedelta | None,
+        metadata: dict[str, str] | None,
+    ) -> bytes:
+        self.calls += 1
+        await asyncio.sleep(0.01)
+        task_id = GetTaskRequest.FromString(request).id
+        return Task(id=task_id, status=TaskStatus(state=self.state)).SerializeToString()
+
+
+def make_transport(
+    channel: TaskChannel, task_cache: AgentTaskCache | None
+) -> SRPCTransport:
+    return SRPCTransport(
+        cast(slim_bindings.Channel, channel),
+        None,
+        url="agntcy/demo/agent",
+        task_cache=task_cache,
+    )
+
+
+async def poll(
+    transport: SRPCTransport,
+    task_id: str,
+    n: int,
+    context: ClientCallContext | None = None,
+) -> list[Task]:
+    return list(
+        await asyncio.gather(
+            *(
+                transport.get_task(GetTaskRequest(id=task_id), context=context)
+                for _ in range(n)
+            )
+        )
+    )
+
+
+def test_concurrent_get_task_calls_share_one_rpc() -> None:
+    channel = TaskChannel()
+    task_cache = AgentTaskCache()
+    transport = make_transport(channel, task_cache)
+
+    tasks = asyncio.run(poll(transport, "t-1", 5))
+    assert channel.calls == 1
+    assert [task.id for task in tasks] == ["t-1"] * 5
+    # Every caller gets its own copy.
+    assert len({id(task) for task in tasks}) == 5
+    assert task_cache.stats.misses == 5
+    assert task_cache.stats.fetches == 1
+
+    # Working tasks are not cached, and other tasks are fetched on their own.
+    asyncio.run(poll(transport, "t-1", 1))
+    asyncio.run(poll(transport, "t-2", 1))
+    assert channel.calls == 3
+
+    # Callers with other metadata do not share results.
+    async def mixed() -> None:
+        await asyncio.gather(
+            poll(transport, "t-1", 2),
+            poll(transport, "t-1", 2, ClientCallContext(service_parameters={"a": "b"})),
+        )
+
+    asyncio.run(mixed())
+    assert channel.calls == 5
+
+    # Without a cache every call is sent.
+    uncached = TaskChannel()
+    asyncio.run(poll(make_transport(uncached, None), "t-1", 3))
+    assert uncached.calls == 3
+
+
+def test_terminal_tasks_are_cached_until_ttl() -> None:
+    channel = TaskChannel()
+    clock = FakeClock()
+    task_cache = AgentTaskCache(terminal_ttl=5, clock=clock)
+    transport = make_transport(channel, task_cache)
+
+    asyncio.run(poll(transport, "t-1", 1))
+    asyncio.run(poll(transport, "t-1", 1))
+    assert channel.calls == 2
+    assert len(task_cache) == 0
+
+    channel.state = TaskState.TASK_STATE_COMPLETED
+    asyncio.run(poll(transport, "t-1", 1))
+    (task,) = asyncio.run(poll(transport, "t-1", 1))
+    assert task.status.state == TaskState.TASK_STATE_COMPLETED
+    assert channel.calls == 3
+    assert task_cache.stats.hits == 1
+
+    clock.now = 5
+    asyncio.run(poll(transport, "t-1", 1))
+    assert channel.calls == 4
+
+    assert task_cache.invalidate("agntcy/demo/agent") == 1
+    asyncio.run(poll(transport, "t-1", 1))
+    assert channel.calls == 5
+
+
+class CountingRequestHandler(DefaultRequestHandler):
+    gets = 0
+
+    async def on_get_task(
+        self, params: GetTaskRequest, context: ServerCallContext
+    ) -> Task | None:
+        CountingRequestHandler.gets += 1
+        return await super().on_get_task(params, context)
+
+
+def test_handler_serves_terminal_tasks_from_cache() -> None:
+    task_store = InMemoryTaskStore()
+    owner = ServerCallContext(user=UnauthenticatedUser())
+    for task_id, state in [
+        ("done", TaskState.TASK_STATE_COMPLETED),
+        ("busy", TaskState.TASK_STATE_WORKING),
+    ]:
+        task = Task(id=task_id, context_id="c-1", status=TaskStatus(state=state))
+        task.history.add(message_id=f"{task_id}-1", parts=[Part(text="x" * 100)])
+        asyncio.run(task_store.save(task, owner))
+
+    task_cache = SerializedTaskCache(max_bytes=1024)
+    server = LoopbackServer()
+    add_SRPCHandler_to_server(
+        SRPCHandler(
+            AgentCard(name="agent"),
+            CountingRequestHandler(None, task_store),  # type: ignore[arg-type]
+            task_cache=task_cache,
+        ),
+        server,  # type: ignore[arg-type]
+    )
+    transport = SRPCTransport(
+        loopback_channel_factory({"agntcy/demo/agent": server})("agntcy/demo/agent"),
+        None,
+    )
+
+    async def get(task_id: str, history_length: int | None = None) -> Task:
+        request = GetTaskRequest(id=task_id)
+        if history_length is not None:
+            request.history_length = history_length
+        return await transport.get_task(request)
+
+    CountingRequestHandler.gets = 0
+    assert asyncio.run(get("done")).history[0].message_id == "done-1"
+    assert asyncio.run(get("done")).history[0].message_id == "done-1"
+    asyncio.run(get("busy"))
+    asyncio.run(get("busy"))
+    assert len(asyncio.run(get("done", history_length=0)).history) == 0
+    assert CountingRequestHandler.gets == 4
+    assert len(task_cache) == 2
+    assert task_cache.stats.hits == 1
+
+    with pytest.raises(slim_bindings.RpcError):
+        asyncio.run(get("missing"))
+
+    # Responses beyond max_bytes evict the least recently used ones.
+    for i in range(10):
+        asyncio.run(get("done", history_length=i + 1))
+    assert task_cache.size <= 1024
+    assert task_cache.stats.evictions > 0
+    cached = len(task_cache)
+    assert task_cache.invalidate("done") == cached
+    assert task_cache.size == 0
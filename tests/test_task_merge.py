@@ -0,0 +1,142 @@
+# Copyright AGNTCY Contributors (https://github.com/agntcy)
+# SPDX-License-Identifier: Apache-2.0
+
+import asyncio
+
+import pytest
+from a2a.auth.user import UnauthenticatedUser
+from a2a.server.context import ServerCallContext
+from a2a.server.request_handlers import DefaultRequestHandler
+from a2a.server.tasks import InMemoryTaskStore
+from a2a.types import a2a_pb2
+from a2a.utils.errors import InvalidParamsError
+
+from slima2a.client_transport import ClientConfig, MulticastClient
+from slima2a.handler import SRPCHandler, add_SRPCHandler_to_server
+from slima2a.loopback import (
+    LoopbackServer,
+    loopback_channel_factory,
+    loopback_group_channel_factory,
+)
+from slima2a.task_merge import merge_list_tasks, status_timestamp_key
+
+AGENTS = ["agntcy/demo/agent1", "agntcy/demo/agent2", "agntcy/demo/agent3"]
+
+
+def make_task(agent: int, i: int) -> a2a_pb2.Task:
+    task = a2a_pb2.Task(
+        id=f"t-{agent}-{i}",
+        context_id="c-1",
+        status=a2a_pb2.TaskStatus(state=a2a_pb2.TASK_STATE_COMPLETED),
+    )
+    # Interleave the agents' tasks in time.
+    task.status.timestamp.FromSeconds(1_700_000_000 + i * len(AGENTS) + agent)
+    return task
+
+
+def member_tasks(counts: list[int]) -> dict[str, list[a2a_pb2.Task]]:
+    return {
+        name: sorted(
+            (make_task(agent, i) for i in range(count)),
+            key=status_timestamp_key,
+            reverse=True,
+        )
+        for agent, (name, count) in enumerate(zip(AGENTS, counts, strict=True))
+    }
+
+
+def test_merge_pages_through_all_members_lazily() -> None:
+    tasks = member_tasks([7, 0, 3])
+    fetched: list[tuple[str, str]] = []
+    fetches: list[int] = []
+
+    async def fetch(
+        name: str, request: a2a_pb2.ListTasksRequest
+    ) -> a2a_pb2.ListTasksResponse:
+        fetched.append((name, request.page_token))
+        start = int(request.page_token or 0)
+        end = start + request.page_size
+        return a2a_pb2.ListTasksResponse(
+            tasks=tasks[name][start:end],
+            next_page_token=str(end) if end < len(tasks[name]) else "",
+            total_size=len(tasks[name]),
+        )
+
+    async def scenario() -> list[a2a_pb2.ListTasksResponse]:
+        pages = []
+        request = a2a_pb2.ListTasksRequest(page_size=4)
+        while True:
+            page = await merge_list_tasks(AGENTS, request, fetch)
+            pages.append(page)
+            fetches.append(len(fetched))
+            if not page.next_page_token:
+                return pages
+            request.page_token = page.next_page_token
+
+    pages = asyncio.run(scenario())
+    merged = [task.id for page in pages for task in page.tasks]
+    expected = sorted(
+        (task for member in tasks.values() for task in member),
+        key=status_timestamp_key,
+        reverse=True,
+    )
+    assert merged == [task.id for task in expected]
+    assert [len(page.tasks) for page in pages] == [4, 4, 2]
+    assert all(page.total_size == 10 for page in pages)
+    # Page 1 only needs the first page of each member; the second page of
+    # agent1 is fetched once the merge reaches it.
+    assert fetched[: fetches[0]] == [(name, "") for name in AGENTS]
+    assert ("agntcy/demo/agent1", "4") in fetched
+
+    with pytest.raises(InvalidParamsError):
+        asyncio.run(
+            merge_list_tasks(
+                AGENTS, a2a_pb2.ListTasksRequest(page_token="garbage"), fetch
+            )
+        )
+
+
+def test_multicast_client_merged_list_tasks() -> None:
+    tasks = member_tasks([5, 2, 4])
+    servers = {}
+    for url in AGENTS:
+        task_store = InMemoryTaskStore()
+        for task in tasks[url]:
+            asyncio.run(
+                task_store.save(task, ServerCallContext(user=UnauthenticatedUser()))
+            )
+        card = a2a_pb2.AgentCard(
+            name=url,
+            supported_interfaces=[
+                a2a_pb2.AgentInterface(url=url, protocol_binding="slimrpc")
+            ],
+        )
+        server = LoopbackServer()
+        add_SRPCHandler_to_server(
+            SRPCHandler(card, DefaultRequestHandler(None, task_store)),  # type: ignore[arg-type]
+            server,  # type: ignore[arg-type]
+        )
+        servers[url] = server
+    config = ClientConfig(
+        slimrpc_channel_factory=loopback_channel_factory(servers),
+        slimrpc_group_channel_factory=loopback_group_channel_factory(servers),
+    )
+    client = MulticastClient.create(AGENTS, config)
+
+    async def scenario() -> list[str]:
+        ids: list[str] = []
+        request = a2a_pb2.ListTasksRequest(page_size=3)
+        while True:
+            page = await client.merged_list_tasks(request)
+            assert page.total_size == 11
+            ids.extend(task.id for task in page.tasks)
+            if not page.next_page_token:
+                return ids
+            request.page_token = page.next_page_token
+
+    expected = sorted(
+        (task for member in tasks.values() for task in member),
+        key=status_timestamp_key,
+        reverse=True,
+    )
+    assert asyncio.run(scenario()) == [task.id for task in expected]